@@ -0,0 +1,4 @@
+"""Benchmarks for Zigbee Home Automation.
+
+Each module can be run directly, e.g. ``python -m benchmarks.event_emit``.
+"""
@@ -0,0 +1,92 @@
+"""Benchmark the polls per hour of fixed and adaptive polling intervals."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+
+from benchmarks.common import print_table
+from benchmarks.network import DeviceMix, simulated_network
+from zha.application import Platform
+from zha.application.platforms.sensor import PolledElectricalMeasurement
+
+PLUGS = 200
+HOUR = 3_600
+# Share of the plugs powering a load that switches, the others draw a steady power
+VOLATILE_SHARES = (0.0, 0.1, 0.5)
+# Mean seconds between switches of a volatile load
+SWITCH_INTERVAL = 300
+
+
+def _load(rng: random.Random, volatile: bool):
+    """Return the active power drawn over time by a plug."""
+    steady = rng.choice((0, 0, 45, 120))
+    if not volatile:
+        return lambda _: steady
+    switches = []
+    elapsed = 0.0
+    while elapsed < HOUR:
+        elapsed += rng.expovariate(1 / SWITCH_INTERVAL)
+        switches.append((elapsed, rng.randint(50, 2_500)))
+
+    def load(now: float) -> int:
+        power = steady
+        for at, value in switches:
+            if at > now:
+                break
+            power = value
+        # Measurement noise below the adaptive polling threshold
+        return round(power * rng.uniform(0.99, 1.01))
+
+    return load
+
+
+async def _bench(volatile_share: float) -> tuple[str, int, int, float]:
+    """Return the polls per hour of both modes and the mean adaptive interval."""
+    async with simulated_network(DeviceMix(plugs=PLUGS)) as gateway:
+        gateway.config.config.device_options.enable_adaptive_polling = True
+        entities = [
+            entity
+            for device in gateway.devices.values()
+            for entity in device.platform_entities.values()
+            if entity.PLATFORM == Platform.SENSOR
+            and type(entity) is PolledElectricalMeasurement
+        ]
+        rng = random.Random(0)
+        volatile = round(len(entities) * volatile_share)
+        fixed_polls = adaptive_polls = 0
+        intervals: list[float] = []
+        for index, entity in enumerate(entities):
+            load = _load(rng, index < volatile)
+            cluster = entity._cluster_handler.cluster
+            attrid = cluster.attributes_by_name[entity._attribute_name].id
+            fixed_polls += round(HOUR / entity.polling_interval)
+            # Replay an hour of polls, each reading the load at that time
+            now = 0.0
+            while (now := now + entity.polling_interval) < HOUR:
+                cluster.update_attribute(attrid, load(now))
+                entity._adapt_polling_interval()
+                adaptive_polls += 1
+                intervals.append(entity.polling_interval)
+        await gateway.async_block_till_done()
+
+    return (
+        f"{volatile_share:.0%}",
+        fixed_polls,
+        adaptive_polls,
+        sum(intervals) / len(intervals),
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logging.basicConfig(level=logging.WARNING)
+    print_table(
+        ("volatile", "fixed polls/h", "adaptive polls/h", "mean interval s"),
+        [asyncio.run(_bench(share)) for share in VOLATILE_SHARES],
+    )
+
+
+if __name__ == "__main__":
+    main()
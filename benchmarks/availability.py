@@ -0,0 +1,72 @@
+"""Benchmark the availability checking work done per hour."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from benchmarks.common import print_table
+from benchmarks.network import DeviceMix, simulated_network
+from zha.async_ import gather_with_limited_concurrency
+
+DEVICE_COUNTS = (200, 1_000)
+# Mean of the interval the availability sweep used to run at
+SWEEP_INTERVAL = 37.5
+HOUR = 3_600
+
+
+async def _best_time(run) -> float:
+    """Return the best observed duration of awaiting `run()`."""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        await run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def _bench(total: int) -> tuple[int, int, int, float, float]:
+    """Return the checks and milliseconds spent per hour by both strategies."""
+    async with simulated_network(DeviceMix.scaled(total)) as gateway:
+        checker = gateway._device_availability_checker
+        devices = [dev for dev in gateway.devices.values() if not dev.is_coordinator]
+
+        async def sweep() -> None:
+            await gather_with_limited_concurrency(
+                20, *(dev._check_available() for dev in devices)
+            )
+
+        async def check_all() -> None:
+            await checker.check_device_availability(devices)
+
+        sweep_checks = round(len(devices) * HOUR / SWEEP_INTERVAL)
+        sweep_ms = await _best_time(sweep) * HOUR / SWEEP_INTERVAL * 1000
+        # A device seen regularly is only checked when its deadline passes
+        deadline_checks = round(
+            sum(HOUR / dev.consider_unavailable_time for dev in devices)
+        )
+        deadline_ms = (
+            await _best_time(check_all) / len(devices) * deadline_checks * 1000
+        )
+
+    return total, sweep_checks, deadline_checks, sweep_ms, deadline_ms
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logging.basicConfig(level=logging.WARNING)
+    print_table(
+        (
+            "devices",
+            "sweep checks/h",
+            "deadline checks/h",
+            "sweep ms/h",
+            "deadline ms/h",
+        ),
+        [asyncio.run(_bench(total)) for total in DEVICE_COUNTS],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark the overhead of sending cluster commands through a cluster handler."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from zigpy.profiles import zha
+from zigpy.zcl.clusters import general
+
+from benchmarks.common import benchmark_gateway, ops_per_second, print_table
+from tests.common import (
+    SIG_EP_INPUT,
+    SIG_EP_OUTPUT,
+    SIG_EP_PROFILE,
+    SIG_EP_TYPE,
+    create_mock_zigpy_device,
+)
+from zha.zigbee.cluster_handlers import (
+    UNPROXIED_CLUSTER_METHODS,
+    ClusterHandler,
+    retry_request,
+)
+
+ACCESSES = 100_000
+CALLS = 20_000
+
+PLUG = {
+    1: {
+        SIG_EP_INPUT: [general.Basic.cluster_id, general.OnOff.cluster_id],
+        SIG_EP_OUTPUT: [],
+        SIG_EP_TYPE: zha.DeviceType.ON_OFF_PLUG_IN_UNIT,
+        SIG_EP_PROFILE: zha.PROFILE_ID,
+    }
+}
+
+
+def _uncached_command(cluster_handler: ClusterHandler, name: str):
+    """Decorate a cluster command on every access, like before the command cache."""
+    cluster = cluster_handler.cluster
+    if (
+        hasattr(cluster, name)
+        and callable(getattr(cluster, name))
+        and name not in UNPROXIED_CLUSTER_METHODS
+    ):
+        wrapped_command = retry_request(
+            cluster_handler._scheduled_request(getattr(cluster, name))
+        )
+        wrapped_command.__name__ = name
+        return wrapped_command
+    raise AttributeError(name)
+
+
+async def _calls_per_second(get_command) -> float:
+    """Return the rate at which commands can be looked up and awaited."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            await get_command()()
+        best = min(best, time.perf_counter() - start)
+    return CALLS / best
+
+
+async def _bench() -> list[tuple[str, float, float]]:
+    """Return the access and call rates of both dispatch paths."""
+    async with benchmark_gateway() as gateway:
+        zigpy_device = create_mock_zigpy_device(gateway, PLUG, patch_cluster=False)
+        # Send requests through the device instead of a mock per endpoint
+        del zigpy_device.endpoints[1].request
+        device = gateway.get_or_create_device(zigpy_device)
+        on_off = device.endpoints[1].all_cluster_handlers["1:0x0006"]
+
+        return [
+            (
+                "uncached",
+                ops_per_second(lambda: _uncached_command(on_off, "on"), ACCESSES),
+                await _calls_per_second(lambda: _uncached_command(on_off, "on")),
+            ),
+            (
+                "cached",
+                ops_per_second(lambda: on_off.on, ACCESSES),
+                await _calls_per_second(lambda: on_off.on),
+            ),
+        ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logging.basicConfig(level=logging.WARNING)
+    print_table(
+        ("dispatch", "accesses/s", "calls/s"),
+        asyncio.run(_bench()),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Common benchmark helpers."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+import contextlib
+import gc
+import time
+from unittest.mock import patch
+
+from zigpy.application import ControllerApplication
+import zigpy.config
+import zigpy.device
+import zigpy.types
+from zigpy.zcl.clusters.general import Basic, Groups
+from zigpy.zcl.foundation import Status
+import zigpy.zdo.types as zdo_t
+
+from tests.conftest import _FakeApp
+from zha.application.gateway import Gateway
+from zha.application.helpers import CoordinatorConfiguration, ZHAConfiguration, ZHAData
+
+
+def ops_per_second(func: Callable[[], object], number: int, repeat: int = 5) -> float:
+    """Return the best observed rate at which `func` can be called."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return number / best
+
+
+def print_table(headers: Sequence[str], rows: Iterable[Sequence[object]]) -> None:
+    """Print benchmark results as an aligned table."""
+    rows = [[_format(cell) for cell in row] for row in rows]
+    widths = [
+        max(len(header), *(len(row[index]) for row in rows))
+        for index, header in enumerate(headers)
+    ]
+    print("  ".join(h.rjust(w) for h, w in zip(headers, widths)))  # noqa: T201
+    for row in rows:
+        print("  ".join(c.rjust(w) for c, w in zip(row, widths)))  # noqa: T201
+
+
+def _format(cell: object) -> str:
+    if isinstance(cell, float):
+        return f"{cell:,.0f}" if cell >= 100 else f"{cell:,.3f}"
+    return str(cell)
+
+
+def fake_app_config() -> dict:
+    """Return the zigpy config of a fake radio without database or background jobs."""
+    return {
+        zigpy.config.CONF_DATABASE: None,
+        zigpy.config.CONF_DEVICE: {zigpy.config.CONF_DEVICE_PATH: "/dev/null"},
+        zigpy.config.CONF_NWK_BACKUP_ENABLED: False,
+        zigpy.config.CONF_TOPO_SCAN_ENABLED: False,
+        zigpy.config.CONF_OTA: {zigpy.config.CONF_OTA_ENABLED: False},
+    }
+
+
+def add_coordinator(app: ControllerApplication) -> zigpy.device.Device:
+    """Add the coordinator device to a fake radio."""
+    app.state.node_info.nwk = 0x0000
+    app.state.node_info.ieee = zigpy.types.EUI64.convert("00:15:8d:00:02:32:4f:32")
+    coordinator = app.add_device(
+        nwk=app.state.node_info.nwk, ieee=app.state.node_info.ieee
+    )
+    coordinator.node_desc = zdo_t.NodeDescriptor(
+        logical_type=zdo_t.LogicalType.Coordinator
+    )
+    coordinator.manufacturer = "Coordinator Manufacturer"
+    coordinator.model = "Coordinator Model"
+    endpoint = coordinator.add_endpoint(1)
+    endpoint.add_input_cluster(Basic.cluster_id)
+    endpoint.add_input_cluster(Groups.cluster_id)
+    return coordinator
+
+
+def benchmark_zha_data() -> ZHAData:
+    """Return the ZHA configuration of a benchmark gateway."""
+    return ZHAData(
+        config=ZHAConfiguration(
+            coordinator_configuration=CoordinatorConfiguration(
+                radio_type="ezsp", path="/dev/null"
+            )
+        )
+    )
+
+
+@contextlib.asynccontextmanager
+async def benchmark_gateway() -> AsyncIterator[Gateway]:
+    """Start a gateway backed by a fake radio, like the test suite does."""
+    app = _FakeApp(fake_app_config())
+    add_coordinator(app)
+
+    with (
+        patch(
+            "bellows.zigbee.application.ControllerApplication.new",
+            return_value=app,
+        ),
+        patch("zigpy.device.Device.request", return_value=[Status.SUCCESS]),
+    ):
+        gateway = await Gateway.async_from_config(benchmark_zha_data())
+        await gateway.async_initialize()
+        try:
+            yield gateway
+        finally:
+            await gateway.shutdown()
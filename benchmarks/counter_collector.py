@@ -0,0 +1,72 @@
+"""Benchmark a global update of coordinator counter sensors."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+
+import zigpy.state
+
+from benchmarks.common import benchmark_gateway, ops_per_second, print_table
+from zha.application.platforms.sensor import DeviceCounterSensor
+
+GROUPS = 20
+COUNTERS_PER_GROUP = 50
+# Share of the counters that changed since the previous global update
+CHANGED_SHARES = (0.0, 0.05, 0.5)
+
+
+async def _bench(share: float) -> tuple[str, int, float, float, float]:
+    """Return the global updates per second of per sensor and collected updates."""
+    async with benchmark_gateway() as gateway:
+        gateway.config.allow_polling = True
+        counters = gateway.application_controller.state.counters
+        coordinator = gateway.coordinator_zha_device
+        sensors = []
+        for group in range(GROUPS):
+            name = f"radio_{group}"
+            counters[name] = zigpy.state.CounterGroup(name)
+            for counter in range(COUNTERS_PER_GROUP):
+                counters[name][f"counter_{counter}"].increment()
+                sensors.append(
+                    DeviceCounterSensor(
+                        coordinator, "counters", name, f"counter_{counter}"
+                    )
+                )
+        every = [c for group in counters.values() for c in group.counters()]
+        changing = random.Random(0).sample(every, round(len(every) * share))
+
+        def per_sensor() -> None:
+            for counter in changing:
+                counter.increment()
+            for entity in sensors:
+                entity.update()
+
+        collector = gateway.counter_collector
+
+        def collected() -> None:
+            for counter in changing:
+                counter.increment()
+            collector.collect()
+
+        collector.collect()
+        old = ops_per_second(per_sensor, 20)
+        new = ops_per_second(collected, 20)
+        for entity in sensors:
+            await entity.on_remove()
+
+    return f"{share:.0%}", len(sensors), old, new, new / old
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logging.basicConfig(level=logging.WARNING)
+    print_table(
+        ("changed", "sensors", "per sensor/s", "collected/s", "speedup"),
+        [asyncio.run(_bench(share)) for share in CHANGED_SHARES],
+    )
+
+
+if __name__ == "__main__":
+    main()
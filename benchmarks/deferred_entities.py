@@ -0,0 +1,70 @@
+"""Benchmark startup with entities disabled by default created or deferred."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import logging
+import time
+import tracemalloc
+
+from benchmarks.common import benchmark_zha_data, print_table
+from benchmarks.network import DeviceMix, simulated_network
+
+DEVICES = 500
+
+
+async def _bench(defer: bool) -> tuple[str, int, int, int, float, float]:
+    """Return the entities, startup seconds and bytes per device of a network."""
+    mix = DeviceMix.scaled(DEVICES)
+    zha_data = benchmark_zha_data()
+    zha_data.config.device_options.defer_disabled_entities = defer
+
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    async with simulated_network(mix, zha_data) as gateway:
+        elapsed = time.perf_counter() - start
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0]
+        entities = sum(len(d.platform_entities) for d in gateway.devices.values())
+        deferred = sum(len(d.deferred_entities) for d in gateway.devices.values())
+        listeners = len(gateway.global_updater._update_listeners)
+    tracemalloc.stop()
+
+    return (
+        "deferred" if defer else "created",
+        entities,
+        deferred,
+        listeners,
+        elapsed,
+        (used - baseline) / mix.total,
+    )
+
+
+async def _warm_up() -> None:
+    """Start and stop an empty network, warming up imports, quirks and caches."""
+    async with simulated_network(DeviceMix()):
+        pass
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(_warm_up())
+    print_table(
+        (
+            "disabled entities",
+            "entities",
+            "deferred",
+            "updater listeners",
+            "startup s",
+            "bytes/device",
+        ),
+        [asyncio.run(_bench(defer)) for defer in (False, True)],
+    )
+
+
+if __name__ == "__main__":
+    main()
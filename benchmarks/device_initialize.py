@@ -0,0 +1,104 @@
+"""Benchmark cache-only initialization of a large number of devices."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from zigpy.profiles import zha
+from zigpy.zcl.clusters import general, lighting, measurement
+
+from benchmarks.common import benchmark_gateway, print_table
+from tests.common import (
+    SIG_EP_INPUT,
+    SIG_EP_OUTPUT,
+    SIG_EP_PROFILE,
+    SIG_EP_TYPE,
+    create_mock_zigpy_device,
+)
+from zha.application.gateway import Gateway
+
+DEVICES = 1000
+REPEAT = 5
+
+LIGHT = {
+    1: {
+        SIG_EP_INPUT: [
+            general.Basic.cluster_id,
+            general.Identify.cluster_id,
+            general.Groups.cluster_id,
+            general.OnOff.cluster_id,
+            general.LevelControl.cluster_id,
+            lighting.Color.cluster_id,
+        ],
+        SIG_EP_OUTPUT: [general.Ota.cluster_id],
+        SIG_EP_TYPE: zha.DeviceType.COLOR_DIMMABLE_LIGHT,
+        SIG_EP_PROFILE: zha.PROFILE_ID,
+    }
+}
+
+SENSOR = {
+    1: {
+        SIG_EP_INPUT: [
+            general.Basic.cluster_id,
+            general.PowerConfiguration.cluster_id,
+            measurement.TemperatureMeasurement.cluster_id,
+            measurement.RelativeHumidity.cluster_id,
+        ],
+        SIG_EP_OUTPUT: [general.Ota.cluster_id],
+        SIG_EP_TYPE: zha.DeviceType.TEMPERATURE_SENSOR,
+        SIG_EP_PROFILE: zha.PROFILE_ID,
+    }
+}
+
+
+def _add_devices(gateway: Gateway, count: int) -> None:
+    """Add `count` simulated lights and sensors to the gateway."""
+    for index in range(count):
+        zigpy_device = create_mock_zigpy_device(
+            gateway,
+            LIGHT if index % 2 else SENSOR,
+            ieee=f"00:0d:6f:00:{index:08x}",
+            nwk=0x1000 + index,
+            patch_cluster=False,
+        )
+        gateway.application_controller.devices[zigpy_device.ieee] = zigpy_device
+        gateway.get_or_create_device(zigpy_device)
+    gateway.create_platform_entities()
+
+
+async def _bench(count: int) -> tuple[float, float]:
+    """Return the best cache-only initialization time of both paths."""
+    async with benchmark_gateway() as gateway:
+        _add_devices(gateway, count)
+        devices = list(gateway.devices.values())
+
+        async_best = sync_best = float("inf")
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(device.async_initialize(from_cache=True) for device in devices)
+            )
+            async_best = min(async_best, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for device in devices:
+                device.initialize_from_cache()
+            sync_best = min(sync_best, time.perf_counter() - start)
+
+    return async_best, sync_best
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logging.basicConfig(level=logging.WARNING)
+    async_time, sync_time = asyncio.run(_bench(DEVICES))
+    print_table(
+        ("devices", "async_initialize (s)", "initialize_from_cache (s)", "speedup"),
+        [(DEVICES, async_time, sync_time, async_time / sync_time)],
+    )
+
+
+if __name__ == "__main__":
+    main()
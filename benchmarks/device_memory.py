@@ -0,0 +1,68 @@
+"""Benchmark the memory used per device of a simulated network."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import logging
+import tracemalloc
+
+from benchmarks.common import print_table
+from benchmarks.network import DeviceMix, simulated_network
+from zha.application.gateway import Gateway
+from zha.event import EventBase
+
+DEVICES = 500
+
+
+def _event_objects(gateway: Gateway) -> int:
+    """Return the number of event emitting objects owned by the devices."""
+    count = 0
+    for device in gateway.devices.values():
+        count += 1 + len(device.platform_entities)
+        for endpoint in device.endpoints.values():
+            count += sum(
+                isinstance(cluster_handler, EventBase)
+                for cluster_handler in (
+                    *endpoint.all_cluster_handlers.values(),
+                    *endpoint.client_cluster_handlers.values(),
+                )
+            )
+    return count
+
+
+async def _bench(devices: int) -> tuple[int, float]:
+    """Return the number of event objects and the bytes allocated per device."""
+    empty = DeviceMix()
+    mix = DeviceMix.scaled(devices)
+
+    # The first run warms up imports, quirks and caches
+    async with simulated_network(empty):
+        pass
+
+    gc.collect()
+    tracemalloc.start()
+    async with simulated_network(empty):
+        gc.collect()
+        baseline = tracemalloc.get_traced_memory()[0]
+    async with simulated_network(mix) as gateway:
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0]
+        objects = _event_objects(gateway)
+    tracemalloc.stop()
+
+    return objects, (used - baseline) / mix.total
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logging.basicConfig(level=logging.WARNING)
+    objects, per_device = asyncio.run(_bench(DEVICES))
+    print_table(
+        ("devices", "event objects", "bytes/device"),
+        [(DEVICES, objects, per_device)],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Benchmark platform entity registry lookups for the devices in the test data."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import pathlib
+import time
+
+from benchmarks.common import benchmark_gateway, print_table
+from tests.common import zigpy_device_from_json
+from zha.application import Platform
+from zha.application.discovery import PLATFORMS
+from zha.application.registries import PLATFORM_ENTITIES, WEIGHT_ATTR
+from zha.zigbee.cluster_handlers import ClusterHandler
+
+DEVICE_FILES = pathlib.Path(__file__).parent.parent / "tests/data/devices"
+REPEAT = 20
+
+_Lookup = tuple[str, str, list[ClusterHandler], str | None]
+
+
+def _linear_get_entity(
+    platform: Platform,
+    manufacturer: str,
+    model: str,
+    cluster_handlers: list[ClusterHandler],
+    quirk_id: str | None,
+) -> object:
+    """Match against all strict rules, sorting them on every lookup."""
+    matches = PLATFORM_ENTITIES._strict_registry[platform]
+    for match in sorted(matches, key=WEIGHT_ATTR, reverse=True):
+        if match.strict_matched(manufacturer, model, cluster_handlers, quirk_id):
+            return matches[match]
+    return None
+
+
+def _linear_get_multi_entity(
+    registry: dict,
+    manufacturer: str,
+    model: str,
+    cluster_handlers: list[ClusterHandler],
+    quirk_id: str | None,
+) -> list[object]:
+    """Match against all multi entity rules, sorting them on every lookup."""
+    result = []
+    for stop_match_groups in registry.values():
+        for stop_match_grp, matches in stop_match_groups.items():
+            for match in sorted(matches, key=WEIGHT_ATTR, reverse=True):
+                if match.strict_matched(
+                    manufacturer, model, cluster_handlers, quirk_id
+                ):
+                    result.extend(matches[match])
+                    if stop_match_grp:
+                        break
+    return result
+
+
+def _discover_linear(lookups: list[_Lookup]) -> None:
+    """Run the registry lookups of discovery without an index."""
+    for manufacturer, model, cluster_handlers, quirk_id in lookups:
+        for platform in PLATFORMS:
+            _linear_get_entity(
+                platform, manufacturer, model, cluster_handlers, quirk_id
+            )
+        _linear_get_multi_entity(
+            PLATFORM_ENTITIES._multi_entity_registry,
+            manufacturer,
+            model,
+            cluster_handlers,
+            quirk_id,
+        )
+        _linear_get_multi_entity(
+            PLATFORM_ENTITIES._config_diagnostic_entity_registry,
+            manufacturer,
+            model,
+            cluster_handlers,
+            quirk_id,
+        )
+
+
+def _discover_indexed(lookups: list[_Lookup]) -> None:
+    """Run the registry lookups of discovery through the rule index."""
+    for manufacturer, model, cluster_handlers, quirk_id in lookups:
+        for platform in PLATFORMS:
+            PLATFORM_ENTITIES.get_entity(
+                platform, manufacturer, model, cluster_handlers, quirk_id
+            )
+        PLATFORM_ENTITIES.get_multi_entity(
+            manufacturer, model, cluster_handlers, quirk_id
+        )
+        PLATFORM_ENTITIES.get_config_diagnostic_entity(
+            manufacturer, model, cluster_handlers, quirk_id
+        )
+
+
+def _best(func, lookups: list[_Lookup]) -> float:
+    """Return the best time of `REPEAT` runs."""
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(lookups)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def _collect_lookups() -> list[_Lookup]:
+    """Create all test devices and return the lookups discovery makes for them."""
+    lookups: list[_Lookup] = []
+    async with benchmark_gateway() as gateway:
+        for path in sorted(DEVICE_FILES.glob("**/*.json")):
+            zigpy_device = await zigpy_device_from_json(
+                gateway.application_controller, str(path)
+            )
+            device = gateway.get_or_create_device(zigpy_device)
+            lookups.extend(
+                (
+                    device.manufacturer,
+                    device.model,
+                    list(endpoint.all_cluster_handlers.values()),
+                    device.quirk_id,
+                )
+                for endpoint in device.endpoints.values()
+                if endpoint.all_cluster_handlers
+            )
+    return lookups
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logging.basicConfig(level=logging.WARNING)
+    lookups = asyncio.run(_collect_lookups())
+    linear = _best(_discover_linear, lookups)
+    indexed = _best(_discover_indexed, lookups)
+    print_table(
+        ("endpoints", "linear (ms)", "indexed (ms)", "speedup"),
+        [(len(lookups), linear * 1000, indexed * 1000, linear / indexed)],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark attribute report throughput with consumers reading entity state."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from unittest.mock import patch
+
+from benchmarks.common import ops_per_second, print_table
+from benchmarks.network import DeviceMix, ReportInjector, simulated_network
+from zha.application.platforms import PlatformEntity
+from zha.const import STATE_CHANGED
+
+DEVICES = 200
+REPORTS = 20_000
+# State reads made by a consumer for every state change, like a frontend would
+READS_PER_CHANGE = 3
+# Reads of the state of all entities
+READS = 20
+
+
+def _discard(entity: PlatformEntity, snapshot: object) -> None:
+    """Drop a state snapshot instead of storing it."""
+
+
+async def _bench() -> list[tuple[str, float, float]]:
+    """Return the reports and state reads handled per second with and without snapshots."""
+    async with simulated_network(DeviceMix.scaled(DEVICES)) as gateway:
+        for device in gateway.devices.values():
+            for entity in device.platform_entities.values():
+                entity.on_event(
+                    STATE_CHANGED,
+                    lambda _, entity=entity: [
+                        entity.state for _ in range(READS_PER_CHANGE)
+                    ],
+                )
+
+        entities = [
+            entity
+            for device in gateway.devices.values()
+            for entity in device.platform_entities.values()
+        ]
+
+        def read_all() -> None:
+            """Read the state of every entity, like a client fetching all states."""
+            for entity in entities:
+                entity.state  # noqa: B018
+
+        injector = ReportInjector(gateway, rate=0)
+        snapshot = ops_per_second(injector.inject, REPORTS)
+        snapshot_reads = ops_per_second(read_all, READS) * len(entities)
+        # Building the state on every read, as before state snapshots
+        with patch.object(
+            PlatformEntity, "_state_snapshot", property(lambda _: None, _discard)
+        ):
+            rebuilt = ops_per_second(injector.inject, REPORTS)
+            rebuilt_reads = ops_per_second(read_all, READS) * len(entities)
+        await gateway.async_block_till_done()
+
+    return [
+        ("rebuilt on read", rebuilt, rebuilt_reads),
+        ("snapshot", snapshot, snapshot_reads),
+    ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logging.basicConfig(level=logging.WARNING)
+    print_table(("state", "reports/s", "state reads/s"), asyncio.run(_bench()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark `EventBase.emit` with a varying number of listeners."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from benchmarks.common import ops_per_second, print_table
+from zha.event import EventBase
+
+LISTENER_COUNTS = (1, 10, 100)
+EMITS = 20_000
+
+
+class _Emitter(EventBase):
+    """Event emitter used for benchmarking."""
+
+
+def _callback(data: object) -> None:
+    """Do nothing."""
+
+
+async def _async_callback(data: object) -> None:
+    """Do nothing."""
+
+
+async def _bench_async(listeners: int) -> float:
+    """Return emits/sec for async listeners, including running the tasks."""
+    emitter = _Emitter()
+    for _ in range(listeners):
+        emitter.on_event("event", _async_callback)
+
+    number = max(EMITS // listeners, 100)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for _ in range(number):
+        emitter.emit("event", None)
+        await asyncio.gather(*emitter._event_tasks)
+    return number / (loop.time() - start)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logging.basicConfig(level=logging.INFO)
+    rows = []
+    for listeners in LISTENER_COUNTS:
+        emitter = _Emitter()
+        for _ in range(listeners):
+            emitter.on_event("event", _callback)
+        sync_rate = ops_per_second(lambda e=emitter: e.emit("event", None), EMITS)
+        async_rate = asyncio.run(_bench_async(listeners))
+        rows.append((listeners, sync_rate, async_rate))
+
+    print_table(("listeners", "sync emits/s", "async emits/s"), rows)
+
+
+if __name__ == "__main__":
+    main()
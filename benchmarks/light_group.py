@@ -0,0 +1,73 @@
+"""Benchmark light group updates after a single member changed."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import random
+
+from benchmarks.common import ops_per_second, print_table
+from benchmarks.network import DeviceMix, simulated_network
+from zha.application import Platform
+from zha.application.platforms.light import LightGroup
+from zha.zigbee.group import GroupMemberReference
+
+GROUP_SIZES = (10, 100, 250)
+UPDATES = 2_000
+
+
+async def _bench(members: int) -> tuple[float, float]:
+    """Return the full and incremental group updates per second."""
+    async with simulated_network(DeviceMix(bulbs=members)) as gateway:
+        group = await gateway.async_create_zigpy_group(
+            "Benchmark",
+            [
+                GroupMemberReference(ieee=device.ieee, endpoint_id=1)
+                for device in gateway.devices.values()
+                if not device.is_coordinator
+            ],
+        )
+        assert group is not None
+        group_entity = group.group_entities[f"{Platform.LIGHT}_zha_group_0x0002"]
+        assert isinstance(group_entity, LightGroup)
+        lights = group.get_platform_entities(Platform.LIGHT)
+        assert len(lights) == members
+
+        rng = random.Random(0)
+        next_light = itertools.cycle(lights)
+
+        def change_member() -> str:
+            """Change the brightness of the next member light."""
+            light = next(next_light)
+            light._state = True
+            light._brightness = rng.randint(1, 254)
+            return light.unique_id
+
+        def full_update() -> None:
+            change_member()
+            group_entity.update()
+
+        def incremental_update() -> None:
+            group_entity._changed_members.add(change_member())
+            group_entity.update()
+
+        full = ops_per_second(full_update, UPDATES)
+        incremental = ops_per_second(incremental_update, UPDATES)
+        await gateway.async_block_till_done()
+
+    return full, incremental
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logging.basicConfig(level=logging.WARNING)
+    rows = []
+    for members in GROUP_SIZES:
+        full, incremental = asyncio.run(_bench(members))
+        rows.append((members, full, incremental, incremental / full))
+    print_table(("members", "full updates/s", "incremental updates/s", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
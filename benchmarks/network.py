@@ -0,0 +1,346 @@
+"""Simulated large Zigbee network for scaling benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+import contextlib
+from dataclasses import dataclass
+import itertools
+import random
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from zigpy.profiles import zha
+import zigpy.zcl
+from zigpy.zcl.clusters import (
+    general,
+    homeautomation,
+    hvac,
+    lighting,
+    measurement,
+    smartenergy,
+)
+import zigpy.zcl.foundation as zcl_f
+import zigpy.zdo.types as zdo_t
+
+from benchmarks.common import add_coordinator, benchmark_zha_data, fake_app_config
+from tests.common import (
+    SIG_EP_INPUT,
+    SIG_EP_OUTPUT,
+    SIG_EP_PROFILE,
+    SIG_EP_TYPE,
+    create_mock_zigpy_device,
+    make_attribute,
+    make_zcl_header,
+)
+from tests.conftest import _FakeApp
+from zha.application.const import ZHA_GW_MSG_STARTUP_REPORT
+from zha.application.gateway import Gateway
+from zha.application.helpers import ZHAData
+
+BULB = {
+    1: {
+        SIG_EP_INPUT: [
+            general.Basic.cluster_id,
+            general.Identify.cluster_id,
+            general.Groups.cluster_id,
+            general.Scenes.cluster_id,
+            general.OnOff.cluster_id,
+            general.LevelControl.cluster_id,
+            lighting.Color.cluster_id,
+        ],
+        SIG_EP_OUTPUT: [general.Ota.cluster_id],
+        SIG_EP_TYPE: zha.DeviceType.COLOR_DIMMABLE_LIGHT,
+        SIG_EP_PROFILE: zha.PROFILE_ID,
+    }
+}
+
+PLUG = {
+    1: {
+        SIG_EP_INPUT: [
+            general.Basic.cluster_id,
+            general.Identify.cluster_id,
+            general.Groups.cluster_id,
+            general.OnOff.cluster_id,
+            smartenergy.Metering.cluster_id,
+            homeautomation.ElectricalMeasurement.cluster_id,
+        ],
+        SIG_EP_OUTPUT: [general.Ota.cluster_id],
+        SIG_EP_TYPE: zha.DeviceType.ON_OFF_PLUG_IN_UNIT,
+        SIG_EP_PROFILE: zha.PROFILE_ID,
+    }
+}
+
+SENSOR = {
+    1: {
+        SIG_EP_INPUT: [
+            general.Basic.cluster_id,
+            general.PowerConfiguration.cluster_id,
+            measurement.TemperatureMeasurement.cluster_id,
+            measurement.RelativeHumidity.cluster_id,
+        ],
+        SIG_EP_OUTPUT: [general.Ota.cluster_id],
+        SIG_EP_TYPE: zha.DeviceType.TEMPERATURE_SENSOR,
+        SIG_EP_PROFILE: zha.PROFILE_ID,
+    }
+}
+
+THERMOSTAT = {
+    1: {
+        SIG_EP_INPUT: [
+            general.Basic.cluster_id,
+            general.Identify.cluster_id,
+            hvac.Thermostat.cluster_id,
+            hvac.UserInterface.cluster_id,
+        ],
+        SIG_EP_OUTPUT: [general.Ota.cluster_id],
+        SIG_EP_TYPE: zha.DeviceType.THERMOSTAT,
+        SIG_EP_PROFILE: zha.PROFILE_ID,
+    }
+}
+
+# Attributes reported by the simulated devices and how to generate a new value
+REPORTED_ATTRIBUTES: dict[int, tuple[str, Callable[[random.Random], Any]]] = {
+    general.OnOff.cluster_id: ("on_off", lambda rng: rng.random() < 0.5),
+    general.LevelControl.cluster_id: ("current_level", lambda rng: rng.randint(1, 254)),
+    general.PowerConfiguration.cluster_id: (
+        "battery_percentage_remaining",
+        lambda rng: rng.randint(0, 200),
+    ),
+    smartenergy.Metering.cluster_id: (
+        "instantaneous_demand",
+        lambda rng: rng.randint(0, 3000),
+    ),
+    homeautomation.ElectricalMeasurement.cluster_id: (
+        "active_power",
+        lambda rng: rng.randint(0, 3000),
+    ),
+    measurement.TemperatureMeasurement.cluster_id: (
+        "measured_value",
+        lambda rng: rng.randint(1500, 3000),
+    ),
+    measurement.RelativeHumidity.cluster_id: (
+        "measured_value",
+        lambda rng: rng.randint(2000, 8000),
+    ),
+    hvac.Thermostat.cluster_id: (
+        "local_temperature",
+        lambda rng: rng.randint(1500, 3000),
+    ),
+}
+
+
+async def _request(*args: Any, **kwargs: Any) -> list[zcl_f.Status]:
+    """Acknowledge a request, without recording it like a mock would."""
+    return [zcl_f.Status.SUCCESS]
+
+
+def _node_descriptor(mains_powered: bool) -> zdo_t.NodeDescriptor:
+    """Return the node descriptor of a router or of a sleepy end device."""
+    flags = zdo_t.NodeDescriptor.MACCapabilityFlags.AllocateAddress
+    if mains_powered:
+        flags |= (
+            zdo_t.NodeDescriptor.MACCapabilityFlags.FullFunctionDevice
+            | zdo_t.NodeDescriptor.MACCapabilityFlags.MainsPowered
+            | zdo_t.NodeDescriptor.MACCapabilityFlags.RxOnWhenIdle
+        )
+    return zdo_t.NodeDescriptor(
+        logical_type=(
+            zdo_t.LogicalType.Router if mains_powered else zdo_t.LogicalType.EndDevice
+        ),
+        complex_descriptor_available=0,
+        user_descriptor_available=0,
+        reserved=0,
+        aps_flags=0,
+        frequency_band=zdo_t.NodeDescriptor.FrequencyBand.Freq2400MHz,
+        mac_capability_flags=flags,
+        manufacturer_code=4151,
+        maximum_buffer_size=127,
+        maximum_incoming_transfer_size=100,
+        server_mask=10752,
+        maximum_outgoing_transfer_size=100,
+        descriptor_capability_field=zdo_t.NodeDescriptor.DescriptorCapability.NONE,
+    )
+
+
+@dataclass(frozen=True, kw_only=True)
+class DeviceKind:
+    """A kind of simulated device."""
+
+    model: str
+    endpoints: dict[int, dict[str, Any]]
+    mains_powered: bool
+
+
+DEVICE_KINDS: dict[str, DeviceKind] = {
+    "bulbs": DeviceKind(model="Bulb", endpoints=BULB, mains_powered=True),
+    "plugs": DeviceKind(model="Metering Plug", endpoints=PLUG, mains_powered=True),
+    "sensors": DeviceKind(
+        model="Climate Sensor", endpoints=SENSOR, mains_powered=False
+    ),
+    "thermostats": DeviceKind(
+        model="Thermostat", endpoints=THERMOSTAT, mains_powered=True
+    ),
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class DeviceMix:
+    """Number of simulated devices of each kind."""
+
+    bulbs: int = 0
+    plugs: int = 0
+    sensors: int = 0
+    thermostats: int = 0
+
+    @classmethod
+    def scaled(cls, total: int) -> DeviceMix:
+        """Return a typical home mix of `total` devices."""
+        plugs = total * 25 // 100
+        sensors = total * 30 // 100
+        thermostats = total * 5 // 100
+        return cls(
+            bulbs=total - plugs - sensors - thermostats,
+            plugs=plugs,
+            sensors=sensors,
+            thermostats=thermostats,
+        )
+
+    @property
+    def total(self) -> int:
+        """Return the total number of devices."""
+        return self.bulbs + self.plugs + self.sensors + self.thermostats
+
+
+class SimulatedControllerApplication(_FakeApp):
+    """Fake radio whose database holds a simulated network of devices."""
+
+    device_mix: DeviceMix = DeviceMix()
+
+    async def _load_db(self) -> None:
+        """Populate the network as if it had been loaded from the database."""
+        add_coordinator(self)
+        # The device factory only needs the application controller of a gateway
+        factory_gateway = SimpleNamespace(application_controller=self)
+        index = itertools.count(1)
+        for attr, kind in DEVICE_KINDS.items():
+            for _ in range(getattr(self.device_mix, attr)):
+                number = next(index)
+                device = create_mock_zigpy_device(
+                    factory_gateway,  # type: ignore[arg-type]
+                    kind.endpoints,
+                    ieee=":".join(
+                        f"{byte:02x}"
+                        for byte in (0x000D6F0000000000 + number).to_bytes(8, "big")
+                    ),
+                    manufacturer="Simulated",
+                    model=kind.model,
+                    node_descriptor=_node_descriptor(kind.mains_powered),
+                    nwk=number,
+                    patch_cluster=False,
+                )
+                # Send requests through the device instead of a mock per endpoint
+                for endpoint_id, endpoint in device.endpoints.items():
+                    if endpoint_id:
+                        del endpoint.request
+                self.devices[device.ieee] = device
+
+
+class ReportInjector:
+    """Inject attribute reports from the simulated devices at a steady rate."""
+
+    def __init__(
+        self, gateway: Gateway, rate: float, *, tick: float = 0.01, seed: int = 0
+    ) -> None:
+        """Initialize the report injector."""
+        self._gateway: Gateway = gateway
+        self.rate: float = rate
+        self._tick: float = tick
+        self._random = random.Random(seed)
+        self._task: asyncio.Task | None = None
+        self.reports: int = 0
+        self._targets: list[tuple[zigpy.zcl.Cluster, int, Callable]] = [
+            (cluster, cluster.attributes_by_name[name].id, value)
+            for device in gateway.application_controller.devices.values()
+            for endpoint_id, endpoint in device.endpoints.items()
+            if endpoint_id
+            for cluster_id, cluster in endpoint.in_clusters.items()
+            if cluster_id in REPORTED_ATTRIBUTES
+            for name, value in (REPORTED_ATTRIBUTES[cluster_id],)
+        ]
+        self._random.shuffle(self._targets)
+        self._next_target = itertools.cycle(self._targets)
+
+    def start(self) -> None:
+        """Start injecting reports."""
+        self._task = self._gateway.loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop injecting reports."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def inject(self) -> None:
+        """Inject a single attribute report from the next device."""
+        cluster, attrid, value = next(self._next_target)
+        hdr = make_zcl_header(zcl_f.GeneralCommand.Report_Attributes)
+        hdr.frame_control.disable_default_response = True
+        cluster.handle_message(
+            hdr,
+            zcl_f.GENERAL_COMMANDS[zcl_f.GeneralCommand.Report_Attributes].schema(
+                attribute_reports=[make_attribute(attrid, value(self._random))]
+            ),
+        )
+        self.reports += 1
+
+    async def _run(self) -> None:
+        """Inject reports, catching up after the loop was busy."""
+        if not self._targets or self.rate <= 0:
+            return
+        loop = self._gateway.loop
+        start = loop.time()
+        while True:
+            await asyncio.sleep(self._tick)
+            due = int((loop.time() - start) * self.rate)
+            while self.reports < due:
+                self.inject()
+
+
+@contextlib.asynccontextmanager
+async def simulated_network(
+    mix: DeviceMix, zha_data: ZHAData | None = None
+) -> AsyncIterator[Gateway]:
+    """Start a gateway on a simulated network and wait for its startup to finish."""
+    app_controller_cls = type(
+        "SimulatedControllerApplication",
+        (SimulatedControllerApplication,),
+        {"device_mix": mix},
+    )
+    with (
+        patch.object(
+            Gateway,
+            "get_application_controller_data",
+            return_value=(app_controller_cls, fake_app_config()),
+        ),
+        patch("zigpy.device.Device.request", new=_request),
+    ):
+        gateway = await Gateway.async_from_config(zha_data or benchmark_zha_data())
+        started = gateway.loop.create_future()
+        unsubscribe = gateway.on_event(
+            ZHA_GW_MSG_STARTUP_REPORT,
+            lambda event: started.done() or started.set_result(event.report),
+        )
+        try:
+            await gateway.async_initialize()
+            await gateway.async_initialize_devices_and_entities()
+            await started
+            yield gateway
+        finally:
+            unsubscribe()
+            await gateway.shutdown()
@@ -0,0 +1,76 @@
+"""Benchmark the attribute reads of polls skipped after fresh reports."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from zigpy.zcl.clusters import homeautomation, smartenergy
+import zigpy.zcl.foundation as zcl_f
+
+from benchmarks.common import print_table
+from benchmarks.network import DeviceMix, simulated_network
+from tests.common import make_attribute, make_zcl_header
+
+PLUGS = 500
+# Share of the polled cluster handlers that reported all their attributes
+REPORTING_SHARES = (0.0, 0.5, 0.9, 1.0)
+POLLED_CLUSTERS = (
+    homeautomation.ElectricalMeasurement.cluster_id,
+    smartenergy.Metering.cluster_id,
+)
+
+
+def _report_all(cluster_handler) -> None:
+    """Report every polled attribute of a cluster handler."""
+    cluster = cluster_handler.cluster
+    hdr = make_zcl_header(zcl_f.GeneralCommand.Report_Attributes)
+    hdr.frame_control.disable_default_response = True
+    cluster.handle_message(
+        hdr,
+        zcl_f.GENERAL_COMMANDS[zcl_f.GeneralCommand.Report_Attributes].schema(
+            attribute_reports=[
+                make_attribute(cluster.attributes_by_name[a["attr"]].id, 1)
+                for a in cluster_handler.REPORT_CONFIG
+            ]
+        ),
+    )
+
+
+async def _bench(share: float) -> tuple[str, int, int, int, float]:
+    """Return the polls, attributes read and milliseconds of one poll round."""
+    async with simulated_network(DeviceMix(plugs=PLUGS)) as gateway:
+        handlers = [
+            cluster_handler
+            for device in gateway.devices.values()
+            for endpoint in device.endpoints.values()
+            for cluster_handler in endpoint.all_cluster_handlers.values()
+            if cluster_handler.cluster.cluster_id in POLLED_CLUSTERS
+        ]
+        for cluster_handler in handlers[: round(len(handlers) * share)]:
+            _report_all(cluster_handler)
+        await gateway.async_block_till_done()
+
+        polled = sum(len(h.REPORT_CONFIG) for h in handlers)
+        start = time.perf_counter()
+        await asyncio.gather(*(h.async_update() for h in handlers))
+        elapsed = time.perf_counter() - start
+        avoided = sum(h.attribute_polls_avoided for h in handlers)
+        polls = len(handlers) - sum(h.polls_avoided for h in handlers)
+        await gateway.async_block_till_done()
+
+    return f"{share:.0%}", polls, polled, polled - avoided, elapsed * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logging.basicConfig(level=logging.WARNING)
+    print_table(
+        ("reporting", "polls", "attributes", "attributes read", "ms/round"),
+        [asyncio.run(_bench(share)) for share in REPORTING_SHARES],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Benchmark how ZHA scales with the size of a simulated network.
+
+Every network size runs in a fresh interpreter so that its peak RSS is not
+skewed by the previous runs, e.g.::
+
+    python -m benchmarks.scaling --devices 500 2000 5000 --rate 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import resource
+import subprocess
+import sys
+import time
+
+from benchmarks.common import print_table
+from benchmarks.network import DeviceMix, ReportInjector, simulated_network
+from zha.const import STATE_CHANGED
+
+DEFAULT_DEVICES = (500, 2000, 5000)
+DEFAULT_RATE = 200.0
+DEFAULT_DURATION = 10.0
+
+
+async def _measure(devices: int, rate: float, duration: float) -> dict[str, float]:
+    """Start a simulated network and measure it under a steady report load."""
+    async with simulated_network(DeviceMix.scaled(devices)) as gateway:
+        startup = gateway.startup_report().total
+
+        events = 0
+
+        def state_changed(_: object) -> None:
+            nonlocal events
+            events += 1
+
+        for device in gateway.devices.values():
+            for entity in device.platform_entities.values():
+                entity.on_event(STATE_CHANGED, state_changed)
+
+        injector = ReportInjector(gateway, rate)
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        injector.start()
+        await asyncio.sleep(duration)
+        await injector.stop()
+        cpu, wall = time.process_time() - cpu_start, time.perf_counter() - wall_start
+
+    return {
+        "devices": devices,
+        "startup": startup,
+        # ru_maxrss is reported in kilobytes on Linux
+        "peak_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "cpu": 100 * cpu / wall,
+        "reports": injector.reports / wall,
+        "events": events / wall,
+    }
+
+
+def _run_isolated(devices: int, rate: float, duration: float) -> dict[str, float]:
+    """Measure a network size in a fresh interpreter."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.scaling",
+            "--single",
+            "--devices",
+            str(devices),
+            "--rate",
+            str(rate),
+            "--duration",
+            str(duration),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, nargs="+", default=DEFAULT_DEVICES)
+    parser.add_argument(
+        "--rate", type=float, default=DEFAULT_RATE, help="attribute reports per second"
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=DEFAULT_DURATION,
+        help="seconds of steady state load",
+    )
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.single:
+        print(  # noqa: T201
+            json.dumps(asyncio.run(_measure(args.devices[0], args.rate, args.duration)))
+        )
+        return
+
+    results = [
+        _run_isolated(devices, args.rate, args.duration) for devices in args.devices
+    ]
+    print_table(
+        (
+            "devices",
+            "startup (s)",
+            "peak RSS (MiB)",
+            "steady CPU (%)",
+            "reports/s",
+            "events/s",
+        ),
+        [
+            (
+                int(result["devices"]),
+                result["startup"],
+                result["peak_rss"],
+                result["cpu"],
+                result["reports"],
+                result["events"],
+            )
+            for result in results
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
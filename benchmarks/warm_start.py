@@ -0,0 +1,77 @@
+"""Benchmark device creation with and without a restored discovery snapshot."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import pathlib
+import time
+
+from benchmarks.common import benchmark_gateway, print_table
+from tests.common import zigpy_device_from_json
+from zha.application.discovery import ENDPOINT_PROBE
+from zha.application.gateway import Gateway
+from zha.zigbee.device import Device
+
+DEVICE_FILES = pathlib.Path(__file__).parent.parent / "tests/data/devices"
+REPEAT = 5
+
+
+def _create_devices(gateway: Gateway, zigpy_devices: list, snapshot: dict | None):
+    """Return the best time of creating all devices from a fresh probe."""
+    best = float("inf")
+    for _ in range(REPEAT):
+        ENDPOINT_PROBE.initialize(gateway)
+        if snapshot is not None:
+            ENDPOINT_PROBE.restore(snapshot)
+        gateway.config.platforms.clear()
+        start = time.perf_counter()
+        for zigpy_device in zigpy_devices:
+            Device.new(zigpy_device, gateway)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def _bench() -> tuple[int, int, int, float, float, float]:
+    """Return the cold and warm device creation times."""
+    async with benchmark_gateway() as gateway:
+        zigpy_devices = [
+            await zigpy_device_from_json(gateway.application_controller, str(path))
+            for path in sorted(DEVICE_FILES.glob("**/*.json"))
+        ]
+        cold = _create_devices(gateway, zigpy_devices, None)
+        data = json.dumps(ENDPOINT_PROBE.snapshot(), separators=(",", ":"))
+        snapshot = json.loads(data)
+        warm = _create_devices(gateway, zigpy_devices, snapshot)
+        restored = ENDPOINT_PROBE.restored_plans
+        gateway.config.platforms.clear()
+
+    return (
+        len(zigpy_devices),
+        restored,
+        len(data),
+        cold * 1000,
+        warm * 1000,
+        cold / warm,
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    logging.basicConfig(level=logging.WARNING)
+    print_table(
+        (
+            "devices",
+            "restored plans",
+            "snapshot bytes",
+            "cold ms",
+            "warm ms",
+            "speedup",
+        ),
+        [asyncio.run(_bench())],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Tests for bulk device configuration."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from zigpy.profiles import zha
+from zigpy.zcl.clusters import general, measurement
+import zigpy.zdo.types as zdo_t
+
+from tests.common import (
+    SIG_EP_INPUT,
+    SIG_EP_OUTPUT,
+    SIG_EP_PROFILE,
+    SIG_EP_TYPE,
+    create_mock_zigpy_device,
+    join_zigpy_device,
+)
+from zha.application.const import ZHA_GW_MSG_BULK_CONFIGURATION_PROGRESS
+from zha.application.gateway import Gateway
+from zha.request_scheduler import RequestPriority
+from zha.zigbee.bulk_configuration import (
+    BulkConfiguration,
+    BulkConfigurationProgressEvent,
+)
+from zha.zigbee.device import Device
+
+PLUG = {
+    1: {
+        SIG_EP_INPUT: [general.Basic.cluster_id, general.OnOff.cluster_id],
+        SIG_EP_OUTPUT: [],
+        SIG_EP_TYPE: zha.DeviceType.ON_OFF_PLUG_IN_UNIT,
+        SIG_EP_PROFILE: zha.PROFILE_ID,
+    }
+}
+
+SENSOR = {
+    1: {
+        SIG_EP_INPUT: [
+            general.Basic.cluster_id,
+            general.PowerConfiguration.cluster_id,
+            measurement.TemperatureMeasurement.cluster_id,
+        ],
+        SIG_EP_OUTPUT: [],
+        SIG_EP_TYPE: zha.DeviceType.TEMPERATURE_SENSOR,
+        SIG_EP_PROFILE: zha.PROFILE_ID,
+    }
+}
+
+
+async def _join(
+    zha_gateway: Gateway, endpoints: dict, index: int, *, router: bool = False
+) -> Device:
+    """Join a device, mains powered if it is a router."""
+    zigpy_device = create_mock_zigpy_device(
+        zha_gateway,
+        endpoints,
+        ieee=f"01:2d:6f:00:0a:90:69:{index:02x}",
+        nwk=0x1000 + index,
+    )
+    if router:
+        zigpy_device.node_desc.logical_type = zdo_t.LogicalType.Router
+        zigpy_device.node_desc.mac_capability_flags |= (
+            zdo_t.NodeDescriptor.MACCapabilityFlags.MainsPowered
+        )
+    device = await join_zigpy_device(zha_gateway, zigpy_device)
+    for cluster in zigpy_device.endpoints[1].in_clusters.values():
+        cluster.bind.reset_mock()
+        cluster.configure_reporting_multiple.reset_mock()
+    return device
+
+
+async def test_bulk_configuration(zha_gateway: Gateway) -> None:
+    """Test routers are configured first within the airtime budget."""
+    options = zha_gateway.config.config.bulk_configuration_options
+    options.max_concurrency = 1
+    options.requests_per_second = 2
+
+    sensor = await _join(zha_gateway, SENSOR, 1)
+    router = await _join(zha_gateway, PLUG, 2, router=True)
+    events: list[BulkConfigurationProgressEvent] = []
+    zha_gateway.on_event(ZHA_GW_MSG_BULK_CONFIGURATION_PROGRESS, events.append)
+
+    bound = []
+    for device in (sensor, router):
+        for cluster in device.device.endpoints[1].in_clusters.values():
+            cluster.bind.side_effect = lambda ieee=device.ieee: bound.append(ieee) or [
+                0
+            ]
+
+    stats = zha_gateway.request_scheduler.stats
+    configuration_requests = stats[RequestPriority.CONFIGURATION].requests
+    start = zha_gateway.loop.time()
+    summary = await zha_gateway.async_configure_devices()
+
+    # Binds and reporting configuration are sent with the configuration priority
+    stats = zha_gateway.request_scheduler.stats
+    assert stats[RequestPriority.CONFIGURATION].requests - configuration_requests >= (
+        len(bound)
+    )
+    assert bound[0] == router.ieee
+    assert bound[-1] == sensor.ieee
+    assert [event.device_ieee for event in events] == [router.ieee, sensor.ieee]
+    assert events[-1].devices_done == events[-1].devices_total == 2
+
+    assert summary.devices == summary.configured == 2
+    assert summary.rounds == 1
+    assert summary.retried == 0
+    assert summary.failures == {}
+    assert summary.failed_devices == []
+
+    # Steps after the first burst wait for the budget to refill
+    requests = sum(
+        step.requests
+        for device in (sensor, router)
+        for _, step in device.configuration_steps()
+    )
+    assert zha_gateway.loop.time() - start >= (requests - 2) / 2
+
+
+async def test_bulk_configuration_retries(zha_gateway: Gateway) -> None:
+    """Test failed steps are retried in later rounds and summarized."""
+    options = zha_gateway.config.config.bulk_configuration_options
+    options.retries = 1
+    options.retry_delay = 5
+
+    straggler = await _join(zha_gateway, PLUG, 1)
+    broken = await _join(zha_gateway, PLUG, 2)
+    straggler_on_off = straggler.device.endpoints[1].on_off
+    straggler_on_off.bind.side_effect = [TimeoutError(), [0]]
+    broken_on_off = broken.device.endpoints[1].on_off
+    broken_on_off.configure_reporting_multiple = AsyncMock(side_effect=TimeoutError())
+
+    summary = await zha_gateway.async_configure_devices()
+
+    assert straggler_on_off.bind.await_count == 2
+    assert broken_on_off.configure_reporting_multiple.await_count == 2
+    assert summary.devices == 2
+    assert summary.configured == 1
+    assert summary.rounds == 2
+    assert summary.retried == 2
+    assert summary.failures == {general.OnOff.name: 1}
+    assert summary.failed_devices == [broken.ieee]
+
+
+async def test_bulk_configuration_budget_is_smoothed(zha_gateway: Gateway) -> None:
+    """Test requests wait for their share of the budget, not for whole seconds."""
+    zha_gateway.config.config.bulk_configuration_options.requests_per_second = 5
+    bulk = BulkConfiguration(zha_gateway, [])
+
+    await bulk._spend(5)
+    start = zha_gateway.loop.time()
+    await bulk._spend(1)
+    assert zha_gateway.loop.time() - start == pytest.approx(0.2, abs=0.01)
+
+
+async def test_bulk_configuration_rejects_empty_budget(zha_gateway: Gateway) -> None:
+    """Test bulk configuration does not start without an airtime budget."""
+    options = zha_gateway.config.config.bulk_configuration_options
+    options.requests_per_second = 0
+
+    with pytest.raises(ValueError):
+        await zha_gateway.async_configure_devices()
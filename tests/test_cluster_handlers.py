@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
 from typing import TYPE_CHECKING, Any
@@ -1127,6 +1128,57 @@ async def test_configure_reporting(zha_gateway: Gateway) -> None:
     ]
 
 
+def test_cluster_handler_attribute_plan(zha_gateway: Gateway) -> None:
+    """Test attribute plans are shared by cluster handlers of the same class."""
+
+    zigpy_coordinator_device: ZigpyDevice = zigpy_coordinator_device_mock(zha_gateway)
+    endpoint: Endpoint = endpoint_mock(zigpy_coordinator_device)
+
+    class TestZigbeeClusterHandler(ClusterHandler):
+        """Test cluster handler with init and reported attributes."""
+
+        ZCL_INIT_ATTRS = {"color_capabilities": True, "color_mode": False}
+        REPORT_CONFIG = (
+            AttrReportConfig(attr="current_x", config=(1, 60, 1)),
+            AttrReportConfig(attr=0x0000, config=(1, 60, 2)),
+            AttrReportConfig(attr="color_temperature", config=(1, 60, 3)),
+            AttrReportConfig(attr="current_y", config=(1, 60, 4)),
+        )
+
+    mock_ep = mock.AsyncMock(spec_set=zigpy.endpoint.Endpoint)
+    first = TestZigbeeClusterHandler(
+        zigpy.zcl.clusters.lighting.Color(mock_ep), endpoint
+    )
+    second = TestZigbeeClusterHandler(
+        zigpy.zcl.clusters.lighting.Color(mock_ep), endpoint
+    )
+
+    plan = first.attribute_plan
+    assert second.attribute_plan is plan
+    assert plan.cached_init_attributes == ("color_capabilities",)
+    assert plan.uncached_init_attributes == (
+        "color_mode",
+        "current_x",
+        0x0000,
+        "color_temperature",
+        "current_y",
+    )
+    assert plan.reported_attributes[1] == ("current_hue", 0x0000, (1, 60, 2))
+    assert plan.report_chunks == (
+        {"current_x": (1, 60, 1), 0x0000: (1, 60, 2), "color_temperature": (1, 60, 3)},
+        {"current_y": (1, 60, 4)},
+    )
+    assert not plan.manufacturer_specific
+
+    # A cluster handler overriding its attributes gets a plan of its own
+    second.ZCL_INIT_ATTRS = {"color_mode": True}
+    own = second.attribute_plan
+    assert own is not plan
+    assert own is second.attribute_plan
+    assert own.cached_init_attributes == ("color_mode",)
+    assert first.attribute_plan is plan
+
+
 async def test_invalid_cluster_handler(zha_gateway: Gateway, caplog) -> None:  # pylint: disable=unused-argument
     """Test setting up a cluster handler that fails to match properly."""
 
@@ -1282,6 +1334,37 @@ async def test_retry_request(
     assert str(exc.value) == expected_error
 
 
+async def test_proxied_cluster_commands_cached(zha_gateway: Gateway) -> None:
+    """Test decorated cluster commands are reused until the cluster changes."""
+
+    zigpy_coordinator_device: ZigpyDevice = zigpy_coordinator_device_mock(zha_gateway)
+    endpoint: Endpoint = endpoint_mock(zigpy_coordinator_device)
+
+    mock_ep = mock.AsyncMock(spec_set=zigpy.endpoint.Endpoint)
+    cluster = OnOff(mock_ep)
+    cluster_handler = ClusterHandler(cluster, endpoint)
+
+    command = cluster_handler.on
+    assert command.__name__ == "on"
+    assert cluster_handler.on is command
+    assert cluster_handler.write_attributes is cluster_handler.write_attributes
+    assert "general_command" not in cluster_handler._proxied_commands
+
+    await command()
+    assert mock_ep.request.await_count == 1
+
+    # Patched cluster methods are picked up
+    with patch.object(
+        cluster, "write_attributes", AsyncMock(side_effect=TimeoutError)
+    ) as write_attributes:
+        with pytest.raises(ZHAException):
+            await cluster_handler.write_attributes({"on_time": 1})
+        assert write_attributes.await_count == 3
+
+    with pytest.raises(AttributeError):
+        cluster_handler.no_such_command  # noqa: B018
+
+
 async def test_cluster_handler_naming() -> None:
     """Test that all cluster handlers are named appropriately."""
     for client_cluster_handler in CLIENT_CLUSTER_HANDLER_REGISTRY.values():
@@ -1470,3 +1553,185 @@ async def test_zdo_cluster_handler(zha_gateway: Gateway):
         zha_device.zdo_cluster_handler.unique_id
         == f"{str(zha_device.ieee)}:{zha_device.name}_ZDO"
     )
+
+
+async def test_coalesced_attribute_reads(zha_gateway: Gateway) -> None:
+    """Test concurrent attribute reads are merged into chunked requests."""
+    zigpy_device = create_mock_zigpy_device(
+        zha_gateway,
+        {
+            1: {
+                SIG_EP_INPUT: [Basic.cluster_id],
+                SIG_EP_OUTPUT: [],
+                SIG_EP_TYPE: zigpy.profiles.zha.DeviceType.ON_OFF_SWITCH,
+                SIG_EP_PROFILE: zigpy.profiles.zha.PROFILE_ID,
+            }
+        },
+    )
+    zha_device = await join_zigpy_device(zha_gateway, zigpy_device)
+    basic_ch = zha_device.endpoints[1].all_cluster_handlers["1:0x0000"]
+    basic_cluster = zigpy_device.endpoints[1].basic
+    basic_cluster.PLUGGED_ATTR_READS = {
+        "zcl_version": 1,
+        "app_version": 2,
+        "stack_version": 3,
+        "hw_version": 4,
+        "manufacturer": "Manufacturer",
+        "model": "Model",
+        "date_code": "20240101",
+    }
+    basic_cluster.read_attributes.reset_mock()
+
+    results = await asyncio.gather(
+        basic_ch.get_attribute_value("zcl_version", from_cache=False),
+        basic_ch.get_attributes(
+            ["app_version", "stack_version", "zcl_version"],
+            from_cache=False,
+            only_cache=False,
+        ),
+        basic_ch.get_attributes(
+            ["hw_version", "manufacturer", "model", "date_code"],
+            from_cache=False,
+            only_cache=False,
+        ),
+    )
+
+    assert results == [
+        1,
+        {"app_version": 2, "stack_version": 3, "zcl_version": 1},
+        {
+            "hw_version": 4,
+            "manufacturer": "Manufacturer",
+            "model": "Model",
+            "date_code": "20240101",
+        },
+    ]
+    # Duplicates are only read once and requests are chunked
+    assert basic_cluster.read_attributes.await_count == 2
+    assert basic_cluster.read_attributes.mock_calls == [
+        call(
+            [
+                "zcl_version",
+                "app_version",
+                "stack_version",
+                "hw_version",
+                "manufacturer",
+            ],
+            allow_cache=False,
+            only_cache=False,
+            manufacturer=None,
+        ),
+        call(
+            ["model", "date_code"],
+            allow_cache=False,
+            only_cache=False,
+            manufacturer=None,
+        ),
+    ]
+
+    # Reads issued after the window has passed are sent separately
+    basic_cluster.read_attributes.reset_mock()
+    assert await basic_ch.get_attribute_value("model", from_cache=False) == "Model"
+    assert await basic_ch.get_attribute_value("hw_version", from_cache=False) == 4
+    assert basic_cluster.read_attributes.await_count == 2
+
+
+async def test_coalesced_attribute_read_errors(zha_gateway: Gateway) -> None:
+    """Test read errors are only raised to callers of the failed chunk."""
+    zigpy_device = create_mock_zigpy_device(
+        zha_gateway,
+        {
+            1: {
+                SIG_EP_INPUT: [Basic.cluster_id],
+                SIG_EP_OUTPUT: [],
+                SIG_EP_TYPE: zigpy.profiles.zha.DeviceType.ON_OFF_SWITCH,
+                SIG_EP_PROFILE: zigpy.profiles.zha.PROFILE_ID,
+            }
+        },
+    )
+    zha_device = await join_zigpy_device(zha_gateway, zigpy_device)
+    basic_ch = zha_device.endpoints[1].all_cluster_handlers["1:0x0000"]
+    basic_cluster = zigpy_device.endpoints[1].basic
+
+    async def read_attributes(attributes, **kwargs):
+        if "model" in attributes:
+            raise TimeoutError
+        return {attr: 1 for attr in attributes}, {}
+
+    basic_cluster.read_attributes = AsyncMock(side_effect=read_attributes)
+
+    first = ["zcl_version", "app_version", "stack_version", "hw_version"]
+    results = await asyncio.gather(
+        basic_ch._get_attributes(True, first, from_cache=False, only_cache=False),
+        basic_ch._get_attributes(
+            True, ["manufacturer", "model"], from_cache=False, only_cache=False
+        ),
+        basic_ch.get_attribute_value("model", from_cache=False),
+        return_exceptions=True,
+    )
+
+    assert results[0] == dict.fromkeys(first, 1)
+    assert isinstance(results[1], TimeoutError)
+    assert results[2] is None
+    # Reads that raise errors are not merged with the ones that do not
+    assert basic_cluster.read_attributes.await_count == 3
+    assert not basic_ch._pending_reads
+
+
+async def test_coalesced_attribute_read_stops_on_error(zha_gateway: Gateway) -> None:
+    """Test raising reads stop after the first failed chunk and skip the window."""
+    zigpy_device = create_mock_zigpy_device(
+        zha_gateway,
+        {
+            1: {
+                SIG_EP_INPUT: [Basic.cluster_id],
+                SIG_EP_OUTPUT: [],
+                SIG_EP_TYPE: zigpy.profiles.zha.DeviceType.ON_OFF_SWITCH,
+                SIG_EP_PROFILE: zigpy.profiles.zha.PROFILE_ID,
+            }
+        },
+    )
+    zha_device = await join_zigpy_device(zha_gateway, zigpy_device)
+    basic_ch = zha_device.endpoints[1].all_cluster_handlers["1:0x0000"]
+    basic_cluster = zigpy_device.endpoints[1].basic
+    basic_cluster.read_attributes = AsyncMock(side_effect=TimeoutError)
+    attributes = [
+        "zcl_version",
+        "app_version",
+        "stack_version",
+        "hw_version",
+        "manufacturer",
+        "model",
+        "date_code",
+    ]
+
+    with pytest.raises(TimeoutError):
+        await basic_ch._get_attributes(
+            True, attributes, from_cache=False, only_cache=False
+        )
+    assert basic_cluster.read_attributes.await_count == 1
+
+    # Reads that do not raise still try every chunk
+    basic_cluster.read_attributes.reset_mock()
+    assert (
+        await basic_ch.get_attributes(attributes, from_cache=False, only_cache=False)
+        == {}
+    )
+    assert basic_cluster.read_attributes.await_count == 2
+
+    # Even when they are issued together with a raising read
+    basic_cluster.read_attributes.reset_mock()
+    raising, not_raising = await asyncio.gather(
+        basic_ch._get_attributes(True, attributes, from_cache=False, only_cache=False),
+        basic_ch.get_attributes(attributes, from_cache=False, only_cache=False),
+        return_exceptions=True,
+    )
+    assert isinstance(raising, TimeoutError)
+    assert not_raising == {}
+    assert basic_cluster.read_attributes.await_count == 3
+
+    # A read with nothing else in flight is sent without waiting for the window
+    basic_cluster.read_attributes = AsyncMock(return_value=({"model": "Model"}, {}))
+    start = zha_gateway.loop.time()
+    assert await basic_ch.get_attribute_value("model", from_cache=False) == "Model"
+    assert zha_gateway.loop.time() == start
@@ -12,7 +12,7 @@ import zigpy.profiles.zha
 from zigpy.quirks.registry import DeviceRegistry
 from zigpy.quirks.v2 import DeviceAlertLevel, DeviceAlertMetadata, QuirkBuilder
 import zigpy.types
-from zigpy.zcl.clusters import general
+from zigpy.zcl.clusters import general, smartenergy
 from zigpy.zcl.foundation import Status, WriteAttributesResponse
 import zigpy.zdo.types as zdo_t
 
@@ -37,7 +37,12 @@ from zha.application.gateway import Gateway
 from zha.application.platforms.sensor import LQISensor, RSSISensor
 from zha.application.platforms.switch import Switch
 from zha.exceptions import ZHAException
-from zha.zigbee.device import ClusterBinding, get_device_automation_triggers
+from zha.zigbee.cluster_handlers import ClusterHandlerStatus
+from zha.zigbee.device import (
+    ClusterBinding,
+    DeviceStatus,
+    get_device_automation_triggers,
+)
 from zha.zigbee.group import Group
 
 
@@ -146,7 +151,7 @@ async def test_check_available_success(
 
     # successfully ping zigpy device, but zha_device is not yet available
     await _send_time_changed(
-        zha_gateway, zha_gateway._device_availability_checker.__polling_interval + 1
+        zha_gateway, zha_gateway._device_availability_checker.checkin_interval + 1
     )
     assert basic_ch.read_attributes.await_count == 1
     assert basic_ch.read_attributes.await_args[0][0] == ["manufacturer"]
@@ -159,7 +164,7 @@ async def test_check_available_success(
 
     # There was traffic from the device: pings, but not yet available
     await _send_time_changed(
-        zha_gateway, zha_gateway._device_availability_checker.__polling_interval + 1
+        zha_gateway, zha_gateway._device_availability_checker.checkin_interval + 1
     )
     assert basic_ch.read_attributes.await_count == 2
     assert basic_ch.read_attributes.await_args[0][0] == ["manufacturer"]
@@ -172,7 +177,7 @@ async def test_check_available_success(
 
     # There was traffic from the device: don't try to ping, marked as available
     await _send_time_changed(
-        zha_gateway, zha_gateway._device_availability_checker.__polling_interval + 1
+        zha_gateway, zha_gateway._device_availability_checker.checkin_interval + 1
     )
     assert basic_ch.read_attributes.await_count == 2
     assert basic_ch.read_attributes.await_args[0][0] == ["manufacturer"]
@@ -226,10 +231,9 @@ async def test_check_available_unsuccessful(
     # we want to test the device availability handling alone
     zha_gateway.global_updater.stop()
 
-    # unsuccessfully ping zigpy device, but zha_device is still available
-    await _send_time_changed(
-        zha_gateway, zha_gateway._device_availability_checker.__polling_interval + 1
-    )
+    # unsuccessfully ping zigpy device once its deadline passed, but zha_device is
+    # still available
+    await _send_time_changed(zha_gateway, zha_device.consider_unavailable_time + 1)
 
     assert basic_ch.read_attributes.await_count == 1
     assert basic_ch.read_attributes.await_args[0][0] == ["manufacturer"]
@@ -242,7 +246,7 @@ async def test_check_available_unsuccessful(
 
     # still no traffic, but zha_device is still available
     await _send_time_changed(
-        zha_gateway, zha_gateway._device_availability_checker.__polling_interval + 1
+        zha_gateway, zha_gateway._device_availability_checker.checkin_interval + 1
     )
 
     assert basic_ch.read_attributes.await_count == 2
@@ -256,7 +260,7 @@ async def test_check_available_unsuccessful(
 
     # not even trying to update, device is unavailable
     await _send_time_changed(
-        zha_gateway, zha_gateway._device_availability_checker.__polling_interval + 1
+        zha_gateway, zha_gateway._device_availability_checker.checkin_interval + 1
     )
 
     assert basic_ch.read_attributes.await_count == 2
@@ -294,14 +298,121 @@ async def test_check_available_no_basic_cluster_handler(
     )
 
     assert "does not have a mandatory basic cluster" not in caplog.text
-    await _send_time_changed(
-        zha_gateway, zha_gateway._device_availability_checker.__polling_interval + 1
-    )
+    await _send_time_changed(zha_gateway, zha_device.consider_unavailable_time + 1)
 
     assert zha_device.available is False
     assert "does not have a mandatory basic cluster" in caplog.text
 
 
+@patch(
+    "zha.zigbee.cluster_handlers.general.BasicClusterHandler.async_initialize",
+    new=mock.AsyncMock(),
+)
+async def test_check_available_deadlines(
+    zha_gateway: Gateway,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Check devices are only checked once their availability deadline passed."""
+    zigpy_dev = zigpy_device_mains(zha_gateway, with_basic_cluster_handler=True)
+    zha_device = await join_zigpy_device(zha_gateway, zigpy_dev)
+    checker = zha_gateway._device_availability_checker
+    consider_unavailable_time = zha_device.consider_unavailable_time
+
+    deadline = checker.deadline(zha_device)
+    assert deadline is not None
+    assert 0 < deadline - zha_gateway.loop.time() <= consider_unavailable_time + 1
+    assert checker.deadline(zha_gateway.coordinator_zha_device) is None
+
+    with patch.object(
+        zha_device, "_check_available", wraps=zha_device._check_available
+    ) as check_available:
+        # Nothing is checked before the deadline
+        await _send_time_changed(zha_gateway, consider_unavailable_time / 2)
+        assert check_available.call_count == 0
+
+        # The device was seen since, so it is re-armed at its new deadline
+        zigpy_dev.last_seen = time.time() + consider_unavailable_time / 2
+        await _send_time_changed(zha_gateway, consider_unavailable_time / 2 + 1)
+        assert check_available.call_count == 1
+        assert zha_device.available is True
+        assert checker.deadline(zha_device) == pytest.approx(
+            zha_gateway.loop.time()
+            + zigpy_dev.last_seen
+            + consider_unavailable_time
+            - time.time(),
+            abs=2,
+        )
+
+        # Overdue devices are not checked while polling is not allowed
+        zigpy_dev.last_seen = time.time() - consider_unavailable_time - 1
+        zha_gateway.config.allow_polling = False
+        await _send_time_changed(
+            zha_gateway, checker.deadline(zha_device) - zha_gateway.loop.time() + 1
+        )
+        assert check_available.call_count == 1
+        assert "Device availability check skipped" in caplog.text
+        assert checker.deadline(zha_device) == pytest.approx(
+            zha_gateway.loop.time() + checker.checkin_interval, abs=2
+        )
+
+    zha_gateway.device_removed(zigpy_dev)
+    await zha_gateway.async_block_till_done()
+    assert checker.deadline(zha_device) is None
+
+
+@patch(
+    "zha.zigbee.cluster_handlers.general.BasicClusterHandler.async_initialize",
+    new=mock.AsyncMock(),
+)
+async def test_check_available_device_removed_while_checked(
+    zha_gateway: Gateway,
+) -> None:
+    """Check other devices are still checked when a device is removed mid-check."""
+    removed_dev = zigpy_device_mains(zha_gateway, with_basic_cluster_handler=True)
+    removed = await join_zigpy_device(zha_gateway, removed_dev)
+    other_dev = create_mock_zigpy_device(
+        zha_gateway,
+        {
+            3: {
+                SIG_EP_INPUT: [general.OnOff.cluster_id, general.Basic.cluster_id],
+                SIG_EP_OUTPUT: [],
+                SIG_EP_TYPE: zigpy.profiles.zha.DeviceType.ON_OFF_SWITCH,
+            }
+        },
+        ieee="00:0d:6f:00:0a:90:69:e8",
+        nwk=0x1234,
+    )
+    other = await join_zigpy_device(zha_gateway, other_dev)
+    checker = zha_gateway._device_availability_checker
+
+    removed_dev.last_seen = time.time() - removed.consider_unavailable_time + 10
+    checker.track(removed)
+    assert checker.deadline(removed) < checker.deadline(other)
+
+    release = asyncio.Event()
+
+    async def check_in_flight() -> None:
+        await release.wait()
+
+    with (
+        patch.object(removed, "_check_available", side_effect=check_in_flight),
+        patch.object(
+            other, "_check_available", wraps=other._check_available
+        ) as check_other,
+    ):
+        await asyncio.sleep(11)
+        zha_gateway.device_removed(removed_dev)
+        await zha_gateway.async_block_till_done()
+        release.set()
+        await asyncio.sleep(1)
+
+        assert checker.deadline(removed) is None
+        await _send_time_changed(
+            zha_gateway, checker.deadline(other) - zha_gateway.loop.time() + 1
+        )
+        assert check_other.call_count == 1
+
+
 async def test_device_is_active_coordinator(
     zha_gateway: Gateway,
 ) -> None:
@@ -853,3 +964,40 @@ async def test_quirks_v2_device_alerts(zha_gateway: Gateway) -> None:
     assert zha_device.device_alerts == (
         DeviceAlertMetadata(level=DeviceAlertLevel.WARNING, message="Test warning"),
     )
+
+
+async def test_initialize_from_cache(zha_gateway: Gateway) -> None:
+    """Test cache-only initialization does not await any reads."""
+    zigpy_dev = create_mock_zigpy_device(
+        zha_gateway,
+        {
+            1: {
+                SIG_EP_INPUT: [
+                    general.Basic.cluster_id,
+                    general.OnOff.cluster_id,
+                    smartenergy.Metering.cluster_id,
+                ],
+                SIG_EP_OUTPUT: [general.Ota.cluster_id],
+                SIG_EP_TYPE: zigpy.profiles.zha.DeviceType.SIMPLE_SENSOR,
+            }
+        },
+        attributes={1: {"smartenergy_metering": {"demand_formatting": 0x2B}}},
+    )
+    zha_device = zha_gateway.get_or_create_device(zigpy_dev)
+    cluster_handlers = [
+        *zha_device.endpoints[1].claimed_cluster_handlers.values(),
+        *zha_device.endpoints[1].client_cluster_handlers.values(),
+    ]
+    assert cluster_handlers
+    assert zha_device.status is DeviceStatus.CREATED
+
+    zha_device.initialize_from_cache()
+
+    assert zha_device.status is DeviceStatus.INITIALIZED
+    assert zha_device.zdo_cluster_handler.status is ClusterHandlerStatus.INITIALIZED
+    for cluster_handler in cluster_handlers:
+        assert cluster_handler.status is ClusterHandlerStatus.INITIALIZED
+        assert cluster_handler.cluster.read_attributes.await_count == 0
+
+    metering = zha_device.endpoints[1].all_cluster_handlers["1:0x0702"]
+    assert metering._format_spec == metering.get_formatting(0x2B)
@@ -35,6 +35,7 @@ import zigpy.types
 from zigpy.zcl import ClusterType
 import zigpy.zcl.clusters.closures
 import zigpy.zcl.clusters.general
+import zigpy.zcl.clusters.measurement
 import zigpy.zcl.clusters.security
 import zigpy.zcl.foundation as zcl_f
 
@@ -56,6 +57,7 @@ from zha.application.helpers import DeviceOverridesConfiguration
 from zha.application.platforms import binary_sensor, sensor
 from zha.application.registries import SINGLE_INPUT_CLUSTER_DEVICE_CLASS
 from zha.zigbee.cluster_handlers import ClusterHandler
+from zha.zigbee.device import Device
 from zha.zigbee.endpoint import Endpoint
 
 
@@ -831,3 +833,124 @@ async def test_devices_from_files(
                     tsn=None,
                 )
             ]
+
+
+PLAN_SIGNATURE = {
+    1: {
+        SIG_EP_INPUT: [
+            zigpy.zcl.clusters.general.Basic.cluster_id,
+            zigpy.zcl.clusters.general.PowerConfiguration.cluster_id,
+            zigpy.zcl.clusters.general.OnOff.cluster_id,
+            zigpy.zcl.clusters.measurement.TemperatureMeasurement.cluster_id,
+        ],
+        SIG_EP_OUTPUT: [
+            zigpy.zcl.clusters.general.OnOff.cluster_id,
+            zigpy.zcl.clusters.general.Ota.cluster_id,
+        ],
+        SIG_EP_TYPE: zigpy.profiles.zha.DeviceType.ON_OFF_LIGHT,
+        SIG_EP_PROFILE: zigpy.profiles.zha.PROFILE_ID,
+    }
+}
+
+
+def _discovered_entities(device) -> list[tuple[Platform, str, str, list[str]]]:
+    """Return the entities of a device, independent of its address."""
+    return sorted(
+        (
+            platform,
+            type(entity).__name__,
+            entity.unique_id.removeprefix(str(device.ieee)),
+            [ch.id for ch in entity.cluster_handlers.values()],
+        )
+        for (platform, _), entity in device.platform_entities.items()
+    )
+
+
+async def test_endpoint_discovery_plan_reused(zha_gateway: Gateway) -> None:
+    """Test identical endpoints reuse the discovery plan of the first one."""
+    first = await join_zigpy_device(
+        zha_gateway, create_mock_zigpy_device(zha_gateway, PLAN_SIGNATURE)
+    )
+
+    with mock.patch.object(
+        discovery.PLATFORM_ENTITIES,
+        "get_entity",
+        wraps=discovery.PLATFORM_ENTITIES.get_entity,
+    ) as get_entity_mock:
+        second = await join_zigpy_device(
+            zha_gateway,
+            create_mock_zigpy_device(
+                zha_gateway, PLAN_SIGNATURE, ieee="01:2d:6f:00:0a:90:69:e8", nwk=0x2345
+            ),
+        )
+    assert get_entity_mock.call_count == 0
+
+    assert _discovered_entities(first)
+    assert _discovered_entities(second) == _discovered_entities(first)
+    assert (
+        second.endpoints[1].claimed_cluster_handlers.keys()
+        == first.endpoints[1].claimed_cluster_handlers.keys()
+    )
+    # Handlers created for output clusters are not shared between devices
+    for entity in second.platform_entities.values():
+        for cluster_handler in entity.cluster_handlers.values():
+            assert cluster_handler._endpoint is second.endpoints[1]
+
+    # Registering a new match rule invalidates the plans
+    discovery.PLATFORM_ENTITIES.version += 1
+    with mock.patch.object(
+        discovery.PLATFORM_ENTITIES,
+        "get_entity",
+        wraps=discovery.PLATFORM_ENTITIES.get_entity,
+    ) as get_entity_mock:
+        third = await join_zigpy_device(
+            zha_gateway,
+            create_mock_zigpy_device(
+                zha_gateway, PLAN_SIGNATURE, ieee="02:2d:6f:00:0a:90:69:e8", nwk=0x3456
+            ),
+        )
+    assert get_entity_mock.call_count > 0
+    assert _discovered_entities(third) == _discovered_entities(first)
+
+
+async def test_endpoint_discovery_snapshot(
+    zha_gateway: Gateway, tmp_path: pathlib.Path
+) -> None:
+    """Test discovery plans are restored from the snapshot of a previous start."""
+    path = tmp_path / "discovery.json"
+    zha_gateway.config.config.discovery_snapshot_options.path = str(path)
+    first = await join_zigpy_device(
+        zha_gateway, create_mock_zigpy_device(zha_gateway, PLAN_SIGNATURE)
+    )
+    await zha_gateway._async_save_discovery_snapshot()
+    assert len(json.loads(path.read_text())["plans"]) == 1
+
+    async def join_restored(ieee: str, nwk: int) -> tuple[Device, int]:
+        ENDPOINT_PROBE.initialize(zha_gateway)
+        await zha_gateway._async_restore_discovery_snapshot()
+        with mock.patch.object(
+            discovery.PLATFORM_ENTITIES,
+            "get_entity",
+            wraps=discovery.PLATFORM_ENTITIES.get_entity,
+        ) as get_entity_mock:
+            device = await join_zigpy_device(
+                zha_gateway,
+                create_mock_zigpy_device(
+                    zha_gateway, PLAN_SIGNATURE, ieee=ieee, nwk=nwk
+                ),
+            )
+        return device, get_entity_mock.call_count
+
+    second, lookups = await join_restored("01:2d:6f:00:0a:90:69:e8", 0x2345)
+    assert lookups == 0
+    assert ENDPOINT_PROBE.restored_plans == 1
+    assert _discovered_entities(second) == _discovered_entities(first)
+
+    # Snapshots of other versions fall back to discovery
+    snapshot = json.loads(path.read_text())
+    snapshot["zigpy"] = "0.0.0"
+    path.write_text(json.dumps(snapshot))
+    third, lookups = await join_restored("02:2d:6f:00:0a:90:69:e8", 0x3456)
+    assert lookups > 0
+    assert ENDPOINT_PROBE.restored_plans == 0
+    assert _discovered_entities(third) == _discovered_entities(first)
@@ -31,15 +31,15 @@ def test_event_base_unsubs():
 
     unsub = event.on_event("test", callback)
     assert event._listeners == {
-        "test": [EventListener(callback=callback, with_context=False)]
+        "test": (EventListener(callback=callback, with_context=False),)
     }
     unsub()
-    assert event._listeners == {"test": []}
+    assert event._listeners == {"test": ()}
 
     unsub = event.on_all_events(callback)
-    assert event._global_listeners == [
-        EventListener(callback=callback, with_context=False)
-    ]
+    assert event._global_listeners == (
+        EventListener(callback=callback, with_context=False),
+    )
     unsub()
     assert not event._global_listeners
 
@@ -47,7 +47,7 @@ def test_event_base_unsubs():
     assert "test" in event._listeners
     assert len(event._listeners["test"]) == 1
     unsub()
-    assert event._listeners == {"test": []}
+    assert event._listeners == {"test": ()}
 
 
 def test_event_base_emit():
@@ -78,7 +78,7 @@ def test_event_base_emit():
     unsub()
 
     assert "test" in event._listeners
-    assert event._listeners == {"test": []}
+    assert event._listeners == {"test": ()}
     assert not event._global_listeners
 
 
@@ -113,7 +113,7 @@ def test_event_base_emit_data():
     unsub()
 
     assert "test" in event._listeners
-    assert event._listeners == {"test": []}
+    assert event._listeners == {"test": ()}
     assert not event._global_listeners
 
 
@@ -211,3 +211,103 @@ def test_handle_event_protocol_no_event(caplog: pytest.LogCaptureFixture):
     event_handler.emit("not_test", event)
 
     assert "Received unknown event:" in caplog.text
+
+
+def test_event_listener_classification():
+    """Test listeners are classified as sync or async when they are created."""
+
+    assert not EventListener(callback=MagicMock(), with_context=False).is_coroutine
+    assert EventListener(callback=AsyncMock(), with_context=False).is_coroutine
+
+
+async def test_event_dispatch_cache():
+    """Test the compiled dispatch entries are reused and invalidated on changes."""
+
+    event = EventGenerator()
+    sync_callback = MagicMock()
+    async_callback = AsyncMock()
+
+    unsub_sync = event.on_event("test", sync_callback)
+    unsub_async = event.on_event("test", async_callback)
+    event.emit("test", "data")
+    await asyncio.gather(*event._event_tasks)
+
+    dispatch = event._dispatch["test"]
+    assert dispatch == (
+        (EventListener(callback=sync_callback, with_context=False),),
+        (EventListener(callback=async_callback, with_context=False),),
+    )
+    sync_callback.assert_called_once_with("data")
+    async_callback.assert_awaited_once_with("data")
+
+    # emitting again without any subscription change reuses the same entry
+    event.emit("test", "data")
+    await asyncio.gather(*event._event_tasks)
+    assert event._dispatch["test"] is dispatch
+
+    # global listeners invalidate every entry
+    global_callback = MagicMock()
+    unsub_global = event.on_all_events(global_callback, with_context=True)
+    assert not event._dispatch
+    event.emit("test", "data")
+    await asyncio.gather(*event._event_tasks)
+    global_callback.assert_called_once_with("test", "data")
+    assert len(event._dispatch["test"][0]) == 2
+
+    unsub_global()
+    unsub_async()
+    assert "test" not in event._dispatch
+    event.emit("test", "data")
+    assert event._dispatch["test"] == (
+        (EventListener(callback=sync_callback, with_context=False),),
+        (),
+    )
+    assert async_callback.await_count == 3
+
+    unsub_sync()
+    event.emit("test", "data")
+    assert event._dispatch["test"] == ((), ())
+    assert sync_callback.call_count == 4
+
+
+def test_event_unsubscribe_during_emit():
+    """Test unsubscribing while emitting does not affect the current emit."""
+
+    event = EventGenerator()
+    second_callback = MagicMock()
+    unsubs = []
+
+    def first_callback(data):
+        for unsub in unsubs:
+            unsub()
+
+    unsubs.append(event.on_event("test", first_callback))
+    unsubs.append(event.on_event("test", second_callback))
+
+    event.emit("test", "data")
+    second_callback.assert_called_once_with("data")
+    assert event._listeners == {"test": ()}
+
+    event.emit("test", "data")
+    second_callback.assert_called_once_with("data")
+
+
+async def test_event_containers_allocated_lazily():
+    """Test objects without listeners do not allocate listener containers."""
+
+    event = EventGenerator()
+    other = EventGenerator()
+    event.emit("test", "data")
+    assert vars(event) == {}
+    assert event._listeners is other._listeners
+    assert event._dispatch is other._dispatch
+    assert event._event_tasks is other._event_tasks
+
+    callback = AsyncMock()
+    event.on_event("test", callback)
+    event.emit("test", "data")
+    await asyncio.gather(*event._event_tasks)
+    callback.assert_awaited_once_with("data")
+    assert set(vars(event)) == {"_listeners", "_dispatch", "_event_tasks"}
+    assert vars(other) == {}
+    assert not other._listeners
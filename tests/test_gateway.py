@@ -21,12 +21,14 @@ from tests.common import (
     get_entity,
     get_group_entity,
     join_zigpy_device,
+    send_attributes_report,
 )
 from zha.application import Platform
 from zha.application.const import (
     CONF_USE_THREAD,
     ZHA_GW_MSG,
     ZHA_GW_MSG_CONNECTION_LOST,
+    ZHA_GW_MSG_STARTUP_REPORT,
     RadioType,
 )
 from zha.application.gateway import (
@@ -38,9 +40,11 @@ from zha.application.gateway import (
     RawDeviceInitializedDeviceInfo,
     RawDeviceInitializedEvent,
 )
-from zha.application.helpers import ZHAData
-from zha.application.platforms import GroupEntity
+from zha.application.helpers import StateChangeBatchOptions, ZHAData
+from zha.application.platforms import EntityStateChangedBatchEvent, GroupEntity
 from zha.application.platforms.light.const import EFFECT_OFF, LightEntityFeature
+from zha.application.startup import DeviceStartupStage, StartupPhase, StartupReportEvent
+from zha.const import STATE_CHANGED, STATE_CHANGED_BATCH
 from zha.zigbee.device import Device
 from zha.zigbee.group import Group, GroupMemberReference
 
@@ -246,6 +250,72 @@ async def test_mains_devices_startup_polling_config(
         await zha_gateway.async_block_till_done()
 
 
+async def test_startup_report(
+    zha_data: ZHAData,
+    zigpy_app_controller: ControllerApplication,
+) -> None:
+    """Test the gateway records a startup timing report."""
+
+    with (
+        patch(
+            "bellows.zigbee.application.ControllerApplication.new",
+            return_value=zigpy_app_controller,
+        ),
+        patch(
+            "bellows.zigbee.application.ControllerApplication",
+            return_value=zigpy_app_controller,
+        ),
+    ):
+        zha_gateway = await Gateway.async_from_config(zha_data)
+        events = MagicMock()
+        zha_gateway.on_event(ZHA_GW_MSG_STARTUP_REPORT, events)
+
+        await zha_gateway.async_initialize()
+        await zha_gateway.async_block_till_done()
+
+        report = zha_gateway.startup_report()
+        assert not report.complete
+        assert [timing.phase for timing in report.phases] == [
+            StartupPhase.LOAD_QUIRKS,
+            StartupPhase.RADIO_STARTUP,
+            StartupPhase.LOAD_DEVICES,
+            StartupPhase.CREATE_PLATFORM_ENTITIES,
+            StartupPhase.LOAD_GROUPS,
+        ]
+
+        await zha_gateway.async_initialize_devices_and_entities()
+        await zha_gateway.async_block_till_done(wait_background_tasks=True)
+
+        report = zha_gateway.startup_report(slowest=1)
+        assert report.complete
+        assert {timing.phase for timing in report.phases} == set(StartupPhase)
+        assert all(timing.duration is not None for timing in report.phases)
+        assert report.total >= sum(
+            timing.duration
+            for timing in report.phases
+            if timing.phase is not StartupPhase.CREATE_PLATFORM_ENTITIES
+        )
+        assert report.devices == len(zha_gateway.devices)
+        assert len(report.slowest_devices) == 1
+
+        coordinator = report.slowest_devices[0]
+        assert coordinator.ieee == zha_gateway.coordinator_zha_device.ieee
+        assert set(coordinator.durations) == {
+            DeviceStartupStage.DISCOVERY,
+            DeviceStartupStage.INITIALIZE,
+        }
+
+        assert events.mock_calls == [call(StartupReportEvent(report=report))]
+
+        # Devices joining after startup are not recorded
+        zha_gateway.get_or_create_device(
+            create_mock_zigpy_device(zha_gateway, ZIGPY_DEVICE_BASIC)
+        )
+        assert zha_gateway.startup_report() == report
+
+        await zha_gateway.shutdown()
+
+
 async def test_gateway_group_methods(
     zha_gateway: Gateway,
     caplog: pytest.LogCaptureFixture,
@@ -435,6 +505,36 @@ async def test_remove_device_cleans_up_group_membership(
     assert device_light_1.ieee not in zha_gateway.devices
 
 
+async def test_group_member_entity_index(zha_gateway: Gateway) -> None:
+    """Test the member entities of a group are indexed by platform."""
+    coordinator = await coordinator_mock(zha_gateway)
+    zha_gateway.coordinator_zha_device = coordinator
+    device_light_1 = await device_light_1_mock(zha_gateway)
+    device_light_2 = await device_light_2_mock(zha_gateway)
+
+    zha_group: Group = await zha_gateway.async_create_zigpy_group(
+        "Test Group",
+        [
+            GroupMemberReference(ieee=device_light_1.ieee, endpoint_id=1),
+            GroupMemberReference(ieee=device_light_2.ieee, endpoint_id=1),
+        ],
+    )
+    await zha_gateway.async_block_till_done()
+
+    light_1 = get_entity(device_light_1, platform=Platform.LIGHT)
+    light_2 = get_entity(device_light_2, platform=Platform.LIGHT)
+    lights = zha_group.get_platform_entities(Platform.LIGHT)
+    assert set(lights) == {light_1, light_2}
+    assert zha_group.get_platform_entities(Platform.LIGHT) is lights
+    assert zha_group.get_platform_entities(Platform.COVER) == []
+
+    # Removing a member device updates the index
+    zha_gateway.device_removed(device_light_1.device)
+    await zha_gateway.async_block_till_done()
+    assert zha_group.get_platform_entities(Platform.LIGHT) == [light_2]
+    assert light_1.unique_id not in zha_group._entity_unsubs
+
+
 @patch(
     "zha.application.gateway.Gateway.load_devices",
     MagicMock(),
@@ -700,23 +800,15 @@ async def test_pollers_skip(
     """Test pollers skip when they should."""
 
     assert "Global updater interval skipped" not in caplog.text
-    assert "Device availability checker interval skipped" not in caplog.text
 
     assert zha_gateway.config.allow_polling is True
     zha_gateway.config.allow_polling = False
     assert zha_gateway.config.allow_polling is False
 
-    sleep_time = max(
-        zha_gateway.global_updater.__polling_interval,
-        zha_gateway._device_availability_checker.__polling_interval,
-    )
-    sleep_time += 2
-
-    await asyncio.sleep(sleep_time)
+    await asyncio.sleep(zha_gateway.global_updater.__polling_interval + 2)
     await zha_gateway.async_block_till_done(wait_background_tasks=True)
 
     assert "Global updater interval skipped" in caplog.text
-    assert "Device availability checker interval skipped" in caplog.text
 
 
 async def test_global_updater_guards(
@@ -805,3 +897,94 @@ def test_radio_type():
 
     with pytest.raises(ValueError):
         RadioType.get_by_description("Invalid description")
+
+
+async def test_state_change_batch_disabled(zha_gateway: Gateway) -> None:
+    """Test that no batches are emitted unless batching is enabled."""
+    zha_device = await device_light_1_mock(zha_gateway)
+    entity = get_entity(zha_device, platform=Platform.LIGHT)
+    cluster = zha_device.device.endpoints[1].on_off
+
+    batch_listener = MagicMock()
+    zha_gateway.on_event(STATE_CHANGED_BATCH, batch_listener)
+
+    assert entity.state["on"] is False
+    await send_attributes_report(zha_gateway, cluster, {0x0000: 1})
+    assert entity.state["on"] is True
+    await zha_gateway.async_block_till_done()
+
+    assert batch_listener.call_count == 0
+
+
+async def test_state_change_batch_per_tick(zha_gateway: Gateway) -> None:
+    """Test that state changes are coalesced into one batch per loop iteration."""
+    zha_gateway.config.config.state_change_batch_options = StateChangeBatchOptions(
+        enabled=True
+    )
+    light_1 = await device_light_1_mock(zha_gateway)
+    light_2 = await device_light_2_mock(zha_gateway)
+    entity_1 = get_entity(light_1, platform=Platform.LIGHT)
+    entity_2 = get_entity(light_2, platform=Platform.LIGHT)
+    await zha_gateway.async_block_till_done()
+
+    batch_listener = MagicMock()
+    entity_listener = MagicMock()
+    zha_gateway.on_event(STATE_CHANGED_BATCH, batch_listener)
+    entity_1.on_event(STATE_CHANGED, entity_listener)
+
+    # Several changes to the same entity within a tick are merged
+    on_off_1 = light_1.device.endpoints[1].on_off
+    on_off_1.update_attribute(0x0000, 1)
+    on_off_1.update_attribute(0x0000, 0)
+    on_off_1.update_attribute(0x0000, 1)
+    light_2.device.endpoints[1].on_off.update_attribute(0x0000, 1)
+
+    # Per-entity events are still delivered immediately
+    assert entity_listener.call_count == 3
+    assert batch_listener.call_count == 0
+
+    await asyncio.sleep(0)
+
+    assert batch_listener.call_count == 1
+    event = batch_listener.call_args[0][0]
+    assert isinstance(event, EntityStateChangedBatchEvent)
+    assert event.event == STATE_CHANGED_BATCH
+    assert set(event.changes) == {entity_1.identifiers, entity_2.identifiers}
+    assert event.changes[entity_1.identifiers]["on"] is True
+    assert event.changes[entity_2.identifiers]["on"] is True
+
+    # Nothing pending, nothing emitted
+    zha_gateway.state_change_batcher.flush()
+    assert batch_listener.call_count == 1
+
+
+async def test_state_change_batch_window(zha_gateway: Gateway) -> None:
+    """Test that state changes are collected over the configured window."""
+    zha_gateway.config.config.state_change_batch_options = StateChangeBatchOptions(
+        enabled=True, window=0.5
+    )
+    light_1 = await device_light_1_mock(zha_gateway)
+    entity_1 = get_entity(light_1, platform=Platform.LIGHT)
+    await zha_gateway.async_block_till_done()
+
+    batch_listener = MagicMock()
+    zha_gateway.on_event(STATE_CHANGED_BATCH, batch_listener)
+
+    on_off = light_1.device.endpoints[1].on_off
+    on_off.update_attribute(0x0000, 1)
+    await asyncio.sleep(0.1)
+    on_off.update_attribute(0x0000, 0)
+    await asyncio.sleep(0.1)
+    assert batch_listener.call_count == 0
+
+    await asyncio.sleep(0.5)
+    assert batch_listener.call_count == 1
+    event = batch_listener.call_args[0][0]
+    assert event.changes == {entity_1.identifiers: entity_1.state}
+    assert event.changes[entity_1.identifiers]["on"] is False
+
+    # Pending changes are dropped on shutdown
+    on_off.update_attribute(0x0000, 1)
+    zha_gateway.state_change_batcher.stop()
+    await asyncio.sleep(1)
+    assert batch_listener.call_count == 1
@@ -37,6 +37,7 @@ from zha.application.platforms.light.const import (
     FLASH_SHORT,
     ColorMode,
 )
+from zha.application.platforms.light.helpers import LightStateAggregate
 from zha.zigbee.device import Device
 from zha.zigbee.group import Group, GroupMemberReference
 
@@ -2017,3 +2018,88 @@ async def test_light_state_restoration(zha_gateway: Gateway) -> None:
     assert entity.state["xy_color"] == (1, 2)
     assert entity.state["color_mode"] == ColorMode.XY
     assert entity.state["effect"] == "colorloop"
+
+
+def _aggregate(*states: dict) -> LightStateAggregate:
+    """Return the aggregate of light states."""
+    aggregate = LightStateAggregate()
+    for state in states:
+        aggregate.add(state)
+    return aggregate
+
+
+def _aggregated_values(aggregate: LightStateAggregate) -> tuple:
+    """Return all values of an aggregate, for comparisons."""
+    return (
+        aggregate.on_count,
+        aggregate.brightness,
+        aggregate.color_temp,
+        aggregate.xy_color,
+        aggregate.min_mireds,
+        aggregate.max_mireds,
+        sorted(aggregate.effect_list or []),
+        aggregate.effects,
+        aggregate.supported_color_modes,
+        aggregate.color_modes,
+        aggregate.supported_features,
+    )
+
+
+def test_light_state_aggregate() -> None:
+    """Test member states can be removed from a light group aggregate."""
+    color = {
+        "on": True,
+        "brightness": 100,
+        "xy_color": (0.1, 0.7),
+        "color_mode": ColorMode.XY,
+        "effect": "colorloop",
+        "effect_list": ["off", "colorloop"],
+        "supported_color_modes": {ColorMode.XY, ColorMode.COLOR_TEMP},
+        "supported_features": 0b0100,
+        "min_mireds": 153,
+        "max_mireds": 500,
+    }
+    white = {
+        "on": True,
+        "brightness": 51,
+        "color_temp": 300,
+        "color_mode": ColorMode.COLOR_TEMP,
+        "effect": "off",
+        "effect_list": ["off"],
+        "supported_color_modes": {ColorMode.COLOR_TEMP},
+        "supported_features": 0b0001,
+        "min_mireds": 200,
+        "max_mireds": 454,
+    }
+    off = {
+        "on": False,
+        "brightness": 254,
+        "supported_color_modes": {ColorMode.ONOFF},
+        "supported_features": 0,
+    }
+
+    aggregate = _aggregate(color, white, off)
+    assert aggregate.on_count == 2
+    assert aggregate.brightness == 75
+    assert aggregate.color_temp == 300
+    assert aggregate.xy_color == (0.1, 0.7)
+    assert aggregate.min_mireds == 153
+    assert aggregate.max_mireds == 500
+    assert sorted(aggregate.effect_list) == ["colorloop", "off"]
+    assert aggregate.supported_color_modes == {
+        ColorMode.XY,
+        ColorMode.COLOR_TEMP,
+        ColorMode.ONOFF,
+    }
+    assert aggregate.supported_features == 0b0101
+
+    aggregate.remove(color)
+    assert _aggregated_values(aggregate) == _aggregated_values(_aggregate(white, off))
+    aggregate.remove(white)
+    assert _aggregated_values(aggregate) == _aggregated_values(_aggregate(off))
+    assert aggregate.brightness is None
+    assert aggregate.effect_list is None
+    assert aggregate.min_mireds == 153
+    aggregate.remove(off)
+    assert _aggregated_values(aggregate) == _aggregated_values(_aggregate())
+    assert aggregate.supported_color_modes is None
@@ -0,0 +1,201 @@
+"""Tests for passive liveness inference."""
+
+import time
+
+import pytest
+from zigpy.profiles import zha
+import zigpy.types as t
+from zigpy.zcl.clusters import general
+import zigpy.zdo.types as zdo_t
+
+from tests.common import (
+    SIG_EP_INPUT,
+    SIG_EP_OUTPUT,
+    SIG_EP_PROFILE,
+    SIG_EP_TYPE,
+    create_mock_zigpy_device,
+    join_zigpy_device,
+)
+from zha.application.gateway import Gateway
+from zha.zigbee.device import _CHECKIN_GRACE_PERIODS, _MAX_PING_DEFERRALS, Device
+
+PLUG = {
+    1: {
+        SIG_EP_INPUT: [general.Basic.cluster_id, general.OnOff.cluster_id],
+        SIG_EP_OUTPUT: [],
+        SIG_EP_TYPE: zha.DeviceType.ON_OFF_PLUG_IN_UNIT,
+        SIG_EP_PROFILE: zha.PROFILE_ID,
+    }
+}
+
+
+def _neighbor(
+    device: Device,
+    lqi: int,
+    device_type: zdo_t.Neighbor.DeviceType = zdo_t.Neighbor.DeviceType.Router,
+    relationship: zdo_t.Neighbor.Relationship = zdo_t.Neighbor.Relationship.Sibling,
+) -> zdo_t.Neighbor:
+    """Return a neighbor table entry for a device."""
+    return zdo_t.Neighbor(
+        extended_pan_id=t.ExtendedPanId.convert("aa:bb:cc:dd:ee:ff:00:11"),
+        ieee=device.ieee,
+        nwk=device.nwk,
+        device_type=device_type,
+        rx_on_when_idle=zdo_t.Neighbor.RxOnWhenIdle.On,
+        relationship=relationship,
+        reserved1=0,
+        permit_joining=zdo_t.Neighbor.PermitJoins.Unknown,
+        reserved2=0,
+        depth=1,
+        lqi=lqi,
+    )
+
+
+async def _join_plugs(zha_gateway: Gateway, count: int) -> list[Device]:
+    """Join mains powered plugs."""
+    return [
+        await join_zigpy_device(
+            zha_gateway,
+            create_mock_zigpy_device(
+                zha_gateway,
+                PLUG,
+                ieee=f"01:2d:6f:00:0a:90:69:{index:02x}",
+                nwk=0x1000 + index,
+            ),
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def liveness_gateway(zha_gateway: Gateway) -> Gateway:
+    """Enable liveness inference on the gateway."""
+    zha_gateway.config.config.liveness_options.enabled = True
+    zha_gateway.liveness.start()
+    return zha_gateway
+
+
+async def test_liveness_disabled(zha_gateway: Gateway) -> None:
+    """Test no evidence is collected unless liveness inference is enabled."""
+    router, device = await _join_plugs(zha_gateway, 2)
+    topology = zha_gateway.application_controller.topology
+    topology.listener_event("neighbors_updated", router.ieee, [_neighbor(device, 255)])
+
+    assert not zha_gateway.liveness.enabled
+    assert zha_gateway.liveness.last_evidence(device) is None
+
+
+async def test_liveness_evidence(liveness_gateway: Gateway) -> None:
+    """Test evidence is collected from topology scans and route records."""
+    router, device, weak, relay = await _join_plugs(liveness_gateway, 4)
+    liveness = liveness_gateway.liveness
+    topology = liveness_gateway.application_controller.topology
+
+    neighbors = [_neighbor(device, 200), _neighbor(weak, 10)]
+    topology.listener_event("neighbors_updated", router.ieee, neighbors)
+    assert liveness.last_evidence(router) is not None
+    assert liveness.last_evidence(device) is not None
+    assert liveness.last_evidence(weak) is None
+
+    # A failed scan reports the previous table again
+    seen = liveness.last_evidence(device)
+    topology.listener_event("neighbors_updated", router.ieee, neighbors)
+    assert liveness.last_evidence(device) == seen
+
+    device.device.relays = [relay.nwk, t.NWK(0x9999)]
+    assert liveness.last_evidence(relay) is not None
+
+    liveness_gateway.device_removed(relay.device)
+    await liveness_gateway.async_block_till_done()
+    assert liveness.last_evidence(relay) is None
+    assert liveness.metrics.devices_with_evidence == 2
+
+
+async def test_liveness_ignores_child_entries(liveness_gateway: Gateway) -> None:
+    """Test a dead child still listed by its parent becomes unavailable."""
+    parent, child, router_child = await _join_plugs(liveness_gateway, 3)
+    liveness = liveness_gateway.liveness
+    neighbors = [
+        _neighbor(
+            child,
+            255,
+            zdo_t.Neighbor.DeviceType.EndDevice,
+            zdo_t.Neighbor.Relationship.Child,
+        ),
+        _neighbor(
+            router_child,
+            255,
+            zdo_t.Neighbor.DeviceType.Router,
+            zdo_t.Neighbor.Relationship.Child,
+        ),
+    ]
+    liveness_gateway.application_controller.topology.listener_event(
+        "neighbors_updated", parent.ieee, neighbors
+    )
+    assert liveness.last_evidence(parent) is not None
+    assert liveness.last_evidence(child) is None
+    assert liveness.last_evidence(router_child) is None
+
+    child.device.last_seen = time.time() - child.consider_unavailable_time - 1
+    child._checkins_missed_count = _CHECKIN_GRACE_PERIODS
+    await child._check_available()
+    assert not child.available
+    assert liveness.metrics.inferred == 0
+
+
+async def test_liveness_avoids_pings(liveness_gateway: Gateway) -> None:
+    """Test evidence avoids pings and remaining pings are budgeted."""
+    liveness_gateway.config.config.liveness_options.pings_per_minute = 1
+    liveness = liveness_gateway.liveness
+    # Start with a single ping in the budget
+    liveness.stop()
+    liveness.start()
+
+    router, inferred, pinged, deferred = await _join_plugs(liveness_gateway, 4)
+    for device in (inferred, pinged, deferred):
+        device.device.last_seen = time.time() - device.consider_unavailable_time - 1
+    liveness_gateway.application_controller.topology.listener_event(
+        "neighbors_updated", router.ieee, [_neighbor(inferred, 255)]
+    )
+
+    for device in (inferred, pinged, deferred):
+        await device._check_available()
+
+    read_attributes = inferred.device.endpoints[1].basic.read_attributes
+    assert read_attributes.await_count == 0
+    assert inferred.available
+    assert pinged.device.endpoints[1].basic.read_attributes.await_count == 1
+    assert deferred.device.endpoints[1].basic.read_attributes.await_count == 0
+    assert deferred._checkins_missed_count == 0
+
+    metrics = liveness.metrics
+    assert metrics.inferred == 1
+    assert metrics.pings == 1
+    assert metrics.pings_deferred == 1
+
+
+async def test_liveness_ping_deferrals_are_capped(liveness_gateway: Gateway) -> None:
+    """Test a device whose pings are always deferred still becomes unavailable."""
+    (device,) = await _join_plugs(liveness_gateway, 1)
+    liveness = liveness_gateway.liveness
+    device.device.last_seen = time.time() - device.consider_unavailable_time - 1
+
+    for _ in range(_MAX_PING_DEFERRALS * _CHECKIN_GRACE_PERIODS):
+        liveness._ping_tokens = 0
+        await device._check_available()
+        assert device.available
+
+    await device._check_available()
+    assert not device.available
+    assert device.device.endpoints[1].basic.read_attributes.await_count == 0
+
+
+async def test_liveness_rejects_empty_ping_budget(zha_gateway: Gateway) -> None:
+    """Test liveness inference does not start without a ping budget."""
+    options = zha_gateway.config.config.liveness_options
+    options.enabled = True
+    options.pings_per_minute = 0
+
+    with pytest.raises(ValueError):
+        zha_gateway.liveness.start()
+    assert not zha_gateway.liveness.enabled
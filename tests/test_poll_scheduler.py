@@ -0,0 +1,158 @@
+"""Tests for the central poll scheduler."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from zha.application.gateway import Gateway
+from zha.decorators import periodic
+from zha.poll_scheduler import PollScheduler
+
+
+async def test_poll_job_runs_on_interval(zha_gateway: Gateway) -> None:
+    """Test that a job runs once per interval without a dedicated task."""
+    scheduler = zha_gateway.poll_scheduler
+    poll = AsyncMock()
+    tasks_before = len(asyncio.all_tasks())
+
+    job = scheduler.register(poll, 10, name="test_job")
+    assert job.deadline is not None
+    assert len(asyncio.all_tasks()) == tasks_before
+
+    await asyncio.sleep(5)
+    assert poll.await_count == 0
+
+    await asyncio.sleep(6)
+    assert poll.await_count == 1
+
+    await asyncio.sleep(10)
+    assert poll.await_count == 2
+
+    job.cancel()
+    await asyncio.sleep(30)
+    assert poll.await_count == 2
+    assert job not in scheduler._jobs
+
+
+async def test_poll_job_enable_disable(zha_gateway: Gateway) -> None:
+    """Test that disabling a job skips it without cancelling an in-flight run."""
+    scheduler = zha_gateway.poll_scheduler
+    release = asyncio.Event()
+    calls = 0
+
+    async def poll() -> None:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+
+    job = scheduler.register(poll, 10, name="test_job")
+    await asyncio.sleep(11)
+    assert calls == 1
+    assert job.running
+
+    job.disable()
+    assert job.running
+    release.set()
+    await zha_gateway.async_block_till_done(wait_background_tasks=True)
+    assert not job.running
+    assert job.deadline is None
+
+    await asyncio.sleep(30)
+    assert calls == 1
+
+    job.enable()
+    job.enable()
+    await asyncio.sleep(11)
+    assert calls == 2
+
+    job.cancel()
+
+
+async def test_poll_scheduler_concurrency_and_metrics(zha_gateway: Gateway) -> None:
+    """Test bounded concurrency, queue depth and lag metrics."""
+    scheduler = PollScheduler(zha_gateway, max_concurrency=2)
+    scheduler.start()
+    release = asyncio.Event()
+    running = 0
+    peak = 0
+
+    async def poll() -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+
+    jobs = [scheduler.register(poll, 10, name=f"job_{i}") for i in range(5)]
+    metrics = scheduler.metrics
+    assert metrics.jobs == 5
+    assert metrics.queue_depth == 5
+    assert metrics.due == 0
+    assert metrics.running == 0
+
+    await asyncio.sleep(15)
+    metrics = scheduler.metrics
+    assert peak == 2
+    assert metrics.running == 2
+    assert metrics.due == 3
+    assert metrics.queue_depth == 3
+    assert metrics.runs == 2
+
+    release.set()
+    await zha_gateway.async_block_till_done(wait_background_tasks=True)
+    assert peak == 2
+
+    metrics = scheduler.metrics
+    assert metrics.runs == 5
+    assert metrics.running == 0
+    assert metrics.queue_depth == 5
+    assert metrics.max_lag >= 5
+
+    for job in jobs:
+        job.cancel()
+    scheduler.stop()
+    assert scheduler.metrics.jobs == 0
+
+
+async def test_poll_scheduler_periodic(zha_gateway: Gateway) -> None:
+    """Test that `periodic` methods register with the scheduler."""
+
+    class Poller:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        @periodic((20, 30), run_immediately=True)
+        async def refresh(self) -> None:
+            self.calls += 1
+
+        @periodic((5, 5))
+        async def failing(self) -> None:
+            self.calls += 1
+            raise RuntimeError("Failed")
+
+    poller = Poller()
+    job = zha_gateway.poll_scheduler.register_periodic(poller.refresh)
+    assert 20 <= job.interval <= 30
+    assert getattr(poller, "__polling_interval") == job.interval
+    assert job.name == (
+        "[tests.test_poll_scheduler::test_poll_scheduler_periodic.<locals>"
+        ".Poller.refresh]"
+    )
+
+    await asyncio.sleep(0.1)
+    assert poller.calls == 1
+    await asyncio.sleep(job.interval)
+    assert poller.calls == 2
+    job.cancel()
+
+    # Failures are logged and the job keeps its schedule
+    poller.calls = 0
+    job = zha_gateway.poll_scheduler.register_periodic(poller.failing, name="fails")
+    await asyncio.sleep(11)
+    assert poller.calls == 2
+    assert job.deadline is not None
+    job.cancel()
+
+    with pytest.raises(ValueError):
+        zha_gateway.poll_scheduler.register(AsyncMock(), 0, name="invalid")
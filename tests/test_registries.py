@@ -504,6 +504,67 @@ def test_multi_sensor_match(
     }
 
 
+def test_indexed_rule_matching(cluster_handler) -> None:
+    """Test lookups only consider rules whose required handlers are present."""
+    registry = PlatformEntityRegistry()
+
+    @registry.strict_match("switch", cluster_handler_names="on_off")
+    class OnOff:
+        """OnOff."""
+
+    @registry.strict_match("switch", cluster_handler_names={"on_off", "level"})
+    class OnOffLevel:
+        """OnOffLevel."""
+
+    @registry.strict_match("switch", generic_ids="cluster_handler_0x0300")
+    class Color:
+        """Color."""
+
+    @registry.strict_match("switch", models=MODEL)
+    class Model:
+        """Model."""
+
+    ch_onoff = cluster_handler("on_off", 6)
+    ch_level = cluster_handler("level", 8)
+    ch_color = cluster_handler("color", 0x300)
+
+    entity, claimed = registry.get_entity(
+        "switch", MANUFACTURER, "other", [ch_onoff, ch_level], QUIRK_ID
+    )
+    assert entity is OnOffLevel
+    assert set(claimed) == {ch_onoff, ch_level}
+
+    entity, _ = registry.get_entity(
+        "switch", MANUFACTURER, "other", [ch_color], QUIRK_ID
+    )
+    assert entity is Color
+
+    # Model rules outweigh cluster handler rules and are checked for any device
+    entity, _ = registry.get_entity("switch", MANUFACTURER, MODEL, [ch_onoff], None)
+    assert entity is Model
+
+    index = registry._strict_index["switch"]
+    assert [rule.weight for rule in index.rules] == sorted(
+        (rule.weight for rule in index.rules), reverse=True
+    )
+    assert {
+        registry._strict_registry["switch"][rule]
+        for rule in index.candidates({"color"}, set())
+    } == {Model}
+
+    # Registering another rule rebuilds the index
+    @registry.strict_match("switch", cluster_handler_names="level")
+    class Level:
+        """Level."""
+
+    entity, _ = registry.get_entity("switch", MANUFACTURER, "other", [ch_level], None)
+    assert entity is Level
+    assert registry.get_entity("light", MANUFACTURER, MODEL, [ch_level], None) == (
+        None,
+        [],
+    )
+
+
 def iter_all_rules() -> Iterable[tuple[MatchRule, list[type[PlatformEntity]]]]:
     """Iterate over all match rules and their corresponding entities."""
 
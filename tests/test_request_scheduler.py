@@ -0,0 +1,201 @@
+"""Tests for the radio request priority scheduler."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from zigpy.profiles import zha
+from zigpy.zcl.clusters import general
+from zigpy.zcl.foundation import Status
+
+from tests.common import (
+    SIG_EP_INPUT,
+    SIG_EP_OUTPUT,
+    SIG_EP_PROFILE,
+    SIG_EP_TYPE,
+    create_mock_zigpy_device,
+    join_zigpy_device,
+)
+from zha.application.const import CLUSTER_COMMAND_SERVER
+from zha.application.gateway import Gateway
+from zha.request_scheduler import (
+    REQUEST_PRIORITY,
+    RequestPriority,
+    RequestScheduler,
+    request_priority,
+)
+
+
+async def test_request_priority_order(zha_gateway: Gateway) -> None:
+    """Test that waiting requests are served by priority, then in order."""
+    scheduler = RequestScheduler(zha_gateway, max_concurrency=1)
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def request(name: str, priority: RequestPriority) -> None:
+        async with scheduler.slot(priority):
+            order.append(name)
+            if name == "first":
+                await release.wait()
+
+    tasks = [
+        asyncio.create_task(request("first", RequestPriority.POLLING)),
+        asyncio.create_task(request("poll_1", RequestPriority.POLLING)),
+        asyncio.create_task(request("diagnostic", RequestPriority.DIAGNOSTICS)),
+        asyncio.create_task(request("poll_2", RequestPriority.POLLING)),
+        asyncio.create_task(request("configure", RequestPriority.CONFIGURATION)),
+        asyncio.create_task(request("interactive", RequestPriority.INTERACTIVE)),
+    ]
+    await asyncio.sleep(0)
+    assert order == ["first"]
+    assert scheduler.active == 1
+    assert scheduler.stats[RequestPriority.POLLING].pending == 2
+
+    await asyncio.sleep(2)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert order == [
+        "first",
+        "interactive",
+        "configure",
+        "poll_1",
+        "poll_2",
+        "diagnostic",
+    ]
+    assert scheduler.active == 0
+
+    stats = scheduler.stats
+    assert stats[RequestPriority.POLLING].requests == 3
+    assert stats[RequestPriority.POLLING].queued == 2
+    assert stats[RequestPriority.POLLING].pending == 0
+    assert stats[RequestPriority.INTERACTIVE].requests == 1
+    assert stats[RequestPriority.INTERACTIVE].max_wait == pytest.approx(2)
+    assert stats[RequestPriority.DIAGNOSTICS].average_wait >= 2
+
+
+async def test_request_cancelled_while_waiting(zha_gateway: Gateway) -> None:
+    """Test that cancelled waiters do not leak or block slots."""
+    scheduler = RequestScheduler(zha_gateway, max_concurrency=1)
+    release = asyncio.Event()
+
+    async def request(wait: bool) -> None:
+        async with scheduler.slot(RequestPriority.POLLING):
+            if wait:
+                await release.wait()
+
+    first = asyncio.create_task(request(True))
+    waiting = asyncio.create_task(request(False))
+    await asyncio.sleep(0)
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert scheduler.stats[RequestPriority.POLLING].pending == 0
+
+    release.set()
+    await first
+    assert scheduler.active == 0
+
+    # The slot is handed over and the new owner is cancelled before it runs
+    release.clear()
+    first = asyncio.create_task(request(True))
+    waiting = asyncio.create_task(request(False))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.sleep(0)
+    waiting.cancel()
+    await asyncio.gather(first, waiting, return_exceptions=True)
+    assert scheduler.active == 0
+
+
+async def test_request_released_after_waiter_cancelled(zha_gateway: Gateway) -> None:
+    """Test releasing a slot right after its next waiter was cancelled."""
+    scheduler = RequestScheduler(zha_gateway, max_concurrency=1)
+
+    async def request() -> None:
+        async with scheduler.slot(RequestPriority.POLLING):
+            pass
+
+    async with scheduler.slot(RequestPriority.POLLING):
+        waiting = asyncio.create_task(request())
+        await asyncio.sleep(0)
+        assert scheduler.stats[RequestPriority.POLLING].pending == 1
+
+        # Cancelled in the same loop iteration the slot is released
+        waiting.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert scheduler.active == 0
+    assert scheduler.stats[RequestPriority.POLLING].pending == 0
+
+    # The slot is free for later requests
+    await asyncio.wait_for(request(), timeout=1)
+    assert scheduler.active == 0
+
+
+async def test_request_priority_context(zha_gateway: Gateway) -> None:
+    """Test request priorities are taken from the calling context."""
+    assert REQUEST_PRIORITY.get() is RequestPriority.INTERACTIVE
+    with request_priority(RequestPriority.DIAGNOSTICS):
+        assert REQUEST_PRIORITY.get() is RequestPriority.DIAGNOSTICS
+    assert REQUEST_PRIORITY.get() is RequestPriority.INTERACTIVE
+
+    # Poll jobs run as polling requests
+    priorities: list[RequestPriority] = []
+
+    async def poll() -> None:
+        priorities.append(REQUEST_PRIORITY.get())
+
+    job = zha_gateway.poll_scheduler.register(poll, 10, name="priority")
+    await asyncio.sleep(11)
+    job.cancel()
+    assert priorities == [RequestPriority.POLLING]
+
+
+async def test_cluster_handler_requests_scheduled(zha_gateway: Gateway) -> None:
+    """Test cluster handler requests go through the gateway request scheduler."""
+    zigpy_device = create_mock_zigpy_device(
+        zha_gateway,
+        {
+            1: {
+                SIG_EP_INPUT: [general.Basic.cluster_id, general.OnOff.cluster_id],
+                SIG_EP_OUTPUT: [],
+                SIG_EP_TYPE: zha.DeviceType.ON_OFF_SWITCH,
+                SIG_EP_PROFILE: zha.PROFILE_ID,
+            }
+        },
+    )
+    zha_device = await join_zigpy_device(zha_gateway, zigpy_device)
+    on_off = zha_device.endpoints[1].all_cluster_handlers["1:0x0006"]
+    scheduler = zha_gateway.request_scheduler
+
+    before = scheduler.stats
+    await on_off.on()
+    with request_priority(RequestPriority.POLLING):
+        await on_off.get_attributes(["on_off"], from_cache=False, only_cache=False)
+    # Cache only reads never reach the radio
+    await on_off.get_attributes(["on_off"])
+    with patch("zigpy.zcl.Cluster.request", return_value=[0x01, Status.SUCCESS]):
+        await zha_device.issue_cluster_command(
+            1,
+            general.OnOff.cluster_id,
+            general.OnOff.ServerCommandDefs.on.id,
+            CLUSTER_COMMAND_SERVER,
+            None,
+            {},
+        )
+    after = scheduler.stats
+
+    assert (
+        after[RequestPriority.INTERACTIVE].requests
+        - before[RequestPriority.INTERACTIVE].requests
+        == 2
+    )
+    assert (
+        after[RequestPriority.POLLING].requests
+        - before[RequestPriority.POLLING].requests
+        == 1
+    )
+    assert scheduler.active == 0
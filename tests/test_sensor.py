@@ -5,7 +5,7 @@ from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 import math
 from typing import Any, Optional
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from zhaquirks.danfoss import thermostat as danfoss_thermostat
@@ -721,9 +721,9 @@ async def test_electrical_measurement_init(
     assert cluster_handler.ac_power_multiplier == 20
     assert entity.state["state"] == 60.0
 
-    entity._refresh = AsyncMock(wraps=entity._refresh)
+    entity.async_update = AsyncMock(wraps=entity.async_update)
 
-    assert entity._refresh.await_count == 0
+    assert entity.async_update.await_count == 0
 
     entity.disable()
 
@@ -732,7 +732,7 @@ async def test_electrical_measurement_init(
     await asyncio.sleep(entity.__polling_interval + 1)
     await zha_gateway.async_block_till_done(wait_background_tasks=True)
 
-    assert entity._refresh.await_count == 0
+    assert entity.async_update.await_count == 0
 
     entity.enable()
 
@@ -741,7 +741,7 @@ async def test_electrical_measurement_init(
     await asyncio.sleep(entity.__polling_interval + 1)
     await zha_gateway.async_block_till_done(wait_background_tasks=True)
 
-    assert entity._refresh.await_count == 1
+    assert entity.async_update.await_count == 1
 
 
 @pytest.mark.parametrize(
@@ -1068,6 +1068,8 @@ async def test_elec_measurement_sensor_polling(zha_gateway: Gateway) -> None:
 
     # ensure the state is still 2.0
     assert entity.state["state"] == 2.0
+    interval = entity.polling_interval
+    assert 30 <= interval <= 45
 
     # let the polling happen
     await asyncio.sleep(90)
@@ -1075,6 +1077,102 @@ async def test_elec_measurement_sensor_polling(zha_gateway: Gateway) -> None:
 
     # ensure the state has been updated to 6.0
     assert entity.state["state"] == 6.0
+    # the interval is fixed unless adaptive polling is enabled
+    assert entity.polling_interval == interval
+
+
+async def test_elec_measurement_sensor_adaptive_polling(zha_gateway: Gateway) -> None:
+    """Test the polling interval follows the volatility of polled values."""
+    options = zha_gateway.config.config.device_options
+    options.enable_adaptive_polling = True
+    options.adaptive_polling_min_interval = 10
+    options.adaptive_polling_max_interval = 60
+
+    zigpy_dev = elec_measurement_zigpy_device_mock(zha_gateway)
+    reads = zigpy_dev.endpoints[1].electrical_measurement.PLUGGED_ATTR_READS
+    reads["active_power"] = 20
+    zha_dev = await join_zigpy_device(zha_gateway, zigpy_dev)
+    entity = get_entity(
+        zha_dev,
+        platform=Platform.SENSOR,
+        exact_entity_type=sensor.PolledElectricalMeasurement,
+    )
+
+    async def next_poll() -> None:
+        await asyncio.sleep(entity.polling_interval + 1)
+        await zha_gateway.async_block_till_done(wait_background_tasks=True)
+
+    # The first poll only records the value
+    interval = entity.polling_interval
+    await next_poll()
+    assert entity.polling_interval == interval
+
+    # Flat values back off up to the ceiling
+    await next_poll()
+    assert entity.polling_interval == min(60, math.ceil(interval * 1.5))
+    await next_poll()
+    await next_poll()
+    assert entity.polling_interval == 60
+
+    # Small changes are still flat, large ones poll at the floor
+    reads["active_power"] = 21
+    await next_poll()
+    assert entity.polling_interval == 60
+    reads["active_power"] = 2000
+    await next_poll()
+    assert entity.polling_interval == 10
+    assert entity.state["state"] == 200.0
+
+    await next_poll()
+    assert entity.polling_interval == 15
+
+
+async def test_elec_measurement_polling_skips_reported(zha_gateway: Gateway) -> None:
+    """Test attributes reported within the polling window are not polled."""
+
+    zigpy_dev = elec_measurement_zigpy_device_mock(zha_gateway)
+    zha_dev = await join_zigpy_device(zha_gateway, zigpy_dev)
+    cluster = zigpy_dev.endpoints[1].electrical_measurement
+    cluster_handler = zha_dev.endpoints[1].all_cluster_handlers[
+        f"1:0x{cluster.cluster_id:04x}"
+    ]
+    entity = get_entity(
+        zha_dev,
+        platform=Platform.SENSOR,
+        exact_entity_type=sensor.PolledElectricalMeasurement,
+    )
+    polled = {a["attr"] for a in cluster_handler.REPORT_CONFIG}
+
+    def read_attrs() -> set[str]:
+        return {
+            a for call in cluster.read_attributes.call_args_list for a in call[0][0]
+        }
+
+    # Read responses do not count as reports
+    cluster.read_attributes.reset_mock()
+    await entity.async_update()
+    await entity.async_update()
+    assert cluster.read_attributes.call_count > 0
+    assert read_attrs() == polled
+    assert cluster_handler.attribute_polls_avoided == 0
+
+    await send_attributes_report(zha_gateway, cluster, {"active_power": 60})
+    cluster.read_attributes.reset_mock()
+    await entity.async_update()
+    assert read_attrs() == polled - {"active_power"}
+    assert cluster_handler.attribute_polls_avoided == 1
+
+    await send_attributes_report(zha_gateway, cluster, dict.fromkeys(polled, 1))
+    cluster.read_attributes.reset_mock()
+    await entity.async_update()
+    assert cluster.read_attributes.call_count == 0
+    assert cluster_handler.polls_avoided == 1
+    assert cluster_handler.attribute_polls_avoided == 1 + len(polled)
+
+    # Reports older than the window no longer avoid polls
+    await asyncio.sleep(cluster_handler.POLL_REPORT_WINDOW + 1)
+    await entity.async_update()
+    assert read_attrs() == polled
 
 
 @pytest.mark.parametrize(
@@ -1311,25 +1409,140 @@ async def test_device_counter_sensors(zha_gateway: Gateway) -> None:
 
     assert entity.state["state"] == 2
 
-    # test disabling the entity disables it and removes it from the updater
-    assert len(zha_gateway.global_updater._update_listeners) == 3
+    # all counter sensors share the counter collector listener of the updater
+    collector = zha_gateway.counter_collector
+    assert zha_gateway.global_updater._update_listeners == [collector.collect]
     assert entity.enabled is True
 
+    # test disabling the entity disables it and removes it from the collector
     entity.disable()
 
     assert entity.enabled is False
-    assert len(zha_gateway.global_updater._update_listeners) == 2
+    assert entity._counter_key not in collector._listeners
 
-    # test enabling the entity enables it and adds it to the updater
+    # test enabling the entity enables it and adds it to the collector
     entity.enable()
 
     assert entity.enabled is True
-    assert len(zha_gateway.global_updater._update_listeners) == 3
+    assert collector._listeners[entity._counter_key] == entity.update
+
+    # the collector leaves the updater once no counter sensor is enabled
+    for counter_sensor in coordinator.platform_entities.values():
+        counter_sensor.disable()
+
+    assert zha_gateway.global_updater._update_listeners == []
 
-    # make sure we don't get multiple listeners for the same entity in the updater
     entity.enable()
 
-    assert len(zha_gateway.global_updater._update_listeners) == 3
+    assert zha_gateway.global_updater._update_listeners == [collector.collect]
+
+
+async def test_counter_collector(zha_gateway: Gateway) -> None:
+    """Test the counter collector only notifies sensors of changed counters."""
+    coordinator = zha_gateway.coordinator_zha_device
+    collector = zha_gateway.counter_collector
+    counters = zha_gateway.application_controller.state.counters["ezsp_counters"]
+    entities = {
+        entity._counter_key[2]: entity
+        for entity in coordinator.platform_entities.values()
+    }
+    for entity in entities.values():
+        entity.disable()
+        entity.update = MagicMock(wraps=entity.update)
+        entity.enable()
+
+    collector.collect()
+    for entity in entities.values():
+        entity.update.reset_mock()
+    assert collector.snapshot() == {
+        ("counters", "ezsp_counters", name): 1 for name in entities
+    }
+
+    counters["counter_1"].increment(60)
+    counters["counter_1"].reset()
+    await asyncio.sleep(30)
+    collector.collect()
+
+    assert entities["counter_1"].update.call_count == 1
+    assert entities["counter_2"].update.call_count == 0
+    assert entities["counter_1"].state["state"] == 61
+    assert collector.rates()[("counters", "ezsp_counters", "counter_1")] == 2
+    assert collector.rates()[("counters", "ezsp_counters", "counter_2")] == 0
+
+    # counters added by the radio library are picked up
+    counters["counter_new"].increment()
+    collector.collect()
+
+    assert collector.snapshot()[("counters", "ezsp_counters", "counter_new")] == 1
+    assert entities["counter_1"].update.call_count == 1
+    assert ("counters", "ezsp_counters", "counter_new") not in collector.rates()
+
+    # changes a sensor could not handle are retried on the next snapshot
+    zha_gateway.config.allow_polling = False
+    counters["counter_2"].increment()
+    collector.collect()
+    assert entities["counter_2"].update.call_count == 1
+    assert entities["counter_2"].state["state"] == 2
+
+    zha_gateway.config.allow_polling = True
+    entities["counter_2"].maybe_emit_state_changed_event = MagicMock()
+    collector.collect()
+    assert entities["counter_2"].update.call_count == 2
+    assert entities["counter_2"].maybe_emit_state_changed_event.call_count == 1
+    assert entities["counter_1"].update.call_count == 1
+
+    collector.collect()
+    assert entities["counter_2"].update.call_count == 2
+
+
+async def test_deferred_disabled_entities(zha_gateway: Gateway) -> None:
+    """Test entities disabled by default are only created once they are used."""
+    zha_gateway.config.config.device_options.defer_disabled_entities = True
+    listeners = len(zha_gateway.global_updater._update_listeners)
+
+    zha_device = await join_zigpy_device(
+        zha_gateway, elec_measurement_zigpy_device_mock(zha_gateway)
+    )
+    rssi_id = f"{zha_device.ieee}-1-0-rssi"
+    lqi_id = f"{zha_device.ieee}-1-0-lqi"
+
+    assert set(zha_device.deferred_entities) == {
+        (Platform.SENSOR, rssi_id),
+        (Platform.SENSOR, lqi_id),
+    }
+    assert (Platform.SENSOR, rssi_id) not in zha_device.platform_entities
+    assert len(zha_gateway.global_updater._update_listeners) == listeners
+
+    # looking the entity up creates it
+    rssi = zha_device.get_platform_entity(Platform.SENSOR, rssi_id)
+    assert type(rssi) is sensor.RSSISensor
+    assert zha_device.platform_entities[(Platform.SENSOR, rssi_id)] is rssi
+    assert len(zha_gateway.global_updater._update_listeners) == listeners + 1
+
+    # so does enabling its descriptor
+    lqi = zha_device.deferred_entities[(Platform.SENSOR, lqi_id)].enable()
+    assert type(lqi) is sensor.LQISensor
+    assert lqi.enabled is True
+    assert lqi.unique_id == lqi_id
+    assert zha_device.deferred_entities == {}
+    assert len(zha_gateway.global_updater._update_listeners) == listeners + 2
+
+
+async def test_deferred_unsupported_entity(zha_gateway: Gateway) -> None:
+    """Test a deferred entity the factory does not support is not created."""
+    zha_gateway.config.config.device_options.defer_disabled_entities = True
+    zha_device = await join_zigpy_device(
+        zha_gateway, elec_measurement_zigpy_device_mock(zha_gateway)
+    )
+    lqi_id = f"{zha_device.ieee}-1-0-lqi"
+    deferred = zha_device.deferred_entities[(Platform.SENSOR, lqi_id)]
+
+    # The factory support checks run when the entity is created
+    with patch.object(sensor.LQISensor, "create_platform_entity", return_value=None):
+        assert deferred.enable() is None
+    assert (Platform.SENSOR, lqi_id) not in zha_device.deferred_entities
+    with pytest.raises(KeyError):
+        zha_device.get_platform_entity(Platform.SENSOR, lqi_id)
 
 
 async def test_device_unavailable_or_disabled_skips_entity_polling(
@@ -1359,13 +1572,13 @@ async def test_device_unavailable_or_disabled_skips_entity_polling(
 
     assert entity.state["state"] == 60
     assert entity.enabled is True
-    assert len(zha_gateway.global_updater._update_listeners) == 5
+    assert len(zha_gateway.global_updater._update_listeners) == 3
 
     # let's drop the normal update method from the updater
     entity.disable()
 
     assert entity.enabled is False
-    assert len(zha_gateway.global_updater._update_listeners) == 4
+    assert len(zha_gateway.global_updater._update_listeners) == 2
 
     # wrap the update method so we can count how many times it was called
     entity.update = MagicMock(wraps=entity.update)
@@ -1376,7 +1589,7 @@ async def test_device_unavailable_or_disabled_skips_entity_polling(
 
     # re-enable the entity and ensure it is back in the updater and that update is called
     entity.enable()
-    assert len(zha_gateway.global_updater._update_listeners) == 5
+    assert len(zha_gateway.global_updater._update_listeners) == 3
     assert entity.enabled is True
 
     await asyncio.sleep(zha_gateway.global_updater.__polling_interval + 2)
@@ -220,6 +220,35 @@ async def test_switch(zha_gateway: Gateway) -> None:
     assert bool(entity.state["state"]) is True
 
 
+async def test_switch_state_snapshot(zha_gateway: Gateway) -> None:
+    """Test the state dict is only rebuilt when one of its inputs changes."""
+    zigpy_device = create_mock_zigpy_device(zha_gateway, ZIGPY_DEVICE)
+    zha_device = await join_zigpy_device(zha_gateway, zigpy_device)
+    cluster = zigpy_device.endpoints.get(1).on_off
+    entity: PlatformEntity = get_entity(zha_device, Platform.SWITCH)
+
+    state = entity.state
+    assert entity.state is state
+
+    # A signalled state change rebuilds the state
+    await send_attributes_report(zha_gateway, cluster, {0: 1})
+    assert entity.state is not state
+    assert bool(entity.state["state"]) is True
+    state = entity.state
+    assert entity.state is state
+
+    # So does an update of an attribute the entity does not signal changes for
+    await send_attributes_report(zha_gateway, cluster, {0x4001: 10})
+    assert entity.state is not state
+    assert entity.state == state
+    state = entity.state
+
+    # And a change of the device availability
+    zha_device.available = False
+    assert entity.state is not state
+    assert entity.state["available"] is False
+
+
 async def test_zha_group_switch_entity(zha_gateway: Gateway) -> None:
     """Test the switch entity for a ZHA group."""
     device_switch_1 = await device_switch_1_mock(zha_gateway)
@@ -0,0 +1,102 @@
+"""Tests for the structured trace ring buffer."""
+
+from collections.abc import Iterator
+import logging
+
+import pytest
+from zigpy.profiles import zha
+from zigpy.zcl.clusters import general
+
+from tests.common import (
+    SIG_EP_INPUT,
+    SIG_EP_OUTPUT,
+    SIG_EP_PROFILE,
+    SIG_EP_TYPE,
+    create_mock_zigpy_device,
+    join_zigpy_device,
+    send_attributes_report,
+)
+from zha.application.gateway import Gateway
+from zha.trace import TRACER, TraceKind, Tracer
+
+
+@pytest.fixture
+def tracer() -> Iterator[Tracer]:
+    """Enable the global tracer for a test."""
+    TRACER.clear()
+    yield TRACER
+    TRACER.disable()
+    TRACER.clear()
+
+
+def test_tracer_ring_buffer() -> None:
+    """Test records are filtered and only the most recent ones are kept."""
+    tracer = Tracer(size=3)
+    tracer.record(TraceKind.EVENT, None, None, "ignored")
+    tracer.enable(devices=[0x1234], clusters=[general.OnOff.cluster_id])
+
+    tracer.record(TraceKind.LOG, 0x1234, general.OnOff.cluster_id, "first")
+    tracer.record(TraceKind.LOG, 0x4321, general.OnOff.cluster_id, "other device")
+    tracer.record(TraceKind.LOG, 0x1234, general.Basic.cluster_id, "other cluster")
+    tracer.record(TraceKind.EVENT, None, None, "not a device")
+    for value in ("second", "third", "fourth"):
+        tracer.record(TraceKind.LOG, 0x1234, general.OnOff.cluster_id, value)
+
+    assert [record.value for record in tracer.dump()] == ["second", "third", "fourth"]
+
+    tracer.enable(size=5)
+    assert tracer.size == 5
+    tracer.record(TraceKind.EVENT, None, None, "unfiltered")
+    records = tracer.dump(clear=True)
+    assert [record.value for record in records] == [
+        "second",
+        "third",
+        "fourth",
+        "unfiltered",
+    ]
+    assert records[-1].kind is TraceKind.EVENT
+    assert not tracer.dump()
+
+
+async def test_tracer_hot_paths(
+    zha_gateway: Gateway, tracer: Tracer, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test attribute updates are traced for the enabled devices only."""
+    zigpy_device = create_mock_zigpy_device(
+        zha_gateway,
+        {
+            1: {
+                SIG_EP_INPUT: [general.Basic.cluster_id, general.OnOff.cluster_id],
+                SIG_EP_OUTPUT: [],
+                SIG_EP_TYPE: zha.DeviceType.ON_OFF_SWITCH,
+                SIG_EP_PROFILE: zha.PROFILE_ID,
+            }
+        },
+    )
+    zha_device = await join_zigpy_device(zha_gateway, zigpy_device)
+    cluster = zigpy_device.endpoints[1].on_off
+
+    # Nothing is traced while tracing is disabled
+    await send_attributes_report(zha_gateway, cluster, {0: 1})
+    assert not tracer.dump()
+
+    tracer.enable(devices=[zha_device.nwk], clusters=[cluster.cluster_id])
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger="zha"):
+        await send_attributes_report(zha_gateway, cluster, {0: 0})
+
+    records = [
+        record for record in tracer.dump() if record.kind is TraceKind.ATTRIBUTE_UPDATED
+    ]
+    assert len(records) == 1
+    assert records[0].nwk == zha_device.nwk
+    assert records[0].cluster == cluster.cluster_id
+    assert records[0].value == ("on_off", 0)
+    # Debug logs are traced without being formatted
+    assert all(isinstance(record.value, tuple) for record in tracer.dump())
+    assert "attribute_updated" not in caplog.text
+
+    tracer.enable(devices=[zha_device.nwk + 1])
+    tracer.clear()
+    await send_attributes_report(zha_gateway, cluster, {0: 1})
+    assert not tracer.dump()
@@ -94,6 +94,7 @@ PRESET_NONE = "none"
 ENTITY_METADATA = "entity_metadata"
 
 ZCL_INIT_ATTRS = "ZCL_INIT_ATTRS"
+REPORT_CONFIG = "REPORT_CONFIG"
 
 _ControllerClsType = type[zigpy.application.ControllerApplication]
 
@@ -192,6 +193,7 @@ ZHA_CLUSTER_HANDLER_CFG_DONE = "zha_channel_cfg_done"
 ZHA_CLUSTER_HANDLER_READS_PER_REQ = 5
 ZHA_EVENT = "zha_event"
 ZHA_GW_MSG = "zha_gateway_message"
+ZHA_GW_MSG_BULK_CONFIGURATION_PROGRESS = "bulk_configuration_progress"
 ZHA_GW_MSG_DEVICE_FULL_INIT = "device_fully_initialized"
 ZHA_GW_MSG_DEVICE_INFO = "device_info"
 ZHA_GW_MSG_DEVICE_JOINED = "device_joined"
@@ -206,6 +208,7 @@ ZHA_GW_MSG_LOG_ENTRY = "log_entry"
 ZHA_GW_MSG_LOG_OUTPUT = "log_output"
 ZHA_GW_MSG_RAW_INIT = "raw_device_initialized"
 ZHA_GW_MSG_CONNECTION_LOST = "connection_lost"
+ZHA_GW_MSG_STARTUP_REPORT = "startup_report"
 
 
 class Strobe(t.enum8):
@@ -0,0 +1,154 @@
+"""Coordinator counter collection for Zigbee Home Automation.
+
+The radio library keeps counters of the frames, errors and retries the
+coordinator saw. Instead of every counter sensor reading its own counter on each
+global update, the collector reads all of them into a compact array at once,
+compares it with the previous snapshot and only notifies the listeners of the
+counters that changed. Listeners that could not handle a change are notified
+again on the next snapshot. The last two snapshots also give the rate of every
+counter, for radio health dashboards.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable
+import logging
+from typing import TYPE_CHECKING, Final
+
+from zigpy.state import Counter
+
+if TYPE_CHECKING:
+    from zha.application.gateway import Gateway
+
+_LOGGER = logging.getLogger(__name__)
+
+# Attributes of the zigpy application state holding counter groups
+COUNTER_GROUPS: Final = (
+    "counters",
+    "broadcast_counters",
+    "device_counters",
+    "group_counters",
+)
+
+# Counter groups attribute, counter group and counter name of a counter
+CounterKey = tuple[str, str, str]
+
+
+class CounterCollector:
+    """Snapshot all coordinator counters and notify listeners of changed ones.
+
+    The collector runs with the global updater while it has listeners, and
+    `collect` takes a snapshot on demand.
+    """
+
+    def __init__(self, gateway: Gateway) -> None:
+        """Initialize the counter collector."""
+        self._gateway: Gateway = gateway
+        self._listeners: dict[CounterKey, Callable[[], bool]] = {}
+        # Counters whose listener did not handle their last change
+        self._unhandled: set[CounterKey] = set()
+        # Identity and size of every counter group, to notice new counters
+        self._layout: tuple[tuple[int, int], ...] = ()
+        self._counters: list[Counter] = []
+        self._keys: list[CounterKey] = []
+        # The last two snapshots, their counter keys and the loop times they were taken
+        self._values: array[int] = array("q")
+        self._time: float | None = None
+        self._previous_keys: list[CounterKey] = []
+        self._previous_values: array[int] = array("q")
+        self._previous_time: float | None = None
+        self.notifications: int = 0
+
+    def subscribe(self, key: CounterKey, listener: Callable[[], bool]) -> None:
+        """Call `listener` whenever the counter changed between two snapshots.
+
+        The listener returns whether it handled the change.
+        """
+        if not self._listeners:
+            self._gateway.global_updater.register_update_listener(self.collect)
+        self._listeners[key] = listener
+
+    def unsubscribe(self, key: CounterKey) -> None:
+        """Stop notifying the listener of a counter."""
+        self._unhandled.discard(key)
+        if self._listeners.pop(key, None) is not None and not self._listeners:
+            self._gateway.global_updater.remove_update_listener(self.collect)
+
+    def collect(self) -> None:
+        """Take a snapshot of all counters and notify the listeners of changed ones."""
+        previous_keys, previous_values = self._keys, self._values
+        self._index()
+        values = array("q", [counter.value for counter in self._counters])
+
+        self._previous_keys, self._previous_values = previous_keys, previous_values
+        self._previous_time = self._time
+        self._values, self._time = values, self._gateway.loop.time()
+
+        if self._keys is previous_keys:
+            if values == previous_values and not self._unhandled:
+                return
+            changed = [
+                key
+                for key, value, previous in zip(self._keys, values, previous_values)
+                if value != previous
+            ]
+        else:
+            # Counters were added, compare by key
+            old = dict(zip(previous_keys, previous_values))
+            changed = [
+                key for key, value in zip(self._keys, values) if old.get(key) != value
+            ]
+        _LOGGER.debug("%s of %s counters changed", len(changed), len(values))
+
+        unhandled, self._unhandled = self._unhandled, set()
+        for key in (*changed, *unhandled.difference(changed)):
+            if (listener := self._listeners.get(key)) is not None:
+                self.notifications += 1
+                if not listener():
+                    self._unhandled.add(key)
+
+    def snapshot(self) -> dict[CounterKey, int]:
+        """Return the counter values of the last snapshot."""
+        return dict(zip(self._keys, self._values))
+
+    def rates(self) -> dict[CounterKey, float]:
+        """Return the per second rate of every counter between the last two snapshots."""
+        if self._time is None or self._previous_time is None:
+            return {}
+        if (elapsed := self._time - self._previous_time) <= 0:
+            return {}
+        if self._keys is self._previous_keys:
+            return {
+                key: (value - previous) / elapsed
+                for key, value, previous in zip(
+                    self._keys, self._values, self._previous_values
+                )
+            }
+        old = dict(zip(self._previous_keys, self._previous_values))
+        return {
+            key: (value - old[key]) / elapsed
+            for key, value in zip(self._keys, self._values)
+            if key in old
+        }
+
+    def _index(self) -> None:
+        """Find the counters to snapshot if counters or groups were added."""
+        state = self._gateway.application_controller.state
+        groups = [
+            (groups_name, group_name, group)
+            for groups_name in COUNTER_GROUPS
+            for group_name, group in getattr(state, groups_name).items()
+        ]
+        layout = tuple((id(group), len(group)) for _, _, group in groups)
+        if layout == self._layout:
+            return
+
+        self._layout = layout
+        self._counters = []
+        self._keys = []
+        for groups_name, group_name, group in groups:
+            for name, counter in group.items():
+                if isinstance(counter, Counter):
+                    self._keys.append((groups_name, group_name, name))
+                    self._counters.append(counter)
@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 from collections import Counter
+from collections.abc import Hashable
+from dataclasses import dataclass
+import hashlib
+import importlib
+import importlib.metadata
+import json
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, Final, cast
 
 from zigpy.quirks.v2 import (
     BinarySensorMetadata,
@@ -22,6 +28,7 @@ from zigpy.zcl import ClusterType
 from zigpy.zcl.clusters.general import Ota
 
 from zha.application import Platform, const as zha_const
+from zha.application.counters import COUNTER_GROUPS
 from zha.application.helpers import DeviceOverridesConfiguration
 from zha.application.platforms import (  # noqa: F401 pylint: disable=unused-import
     alarm_control_panel,
@@ -358,10 +365,201 @@ class DeviceProbe:
                         f"counter groups[{counter_groups}] counter group[{counter_group}] counter[{counter}]",
                     )
 
-        process_counters("counters")
-        process_counters("broadcast_counters")
-        process_counters("device_counters")
-        process_counters("group_counters")
+        for counter_groups in COUNTER_GROUPS:
+            process_counters(counter_groups)
+
+
+# A cluster handler used by a discovery plan: ("in", handler id) and
+# ("client", handler id) refer to the handlers of the endpoint, while
+# ("out", cluster id, handler class) is a handler created during discovery
+_HandlerRef = tuple[Any, ...]
+
+# Bumped whenever the layout of discovery snapshots changes
+SNAPSHOT_FORMAT: Final = 1
+
+
+def _class_path(cls: type) -> str:
+    """Return the import path of a class."""
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _import_class(path: str) -> type:
+    """Import a class from the path returned by `_class_path`."""
+    module_name, _, qualname = path.partition(":")
+    obj: Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    if not isinstance(obj, type):
+        raise TypeError(f"{path} is not a class")
+    return obj
+
+
+def _serializable(value: Any) -> Any:
+    """Return a plan key or handler reference with classes replaced by paths."""
+    if isinstance(value, type):
+        return _class_path(value)
+    if isinstance(value, tuple):
+        return [_serializable(item) for item in value]
+    return value
+
+
+def _snapshot_fingerprint() -> dict[str, Any]:
+    """Return what snapshots must have been written with to be restored."""
+    versions: dict[str, Any] = {
+        "format": SNAPSHOT_FORMAT,
+        "platform_entities": PLATFORM_ENTITIES.version,
+    }
+    for package in ("zha", "zigpy", "zha-quirks"):
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+
+def _plan_digest(key: Hashable) -> str:
+    """Return a digest of a plan key that is stable across restarts."""
+    return hashlib.sha256(
+        json.dumps(_serializable(key), separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _PlannedEntity:
+    """An entity created by a discovery plan."""
+
+    platform: Platform
+    entity_class: type
+    unique_id_suffix: str
+    cluster_handlers: tuple[_HandlerRef, ...]
+    kwargs: dict[str, Any]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class EndpointDiscoveryPlan:
+    """Outcome of entity discovery for endpoints sharing the same signature."""
+
+    claimed_cluster_handlers: tuple[_HandlerRef, ...]
+    entities: tuple[_PlannedEntity, ...]
+
+    @classmethod
+    def record(
+        cls, endpoint: Endpoint, platforms_before: dict[Platform, int]
+    ) -> EndpointDiscoveryPlan | None:
+        """Create a plan from the discovery that just ran for the endpoint."""
+
+        def ref(cluster_handler: ClusterHandler) -> _HandlerRef:
+            handler_id = cluster_handler.id
+            if endpoint.all_cluster_handlers.get(handler_id) is cluster_handler:
+                return ("in", handler_id)
+            if endpoint.client_cluster_handlers.get(handler_id) is cluster_handler:
+                return ("client", handler_id)
+            return ("out", cluster_handler.cluster.cluster_id, type(cluster_handler))
+
+        entities: list[_PlannedEntity] = []
+        for platform, entries in endpoint.device.gateway.config.platforms.items():
+            for entity_class, args, kwargs in entries[
+                platforms_before.get(platform, 0) :
+            ]:
+                unique_id, cluster_handlers, entity_endpoint, _ = args
+                if entity_endpoint is not endpoint or not unique_id.startswith(
+                    endpoint.unique_id
+                ):
+                    return None
+                entities.append(
+                    _PlannedEntity(
+                        platform=platform,
+                        entity_class=entity_class,
+                        unique_id_suffix=unique_id[len(endpoint.unique_id) :],
+                        cluster_handlers=tuple(ref(ch) for ch in cluster_handlers),
+                        kwargs=kwargs,
+                    )
+                )
+
+        return cls(
+            claimed_cluster_handlers=tuple(
+                ref(ch) for ch in endpoint.claimed_cluster_handlers.values()
+            ),
+            entities=tuple(entities),
+        )
+
+    def as_dict(self) -> dict[str, Any] | None:
+        """Return the plan in a JSON serializable form, if it has one."""
+        entities = []
+        for entity in self.entities:
+            try:
+                if json.loads(json.dumps(entity.kwargs)) != entity.kwargs:
+                    return None
+            except (TypeError, ValueError):
+                return None
+            entities.append(
+                {
+                    "platform": entity.platform.value,
+                    "entity_class": _class_path(entity.entity_class),
+                    "unique_id_suffix": entity.unique_id_suffix,
+                    "cluster_handlers": _serializable(entity.cluster_handlers),
+                    "kwargs": entity.kwargs,
+                }
+            )
+        return {
+            "claimed_cluster_handlers": _serializable(self.claimed_cluster_handlers),
+            "entities": entities,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> EndpointDiscoveryPlan:
+        """Restore a plan from the form returned by `as_dict`."""
+
+        def ref(value: list[Any]) -> _HandlerRef:
+            if value[0] == "out":
+                return ("out", value[1], _import_class(value[2]))
+            return tuple(value)
+
+        return cls(
+            claimed_cluster_handlers=tuple(
+                ref(value) for value in data["claimed_cluster_handlers"]
+            ),
+            entities=tuple(
+                _PlannedEntity(
+                    platform=Platform(entity["platform"]),
+                    entity_class=_import_class(entity["entity_class"]),
+                    unique_id_suffix=entity["unique_id_suffix"],
+                    cluster_handlers=tuple(
+                        ref(value) for value in entity["cluster_handlers"]
+                    ),
+                    kwargs=entity["kwargs"],
+                )
+                for entity in data["entities"]
+            ),
+        )
+
+    def apply(self, endpoint: Endpoint) -> None:
+        """Claim cluster handlers and create entities for the endpoint."""
+        created: dict[_HandlerRef, ClusterHandler] = {}
+
+        def resolve(ref: _HandlerRef) -> ClusterHandler:
+            if ref[0] == "in":
+                return endpoint.all_cluster_handlers[ref[1]]
+            if ref[0] == "client":
+                return endpoint.client_cluster_handlers[ref[1]]
+            if (cluster_handler := created.get(ref)) is None:
+                _, cluster_id, cluster_handler_class = ref
+                cluster_handler = created[ref] = cluster_handler_class(
+                    endpoint.zigpy_endpoint.out_clusters[cluster_id], endpoint
+                )
+            return cluster_handler
+
+        endpoint.claim_cluster_handlers(
+            [resolve(ref) for ref in self.claimed_cluster_handlers]
+        )
+        for entity in self.entities:
+            endpoint.async_new_entity(
+                entity.platform,
+                entity.entity_class,
+                f"{endpoint.unique_id}{entity.unique_id_suffix}",
+                [resolve(ref) for ref in entity.cluster_handlers],
+                **entity.kwargs,
+            )
 
 
 class EndpointProbe:
@@ -370,6 +568,11 @@ class EndpointProbe:
     def __init__(self) -> None:
         """Initialize instance."""
         self._device_configs: dict[str, DeviceOverridesConfiguration] = {}
+        self._plans: dict[Hashable, EndpointDiscoveryPlan] = {}
+        self._plans_version: int = PLATFORM_ENTITIES.version
+        # Serialized plans restored from a snapshot, by plan key digest
+        self._snapshot_plans: dict[str, dict[str, Any]] = {}
+        self.restored_plans: int = 0
 
     def discover_entities(self, endpoint: Endpoint) -> None:
         """Process an endpoint on a zigpy device."""
@@ -378,12 +581,99 @@ class EndpointProbe:
             str(endpoint.device.ieee),
             endpoint.id,
         )
+        if self._plans_version != PLATFORM_ENTITIES.version:
+            self._plans.clear()
+            self._snapshot_plans.clear()
+            self._plans_version = PLATFORM_ENTITIES.version
+
+        key = self._plan_key(endpoint)
+        if (plan := self._plans.get(key)) is not None or (
+            plan := self._restore_plan(key)
+        ) is not None:
+            plan.apply(endpoint)
+            return
+
+        platforms = endpoint.device.gateway.config.platforms
+        platforms_before = {
+            platform: len(entries) for platform, entries in platforms.items()
+        }
         self.discover_by_device_type(endpoint)
         self.discover_multi_entities(endpoint)
         self.discover_by_cluster_id(endpoint)
         self.discover_multi_entities(endpoint, config_diagnostic_entities=True)
         PLATFORM_ENTITIES.clean_up()
 
+        if (plan := EndpointDiscoveryPlan.record(endpoint, platforms_before)) is None:
+            return
+        self._plans[key] = plan
+
+    def _restore_plan(self, key: Hashable) -> EndpointDiscoveryPlan | None:
+        """Return the plan restored from the snapshot for a plan key, if any."""
+        if not self._snapshot_plans:
+            return None
+        try:
+            data = self._snapshot_plans.pop(_plan_digest(key), None)
+            if data is None:
+                return None
+            plan = EndpointDiscoveryPlan.from_dict(data)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.debug("Failed to restore a discovery plan", exc_info=True)
+            return None
+        self._plans[key] = plan
+        self.restored_plans += 1
+        return plan
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the discovery plans in a JSON serializable form."""
+        plans = {}
+        for key, plan in self._plans.items():
+            try:
+                digest = _plan_digest(key)
+            except (TypeError, ValueError):
+                continue
+            if (data := plan.as_dict()) is not None:
+                plans[digest] = data
+        return {**_snapshot_fingerprint(), "plans": plans}
+
+    def restore(self, snapshot: dict[str, Any]) -> bool:
+        """Restore plans from a snapshot written by the same software versions."""
+        fingerprint = _snapshot_fingerprint()
+        if any(snapshot.get(name) != value for name, value in fingerprint.items()):
+            _LOGGER.debug("Ignoring a discovery snapshot of other versions")
+            return False
+        self._snapshot_plans = dict(snapshot.get("plans", {}))
+        return True
+
+    def _plan_key(self, endpoint: Endpoint) -> Hashable:
+        """Return the signature of an endpoint that determines its discovery."""
+        device = endpoint.device
+        zigpy_endpoint = endpoint.zigpy_endpoint
+        override = self._device_configs.get(endpoint.unique_id)
+        return (
+            device.manufacturer,
+            device.model,
+            device.quirk_id,
+            type(device.device),
+            override.type if override is not None else None,
+            endpoint.id,
+            zigpy_endpoint.profile_id,
+            zigpy_endpoint.device_type,
+            tuple(
+                (handler_id, type(cluster_handler), type(cluster_handler.cluster))
+                for handler_id, cluster_handler in endpoint.all_cluster_handlers.items()
+            ),
+            tuple(
+                (handler_id, type(cluster_handler))
+                for handler_id, cluster_handler in (
+                    endpoint.client_cluster_handlers.items()
+                )
+            ),
+            tuple(
+                (cluster_id, type(cluster))
+                for cluster_id, cluster in zigpy_endpoint.out_clusters.items()
+            ),
+        )
+
     def discover_by_device_type(self, endpoint: Endpoint) -> None:
         """Process an endpoint on a zigpy device."""
 
@@ -560,6 +850,9 @@ class EndpointProbe:
 
     def initialize(self, gateway: Gateway) -> None:
         """Update device overrides config."""
+        self._plans.clear()
+        self._snapshot_plans.clear()
+        self.restored_plans = 0
         if overrides := gateway.config.config.device_overrides:
             self._device_configs.update(overrides)
 
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import timedelta
 from enum import Enum
+import json
 import logging
+import os
 import time
 from typing import Any, Final, Self, TypeVar, cast
 
@@ -43,15 +46,35 @@ from zha.application.const import (
     ZHA_GW_MSG_GROUP_MEMBER_REMOVED,
     ZHA_GW_MSG_GROUP_REMOVED,
     ZHA_GW_MSG_RAW_INIT,
+    ZHA_GW_MSG_STARTUP_REPORT,
     RadioType,
 )
-from zha.application.helpers import DeviceAvailabilityChecker, GlobalUpdater, ZHAData
+from zha.application.counters import CounterCollector
+from zha.application.helpers import (
+    DeviceAvailabilityChecker,
+    GlobalUpdater,
+    StateChangeBatcher,
+    ZHAData,
+)
+from zha.application.platforms import BaseEntity, DeferredEntity, PlatformEntity
+from zha.application.startup import (
+    DEFAULT_SLOWEST_DEVICES,
+    DeviceStartupStage,
+    StartupPhase,
+    StartupReport,
+    StartupReportEvent,
+    StartupTimer,
+)
 from zha.async_ import (
     AsyncUtilMixin,
     create_eager_task,
     gather_with_limited_concurrency,
 )
 from zha.event import EventBase
+from zha.liveness import LivenessEngine
+from zha.poll_scheduler import PollScheduler
+from zha.request_scheduler import RequestPriority, RequestScheduler, request_priority
+from zha.zigbee.bulk_configuration import BulkConfiguration, BulkConfigurationSummary
 from zha.zigbee.device import Device, DeviceInfo, DeviceStatus, ExtendedDeviceInfo
 from zha.zigbee.group import Group, GroupInfo, GroupMemberReference
 
@@ -166,6 +189,20 @@ class DeviceRemovedEvent:
     event: Final[str] = ZHA_GW_MSG_DEVICE_REMOVED
 
 
+def _read_snapshot(path: str) -> Any:
+    """Read a discovery snapshot."""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _write_snapshot(path: str, data: str) -> None:
+    """Replace a discovery snapshot, without leaving a partial file behind."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        file.write(data)
+    os.replace(temp_path, path)
+
+
 class Gateway(AsyncUtilMixin, EventBase):
     """Gateway that handles events that happen on the ZHA Zigbee network."""
 
@@ -181,10 +218,16 @@ class Gateway(AsyncUtilMixin, EventBase):
         self.shutting_down: bool = False
         self._reload_task: asyncio.Task | None = None
 
+        self.poll_scheduler: PollScheduler = PollScheduler(self)
+        self.request_scheduler: RequestScheduler = RequestScheduler(self)
         self.global_updater: GlobalUpdater = GlobalUpdater(self)
+        self.counter_collector: CounterCollector = CounterCollector(self)
         self._device_availability_checker: DeviceAvailabilityChecker = (
             DeviceAvailabilityChecker(self)
         )
+        self.liveness: LivenessEngine = LivenessEngine(self)
+        self.state_change_batcher: StateChangeBatcher = StateChangeBatcher(self)
+        self.startup_timer: StartupTimer = StartupTimer()
         self.config.gateway = self
 
     @property
@@ -219,24 +262,27 @@ class Gateway(AsyncUtilMixin, EventBase):
     async def async_from_config(cls, config: ZHAData) -> Self:
         """Create an instance of a gateway from config objects."""
         instance = cls(config)
+        instance.startup_timer.start()
 
         if config.config.quirks_configuration.enabled:
-            for quirk in UNBUILT_QUIRK_BUILDERS:
-                # v2 quirks with no manufacturer model metadata explicitly do not call
-                # add_to_registry. They are used to share code between v2 quirks.
-                if quirk.manufacturer_model_metadata:
-                    _LOGGER.warning(
-                        "Found a v2 quirk that was not added to the registry: %s",
-                        quirk,
-                    )
-                    quirk.add_to_registry()
+            with instance.startup_timer.phase(StartupPhase.LOAD_QUIRKS):
+                for quirk in UNBUILT_QUIRK_BUILDERS:
+                    # v2 quirks with no manufacturer model metadata explicitly do
+                    # not call add_to_registry. They are used to share code between
+                    # v2 quirks.
+                    if quirk.manufacturer_model_metadata:
+                        _LOGGER.warning(
+                            "Found a v2 quirk that was not added to the registry: %s",
+                            quirk,
+                        )
+                        quirk.add_to_registry()
 
-            UNBUILT_QUIRK_BUILDERS.clear()
+                UNBUILT_QUIRK_BUILDERS.clear()
 
-            await instance.async_add_executor_job(
-                setup_quirks,
-                instance.config.config.quirks_configuration.custom_quirks_path,
-            )
+                await instance.async_add_executor_job(
+                    setup_quirks,
+                    instance.config.config.quirks_configuration.custom_quirks_path,
+                )
 
         return instance
 
@@ -245,29 +291,65 @@ class Gateway(AsyncUtilMixin, EventBase):
         discovery.DEVICE_PROBE.initialize(self)
         discovery.ENDPOINT_PROBE.initialize(self)
         discovery.GROUP_PROBE.initialize(self)
+        await self._async_restore_discovery_snapshot()
 
         self.shutting_down = False
+        self.startup_timer.start()
 
         app_controller_cls, app_config = self.get_application_controller_data()
-        self.application_controller = await app_controller_cls.new(
-            config=app_config,
-            auto_form=False,
-            start_radio=False,
-        )
+        with self.startup_timer.phase(StartupPhase.RADIO_STARTUP):
+            self.application_controller = await app_controller_cls.new(
+                config=app_config,
+                auto_form=False,
+                start_radio=False,
+            )
 
-        await self.application_controller.startup(auto_form=True)
+            await self.application_controller.startup(auto_form=True)
 
         self.coordinator_zha_device = self.get_or_create_device(
             self._find_coordinator_device()
         )
 
-        self.load_devices()
-        self.load_groups()
+        with self.startup_timer.phase(StartupPhase.LOAD_DEVICES):
+            self.load_devices()
+        with self.startup_timer.phase(StartupPhase.LOAD_GROUPS):
+            self.load_groups()
 
         self.application_controller.add_listener(self)
         self.application_controller.groups.add_listener(self)
+        self.poll_scheduler.start()
         self.global_updater.start()
+        self.liveness.start()
         self._device_availability_checker.start()
+        await self._async_save_discovery_snapshot()
+
+    async def _async_restore_discovery_snapshot(self) -> None:
+        """Restore the discovery plans saved after the previous startup."""
+        if (path := self.config.config.discovery_snapshot_options.path) is None:
+            return
+        try:
+            snapshot = await self.async_add_executor_job(_read_snapshot, path)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            _LOGGER.warning("Failed to read discovery snapshot %s: %s", path, exc)
+            return
+        if isinstance(snapshot, dict) and discovery.ENDPOINT_PROBE.restore(snapshot):
+            _LOGGER.debug("Restored discovery snapshot %s", path)
+
+    async def _async_save_discovery_snapshot(self) -> None:
+        """Save the discovery plans of this startup for the next one."""
+        if (path := self.config.config.discovery_snapshot_options.path) is None:
+            return
+        _LOGGER.debug(
+            "Discovery of %s endpoint signatures was restored from the snapshot",
+            discovery.ENDPOINT_PROBE.restored_plans,
+        )
+        data = json.dumps(discovery.ENDPOINT_PROBE.snapshot(), separators=(",", ":"))
+        try:
+            await self.async_add_executor_job(_write_snapshot, path, data)
+        except OSError as exc:
+            _LOGGER.warning("Failed to write discovery snapshot %s: %s", path, exc)
 
     async def async_initialize(self) -> None:
         """Initialize controller and connect radio."""
@@ -314,7 +396,8 @@ class Gateway(AsyncUtilMixin, EventBase):
                 delta_msg,
                 zha_device.consider_unavailable_time,
             )
-        self.create_platform_entities()
+        with self.startup_timer.phase(StartupPhase.CREATE_PLATFORM_ENTITIES):
+            self.create_platform_entities()
 
     def load_groups(self) -> None:
         """Initialize ZHA groups."""
@@ -329,9 +412,19 @@ class Gateway(AsyncUtilMixin, EventBase):
     def create_platform_entities(self) -> None:
         """Create platform entities."""
 
+        changed_devices: set[EUI64] = set()
         for platform in discovery.PLATFORMS:
             for platform_entity_class, args, kw_args in self.config.platforms[platform]:
                 try:
+                    if (
+                        deferred := self._defer_platform_entity(
+                            platform_entity_class, args, kw_args
+                        )
+                    ) is not None:
+                        _LOGGER.debug(
+                            "Deferred creating platform entity: %s", deferred.unique_id
+                        )
+                        continue
                     platform_entity = platform_entity_class.create_platform_entity(
                         *args, **kw_args
                     )
@@ -343,11 +436,37 @@ class Gateway(AsyncUtilMixin, EventBase):
                         kw_args,
                     )
                     continue
-                if platform_entity:
+                if isinstance(platform_entity, PlatformEntity):
+                    changed_devices.add(platform_entity.device.ieee)
+                # Info objects are cached, only build them when they are logged
+                if platform_entity and _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug(
                         "Platform entity data: %s", platform_entity.info_object
                     )
             self.config.platforms[platform].clear()
+        self._update_member_entities(changed_devices)
+
+    @staticmethod
+    def _defer_platform_entity(
+        platform_entity_class: type[BaseEntity],
+        args: tuple[Any, ...],
+        kw_args: dict[str, Any],
+    ) -> DeferredEntity | None:
+        """Register a descriptor instead of an entity that is disabled by default."""
+        if platform_entity_class._attr_entity_registry_enabled_default:  # pylint: disable=protected-access
+            return None
+        deferred = platform_entity_class._defer(*args, **kw_args)  # pylint: disable=protected-access
+        if deferred is not None:
+            deferred.device.defer_entity(deferred)
+        return deferred
+
+    def _update_member_entities(self, devices: set[EUI64]) -> None:
+        """Update the member entities of the groups the devices are members of."""
+        if not devices:
+            return
+        for group in self._groups.values():
+            if any(ieee in devices for ieee, _ in group.zigpy_group.members):
+                group.update_entity_subscriptions()
 
     @property
     def radio_concurrency(self) -> int:
@@ -375,10 +494,14 @@ class Gateway(AsyncUtilMixin, EventBase):
         # Make sure that we always leave slots for non-startup requests
         max_poll_concurrency = max(1, self.radio_concurrency - 4)
 
-        await gather_with_limited_concurrency(
-            max_poll_concurrency,
-            *(dev.async_initialize(from_cache=False) for dev in online_devices),
-        )
+        with (
+            self.startup_timer.phase(StartupPhase.MAINS_POLLING),
+            request_priority(RequestPriority.POLLING),
+        ):
+            await gather_with_limited_concurrency(
+                max_poll_concurrency,
+                *(self._async_timed_refresh(dev) for dev in online_devices),
+            )
 
         _LOGGER.debug("completed fetching current state for mains powered devices")
 
@@ -386,9 +509,12 @@ class Gateway(AsyncUtilMixin, EventBase):
         """Initialize devices and load entities."""
 
         _LOGGER.debug("Initializing all devices from Zigpy cache")
-        await asyncio.gather(
-            *(dev.async_initialize(from_cache=True) for dev in self.devices.values())
-        )
+        with self.startup_timer.phase(StartupPhase.INITIALIZE_FROM_CACHE):
+            for dev in self.devices.values():
+                with self.startup_timer.device(
+                    dev.device, DeviceStartupStage.INITIALIZE
+                ):
+                    dev.initialize_from_cache()
 
         async def fetch_updated_state() -> None:
             """Fetch updated state for mains powered devices."""
@@ -399,11 +525,23 @@ class Gateway(AsyncUtilMixin, EventBase):
             _LOGGER.debug("Allowing polled requests")
             self.config.allow_polling = True
 
+            if (report := self.startup_timer.finish()) is not None:
+                self.emit(ZHA_GW_MSG_STARTUP_REPORT, StartupReportEvent(report=report))
+
         # background the fetching of state for mains powered devices
         self.async_create_background_task(
             fetch_updated_state(), "zha.gateway-fetch_updated_state"
         )
 
+    async def _async_timed_refresh(self, device: Device) -> None:
+        """Refresh a device, recording how long it took during startup."""
+        with self.startup_timer.device(device.device, DeviceStartupStage.REFRESH):
+            await device.async_initialize(from_cache=False)
+
+    def startup_report(self, slowest: int = DEFAULT_SLOWEST_DEVICES) -> StartupReport:
+        """Return the timings of the last startup, listing the slowest devices."""
+        return self.startup_timer.report(slowest)
+
     def device_joined(self, device: zigpy.device.Device) -> None:
         """Handle device joined.
 
@@ -522,6 +660,9 @@ class Gateway(AsyncUtilMixin, EventBase):
         _LOGGER.info("Removing device %s - %s", device.ieee, f"0x{device.nwk:04x}")
         zha_device = self._devices.pop(device.ieee, None)
         if zha_device is not None:
+            self._device_availability_checker.untrack(zha_device)
+            self.liveness.detach(zha_device)
+            self._update_member_entities({device.ieee})
             device_info = zha_device.extended_device_info
             self.track_task(
                 create_eager_task(
@@ -565,8 +706,11 @@ class Gateway(AsyncUtilMixin, EventBase):
     def get_or_create_device(self, zigpy_device: zigpy.device.Device) -> Device:
         """Get or create a ZHA device."""
         if (zha_device := self._devices.get(zigpy_device.ieee)) is None:
-            zha_device = Device.new(zigpy_device, self)
+            with self.startup_timer.device(zigpy_device, DeviceStartupStage.DISCOVERY):
+                zha_device = Device.new(zigpy_device, self)
             self._devices[zigpy_device.ieee] = zha_device
+            self._device_availability_checker.track(zha_device)
+            self.liveness.attach(zha_device)
         return zha_device
 
     def get_or_create_group(self, zigpy_group: zigpy.group.Group) -> Group:
@@ -588,6 +732,7 @@ class Gateway(AsyncUtilMixin, EventBase):
             # avoid a race condition during new joins
             if device.status is DeviceStatus.INITIALIZED:
                 device.update_available(available)
+                self._device_availability_checker.track(device)
 
     async def async_device_initialized(self, device: zigpy.device.Device) -> None:
         """Handle device joined and basic information discovered (async)."""
@@ -628,12 +773,14 @@ class Gateway(AsyncUtilMixin, EventBase):
     async def _async_device_joined(self, zha_device: Device) -> None:
         zha_device.available = True
         zha_device.on_network = True
+        self._device_availability_checker.track(zha_device)
         await zha_device.async_configure()
         device_info = ExtendedDeviceInfoWithPairingStatus(
             pairing_status=DevicePairingStatus.CONFIGURED,
             **zha_device.extended_device_info.__dict__,
         )
-        await zha_device.async_initialize(from_cache=False)
+        with request_priority(RequestPriority.CONFIGURATION):
+            await zha_device.async_initialize(from_cache=False)
         self.create_platform_entities()
         self.emit(
             ZHA_GW_MSG_DEVICE_FULL_INIT,
@@ -661,6 +808,19 @@ class Gateway(AsyncUtilMixin, EventBase):
         zha_device.available = False
         zha_device.on_network = True
 
+    async def async_configure_devices(
+        self, devices: Iterable[Device] | None = None
+    ) -> BulkConfigurationSummary:
+        """Reconfigure many devices under a shared budget, all by default.
+
+        Progress is reported with `ZHA_GW_MSG_BULK_CONFIGURATION_PROGRESS` events.
+        """
+        if devices is None:
+            devices = [
+                device for device in self._devices.values() if not device.is_coordinator
+            ]
+        return await BulkConfiguration(self, devices).run()
+
     async def async_create_zigpy_group(
         self,
         name: str,
@@ -735,9 +895,12 @@ class Gateway(AsyncUtilMixin, EventBase):
             return
 
         self.shutting_down = True
+        self.startup_timer.cancel()
 
         self.global_updater.stop()
         self._device_availability_checker.stop()
+        self.liveness.stop()
+        self.state_change_batcher.stop()
 
         for device in self._devices.values():
             await device.on_remove()
@@ -745,6 +908,8 @@ class Gateway(AsyncUtilMixin, EventBase):
         for group in self._groups.values():
             await group.on_remove()
 
+        self.poll_scheduler.stop()
+
         _LOGGER.debug("Shutting down ZHA ControllerApplication")
         if self.application_controller is not None:
             await self.application_controller.shutdown()
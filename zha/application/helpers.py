@@ -12,8 +12,13 @@ import dataclasses
 from dataclasses import dataclass
 import datetime
 import enum
+import heapq
+import itertools
 import logging
+import math
+import random
 import re
+import time
 from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
 
 import voluptuous as vol
@@ -32,10 +37,13 @@ from zha.application.const import (
     CONF_DEFAULT_CONSIDER_UNAVAILABLE_MAINS,
 )
 from zha.async_ import gather_with_limited_concurrency
+from zha.const import STATE_CHANGED_BATCH
 from zha.decorators import periodic
 
 if TYPE_CHECKING:
     from zha.application.gateway import Gateway
+    from zha.application.platforms import BaseIdentifiers
+    from zha.poll_scheduler import PollJob
     from zha.zigbee.cluster_handlers import ClusterHandler
     from zha.zigbee.device import Device
 
@@ -318,6 +326,14 @@ class DeviceOptions:
         default=CONF_DEFAULT_CONSIDER_UNAVAILABLE_BATTERY
     )
     enable_mains_startup_polling: bool = dataclasses.field(default=True)
+    # Poll sooner while polled values change and back off while they are flat
+    enable_adaptive_polling: bool = dataclasses.field(default=False)
+    adaptive_polling_min_interval: int = dataclasses.field(default=10)
+    adaptive_polling_max_interval: int = dataclasses.field(default=300)
+    # Relative change of a polled value that counts as volatile
+    adaptive_polling_threshold: float = dataclasses.field(default=0.05)
+    # Create entities that are disabled by default only once they are used
+    defer_disabled_entities: bool = dataclasses.field(default=False)
 
 
 @dataclass(kw_only=True, slots=True)
@@ -329,6 +345,47 @@ class AlarmControlPanelOptions:
     arm_requires_code: bool = dataclasses.field(default=False)
 
 
+@dataclass(kw_only=True, slots=True)
+class StateChangeBatchOptions:
+    """ZHA coalesced entity state change options."""
+
+    enabled: bool = dataclasses.field(default=False)
+    # Seconds to collect changes for, flush on the next loop iteration if 0
+    window: float = dataclasses.field(default=0)
+
+
+@dataclass(kw_only=True, slots=True)
+class LivenessOptions:
+    """ZHA passive liveness inference options."""
+
+    enabled: bool = dataclasses.field(default=False)
+    # Minimum LQI of a neighbor table entry to count as evidence
+    min_lqi: int = dataclasses.field(default=50)
+    # Availability pings sent per minute across all devices, must be positive
+    pings_per_minute: int = dataclasses.field(default=10)
+
+
+@dataclass(kw_only=True, slots=True)
+class BulkConfigurationOptions:
+    """ZHA bulk device configuration options."""
+
+    # Devices configured at once
+    max_concurrency: int = dataclasses.field(default=4)
+    # Airtime budget shared by all devices, must be positive
+    requests_per_second: float = dataclasses.field(default=5)
+    # Rounds of retrying failed steps and the seconds to wait before each
+    retries: int = dataclasses.field(default=2)
+    retry_delay: float = dataclasses.field(default=30)
+
+
+@dataclass(kw_only=True, slots=True)
+class DiscoverySnapshotOptions:
+    """ZHA discovery snapshot options."""
+
+    # File discovery plans are restored from on startup and saved to after it
+    path: str | None = dataclasses.field(default=None)
+
+
 @dataclass(kw_only=True, slots=True)
 class CoordinatorConfiguration:
     """ZHA coordinator configuration."""
@@ -372,6 +429,18 @@ class ZHAConfiguration:
     alarm_control_panel_options: AlarmControlPanelOptions = dataclasses.field(
         default_factory=AlarmControlPanelOptions
     )
+    state_change_batch_options: StateChangeBatchOptions = dataclasses.field(
+        default_factory=StateChangeBatchOptions
+    )
+    liveness_options: LivenessOptions = dataclasses.field(
+        default_factory=LivenessOptions
+    )
+    bulk_configuration_options: BulkConfigurationOptions = dataclasses.field(
+        default_factory=BulkConfigurationOptions
+    )
+    discovery_snapshot_options: DiscoverySnapshotOptions = dataclasses.field(
+        default_factory=DiscoverySnapshotOptions
+    )
 
 
 @dataclasses.dataclass(kw_only=True, slots=True)
@@ -403,17 +472,15 @@ class GlobalUpdater:
 
     def __init__(self, gateway: Gateway):
         """Initialize the GlobalUpdater."""
-        self._updater_task_handle: asyncio.Task = None
+        self._updater_job: PollJob | None = None
         self._update_listeners: list[Callable] = []
         self._gateway: Gateway = gateway
 
     def start(self):
         """Start the global updater."""
-        self._updater_task_handle = self._gateway.async_create_background_task(
-            self.update_listeners(),
+        self._updater_job = self._gateway.poll_scheduler.register_periodic(
+            self.update_listeners,
             name=f"global-updater_{self.__class__.__name__}",
-            eager_start=True,
-            untracked=True,
         )
         _LOGGER.debug(
             "started global updater with an interval of %s seconds",
@@ -423,9 +490,9 @@ class GlobalUpdater:
     def stop(self):
         """Stop the global updater."""
         _LOGGER.debug("stopping global updater")
-        if self._updater_task_handle:
-            self._updater_task_handle.cancel()
-            self._updater_task_handle = None
+        if self._updater_job:
+            self._updater_job.cancel()
+            self._updater_job = None
         _LOGGER.debug("global updater stopped")
 
     def register_update_listener(self, listener: Callable):
@@ -462,54 +529,205 @@ class GlobalUpdater:
 
 
 class DeviceAvailabilityChecker:
-    """Device availability checker for ZHA."""
+    """Device availability checker for ZHA.
+
+    Every device has an expiry deadline, `last_seen + consider_unavailable_time`,
+    kept in a heap and a single timer is armed for the earliest one. Only devices
+    whose deadline passed are checked. Incoming messages update `last_seen`, so an
+    expired device that was seen in the meantime is re-armed at its new deadline.
+    Evidence from the liveness engine counts as the device being seen.
+    Devices that are overdue or unavailable are checked again every checkin
+    interval, which also paces the ping attempts.
+    """
 
     _REFRESH_INTERVAL = (30, 45)
-    __polling_interval: int
+    # most devices will not make remote calls
+    _MAX_CONCURRENT_CHECKS = 20
 
     def __init__(self, gateway: Gateway):
         """Initialize the DeviceAvailabilityChecker."""
         self._gateway: Gateway = gateway
-        self._device_availability_task_handle: asyncio.Task = None
+        self.checkin_interval: int = random.randint(*self._REFRESH_INTERVAL)
+        self._heap: list[tuple[int, int, zigpy.types.EUI64]] = []
+        self._sequence = itertools.count()
+        self._deadlines: dict[zigpy.types.EUI64, int] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._started: bool = False
 
     def start(self):
         """Start the device availability checker."""
-        self._device_availability_task_handle = (
-            self._gateway.async_create_background_task(
-                self.check_device_availability(),
-                name=f"device-availability-checker_{self.__class__.__name__}",
-                eager_start=True,
-                untracked=True,
-            )
-        )
+        self._started = True
+        for device in self._gateway.devices.values():
+            self.track(device)
+        self._arm()
         _LOGGER.debug(
-            "started device availability checker with an interval of %s seconds",
-            getattr(self, "__polling_interval"),
+            "started device availability checker for %s devices with a checkin"
+            " interval of %s seconds",
+            len(self._deadlines),
+            self.checkin_interval,
         )
 
     def stop(self):
         """Stop the device availability checker."""
         _LOGGER.debug("stopping device availability checker")
-        if self._device_availability_task_handle:
-            self._device_availability_task_handle.cancel()
-            self._device_availability_task_handle = None
+        self._started = False
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._heap.clear()
+        self._deadlines.clear()
         _LOGGER.debug("device availability checker stopped")
 
-    @periodic(_REFRESH_INTERVAL)
-    async def check_device_availability(self):
-        """Check device availability."""
-        _LOGGER.debug("Device availability checker interval starting")
-        if self._gateway.config.allow_polling:
-            _LOGGER.debug("Checking device availability")
-            # 20 because most devices will not make remote calls
-            await gather_with_limited_concurrency(
-                20,
-                *(
-                    dev._check_available()
-                    for dev in self._gateway.devices.values()
-                    if not dev.is_coordinator
-                ),
+    def deadline(self, device: Device) -> int | None:
+        """Return the loop time of the next check of a device, if scheduled."""
+        return self._deadlines.get(device.ieee)
+
+    def track(self, device: Device) -> None:
+        """Schedule the next availability check of a device."""
+        if not self._started or device.is_coordinator:
+            return
+        last_seen = device.last_seen
+        liveness = self._gateway.liveness
+        if liveness.enabled and (evidence := liveness.last_evidence(device)):
+            last_seen = max(last_seen or evidence, evidence)
+        remaining = 0.0
+        if device.available and last_seen is not None:
+            remaining = last_seen + device.consider_unavailable_time - time.time()
+        if remaining <= 0:
+            remaining = self.checkin_interval
+        # Whole seconds are precise enough and let devices seen within the same
+        # second share a single wakeup
+        deadline = math.ceil(self._gateway.loop.time() + remaining)
+        self._deadlines[device.ieee] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._sequence), device.ieee))
+        self._arm()
+
+    def untrack(self, device: Device) -> None:
+        """Stop checking the availability of a device."""
+        self._deadlines.pop(device.ieee, None)
+
+    def _arm(self) -> None:
+        """Arm the timer for the earliest live deadline."""
+        heap = self._heap
+        # Entries of removed or rescheduled devices are dropped lazily
+        while heap and self._deadlines.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+
+        if not self._started or not heap:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            return
+
+        deadline = heap[0][0]
+        if self._timer is not None:
+            if self._timer.when() == deadline:
+                return
+            self._timer.cancel()
+        self._timer = self._gateway.loop.call_at(deadline, self._run_due)
+
+    def _run_due(self) -> None:
+        """Check the devices whose deadline passed."""
+        # The loop may run a timer up to one clock resolution early
+        now = self._gateway.loop.time()
+        if self._timer is not None:
+            now = max(now, self._timer.when())
+            self._timer = None
+
+        heap = self._heap
+        due: list[Device] = []
+        while heap and heap[0][0] <= now:
+            deadline, _, ieee = heapq.heappop(heap)
+            if self._deadlines.get(ieee) != deadline:
+                continue
+            del self._deadlines[ieee]
+            if (device := self._gateway.devices.get(ieee)) is not None:
+                due.append(device)
+
+        if due and not self._gateway.config.allow_polling:
+            _LOGGER.debug("Device availability check skipped")
+            for device in due:
+                self.track(device)
+        elif due:
+            self._gateway.async_create_background_task(
+                self.check_device_availability(due),
+                name=f"device-availability-checker_{self.__class__.__name__}",
+                eager_start=True,
+            )
+        # Checked devices are tracked again once their check finishes, the other
+        # devices must not wait for that
+        self._arm()
+
+    async def check_device_availability(self, devices: list[Device]) -> None:
+        """Check the availability of the given devices and reschedule them."""
+        _LOGGER.debug("Checking the availability of %s devices", len(devices))
+        await gather_with_limited_concurrency(
+            self._MAX_CONCURRENT_CHECKS,
+            *(self._check_device(device) for device in devices),
+        )
+
+    async def _check_device(self, device: Device) -> None:
+        """Check the availability of a device and schedule its next check."""
+        try:
+            await device._check_available()
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.warning(
+                "Failed to check the availability of %s", device.ieee, exc_info=ex
             )
-            _LOGGER.debug("Device availability checker interval finished")
+        if device.ieee in self._gateway.devices:
+            self.track(device)
+
+
+class StateChangeBatcher:
+    """Coalesce entity state changes into batched gateway events.
+
+    When enabled, every entity state change is collected and a single
+    `STATE_CHANGED_BATCH` event is emitted by the gateway per flush. Repeated
+    changes to the same entity within a flush are merged into its latest state.
+    """
+
+    def __init__(self, gateway: Gateway):
+        """Initialize the StateChangeBatcher."""
+        self._gateway: Gateway = gateway
+        self._pending: dict[BaseIdentifiers, dict[str, Any]] = {}
+        self._flush_handle: asyncio.TimerHandle | asyncio.Handle | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether state change batching is enabled."""
+        return self._gateway.config.config.state_change_batch_options.enabled
+
+    def add(self, identifiers: BaseIdentifiers, state: dict[str, Any]) -> None:
+        """Queue the latest state of an entity for the next batch."""
+        if not self.enabled:
+            return
+        self._pending[identifiers] = state
+        if self._flush_handle is not None:
+            return
+        window = self._gateway.config.config.state_change_batch_options.window
+        if window > 0:
+            self._flush_handle = self._gateway.loop.call_later(window, self.flush)
         else:
-            _LOGGER.debug("Device availability checker interval skipped")
+            self._flush_handle = self._gateway.loop.call_soon(self.flush)
+
+    def flush(self) -> None:
+        """Emit all pending state changes as a single batch."""
+        # pylint: disable=import-outside-toplevel
+        from zha.application.platforms import EntityStateChangedBatchEvent
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        changes, self._pending = self._pending, {}
+        self._gateway.emit(
+            STATE_CHANGED_BATCH, EntityStateChangedBatchEvent(changes=changes)
+        )
+
+    def stop(self) -> None:
+        """Stop the batcher and drop any pending changes."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending.clear()
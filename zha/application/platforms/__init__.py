@@ -4,24 +4,28 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
+from collections.abc import Callable
 from contextlib import suppress
 import dataclasses
 from enum import StrEnum
+import functools
 from functools import cached_property
 import logging
+import operator
 from typing import TYPE_CHECKING, Any, Final, Optional, final
 
 from zigpy.quirks.v2 import EntityMetadata, EntityType
 from zigpy.types.named import EUI64
 
 from zha.application import Platform
-from zha.const import STATE_CHANGED
+from zha.const import STATE_CHANGED, STATE_CHANGED_BATCH
 from zha.debounce import Debouncer
 from zha.event import EventBase
 from zha.mixins import LogMixin
 from zha.zigbee.cluster_handlers import ClusterHandlerInfo
 
 if TYPE_CHECKING:
+    from zha.application.gateway import Gateway
     from zha.zigbee.cluster_handlers import ClusterHandler
     from zha.zigbee.device import Device
     from zha.zigbee.endpoint import Endpoint
@@ -29,6 +33,7 @@ if TYPE_CHECKING:
 
 
 _LOGGER = logging.getLogger(__name__)
+_ATTRIBUTE_UPDATES = operator.attrgetter("attribute_updates")
 
 DEFAULT_UPDATE_GROUP_FROM_CHILD_DELAY: float = 0.5
 
@@ -105,6 +110,78 @@ class EntityStateChangedEvent:
     group_id: Optional[int] = None
 
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class EntityStateChangedBatchEvent:
+    """Event for a batch of coalesced entity state changes."""
+
+    event_type: Final[str] = "entity"
+    event: Final[str] = STATE_CHANGED_BATCH
+    # Latest state of every entity that changed, keyed by its identifiers
+    changes: dict[BaseIdentifiers, dict[str, Any]]
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class DeferredEntity:
+    """Descriptor of an entity that is disabled by default and not created yet.
+
+    With `DeviceOptions.defer_disabled_entities` set, the gateway registers these
+    on the device instead of creating entities that are disabled by default. The
+    entity is created the first time it is enabled or looked up on its device.
+    The support checks of the entity factory only run then, so the descriptor of
+    an unsupported entity creates nothing.
+    """
+
+    entity_class: type[BaseEntity]
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    device: Device
+    unique_id: str
+
+    @property
+    def platform(self) -> Platform:
+        """Return the platform of the entity."""
+        return self.entity_class.PLATFORM
+
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        """Return if the entity is enabled by default."""
+        return self.entity_class._attr_entity_registry_enabled_default  # pylint: disable=protected-access
+
+    def create(self) -> BaseEntity | None:
+        """Create the entity, which replaces this descriptor on its device."""
+        return self.device.create_deferred_entity(self.platform, self.unique_id)
+
+    def enable(self) -> BaseEntity | None:
+        """Create and enable the entity."""
+        if (entity := self.create()) is not None:
+            entity.enable()
+        return entity
+
+
+def cached_state(
+    fget: Callable[[BaseEntity], dict[str, Any]],
+) -> Callable[[BaseEntity], dict[str, Any]]:
+    """Cache the state dict of an entity until its `_state_snapshot_key` changes.
+
+    The key must change with every input of the state. The cached dict is shared
+    by all readers and must not be mutated. Only the outermost `state` property of
+    an entity is cached, so overrides that are not decorated themselves, and the
+    `super().state` calls made while building the state, get fresh dicts.
+    """
+
+    @functools.wraps(fget)
+    def state(self: BaseEntity) -> dict[str, Any]:
+        if type(self).state.fget is not state:  # type: ignore[attr-defined]
+            return fget(self)
+
+        key = self._state_snapshot_key()
+        if (snapshot := self._state_snapshot) is None or snapshot[0] != key:
+            snapshot = self._state_snapshot = (key, fget(self))
+        return snapshot[1]
+
+    return state
+
+
 class BaseEntity(LogMixin, EventBase):
     """Base class for entities."""
 
@@ -118,6 +195,19 @@ class BaseEntity(LogMixin, EventBase):
     _attr_state_class: str | None
     _attr_enabled: bool = True
 
+    # Key the `cached_state` snapshot was built for and the snapshot itself
+    _state_snapshot: tuple[Any, dict[str, Any]] | None = None
+
+    @classmethod
+    def _defer(cls, *args: Any, **kwargs: Any) -> DeferredEntity | None:
+        """Return a descriptor if creating the entity should be deferred."""
+        return None
+
+    @classmethod
+    def _create_deferred(cls, deferred: DeferredEntity) -> BaseEntity | None:
+        """Create the entity described by a deferred entity descriptor."""
+        return cls(*deferred.args, **deferred.kwargs)
+
     def __init__(self, unique_id: str) -> None:
         """Initialize the platform entity."""
         super().__init__()
@@ -228,6 +318,10 @@ class BaseEntity(LogMixin, EventBase):
             "class_name": self.__class__.__name__,
         }
 
+    def _state_snapshot_key(self) -> Any:
+        """Return a value that changes whenever the state changes."""
+        return None
+
     @cached_property
     def extra_state_attribute_names(self) -> set[str] | None:
         """Return entity specific state attribute names.
@@ -260,17 +354,25 @@ class BaseEntity(LogMixin, EventBase):
         with suppress(asyncio.CancelledError):
             await asyncio.gather(*tasks, return_exceptions=True)
 
+    @property
+    @abstractmethod
+    def gateway(self) -> Gateway:
+        """Return the gateway this entity belongs to."""
+
     def maybe_emit_state_changed_event(self) -> None:
         """Send the state of this platform entity."""
         state = self.state
-        if self.__previous_state != state:
+        if state is not self.__previous_state and self.__previous_state != state:
             self.emit(
                 STATE_CHANGED, EntityStateChangedEvent(**self.identifiers.__dict__)
             )
             self.__previous_state = state
+            self.gateway.state_change_batcher.add(self.identifiers, state)
 
     def log(self, level: int, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log a message."""
+        if not _LOGGER.isEnabledFor(level):
+            return
         msg = f"%s: {msg}"
         args = (self._unique_id,) + args
         _LOGGER.log(level, msg, *args, **kwargs)
@@ -335,6 +437,40 @@ class PlatformEntity(BaseEntity):
         """
         return cls(unique_id, cluster_handlers, endpoint, device, **kwargs)
 
+    @classmethod
+    def _defer(
+        cls,
+        unique_id: str,
+        cluster_handlers: list[ClusterHandler],
+        endpoint: Endpoint,
+        device: Device,
+        entity_metadata: EntityMetadata | None = None,
+        **kwargs: Any,
+    ) -> DeferredEntity | None:
+        """Return a descriptor if creating the entity should be deferred."""
+        # Quirks metadata can change the unique id, so those are created right away
+        if (
+            entity_metadata is not None
+            or not device.gateway.config.config.device_options.defer_disabled_entities
+        ):
+            return None
+        return DeferredEntity(
+            entity_class=cls,
+            args=(unique_id, cluster_handlers, endpoint, device),
+            kwargs=kwargs,
+            device=device,
+            unique_id=(
+                f"{unique_id}-{cls._unique_id_suffix}"
+                if cls._unique_id_suffix
+                else unique_id
+            ),
+        )
+
+    @classmethod
+    def _create_deferred(cls, deferred: DeferredEntity) -> BaseEntity | None:
+        """Create the entity described by a deferred entity descriptor, if supported."""
+        return cls.create_platform_entity(*deferred.args, **deferred.kwargs)
+
     def _init_from_quirks_metadata(self, entity_metadata: EntityMetadata) -> None:
         """Init this entity from the quirks metadata."""
         if entity_metadata.initially_disabled:
@@ -388,6 +524,11 @@ class PlatformEntity(BaseEntity):
         """Return the device."""
         return self._device
 
+    @property
+    def gateway(self) -> Gateway:
+        """Return the gateway this entity belongs to."""
+        return self._device.gateway
+
     @property
     def endpoint(self) -> Endpoint:
         """Return the endpoint."""
@@ -403,6 +544,17 @@ class PlatformEntity(BaseEntity):
         """Return true if the device this entity belongs to is available."""
         return self.device.available
 
+    def _state_snapshot_key(self) -> Any:
+        """Rebuild the state when the device availability or any attribute changes.
+
+        State properties may read any attribute of the cluster handlers, not only
+        the ones the entity signals state changes for.
+        """
+        return (
+            self._device.available,
+            sum(map(_ATTRIBUTE_UPDATES, self._cluster_handlers)),
+        )
+
     @property
     def state(self) -> dict[str, Any]:
         """Return the arguments to use in the command."""
@@ -486,6 +638,11 @@ class GroupEntity(BaseEntity):
         """Return the group."""
         return self._group
 
+    @property
+    def gateway(self) -> Gateway:
+        """Return the gateway this entity belongs to."""
+        return self._group.gateway
+
     def debounced_update(self, _: Any | None = None) -> None:
         """Debounce updating group entity from member entity updates."""
         # Delay to ensure that we get updates from all members before updating the group entity
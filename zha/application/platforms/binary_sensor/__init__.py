@@ -11,7 +11,12 @@ from zhaquirks.quirk_ids import DANFOSS_ALLY_THERMOSTAT
 from zigpy.quirks.v2 import BinarySensorMetadata
 
 from zha.application import Platform
-from zha.application.platforms import BaseEntityInfo, EntityCategory, PlatformEntity
+from zha.application.platforms import (
+    BaseEntityInfo,
+    EntityCategory,
+    PlatformEntity,
+    cached_state,
+)
 from zha.application.platforms.binary_sensor.const import (
     IAS_ZONE_CLASS_MAPPING,
     BinarySensorDeviceClass,
@@ -99,6 +104,7 @@ class BinarySensor(PlatformEntity):
         )
 
     @property
+    @cached_state
     def state(self) -> dict:
         """Return the state of the binary sensor."""
         response = super().state
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from asyncio import Task
 from dataclasses import dataclass
 import datetime as dt
 import functools
@@ -11,7 +10,7 @@ from typing import TYPE_CHECKING, Any
 from zigpy.zcl.clusters.hvac import FanMode, RunningState, SystemMode
 
 from zha.application import Platform
-from zha.application.platforms import BaseEntityInfo, PlatformEntity
+from zha.application.platforms import BaseEntityInfo, PlatformEntity, cached_state
 from zha.application.platforms.climate.const import (
     ATTR_HVAC_MODE,
     ATTR_OCCP_COOL_SETPT,
@@ -48,6 +47,7 @@ from zha.zigbee.cluster_handlers.const import (
 )
 
 if TYPE_CHECKING:
+    from zha.poll_scheduler import PollJob
     from zha.zigbee.cluster_handlers import ClusterHandler
     from zha.zigbee.device import Device
     from zha.zigbee.endpoint import Endpoint
@@ -142,7 +142,12 @@ class Thermostat(PlatformEntity):
             hvac_modes=self.hvac_modes,
         )
 
+    def _state_snapshot_key(self) -> Any:
+        """Rebuild the state when an attribute or the preset changes."""
+        return (super()._state_snapshot_key(), self._preset)
+
     @property
+    @cached_state
     def state(self) -> dict[str, Any]:
         """Get the state of the lock."""
         thermostat = self._thermostat_cluster_handler
@@ -503,18 +508,20 @@ class SinopeTechnologiesThermostat(Thermostat):
         self._presets = [Preset.AWAY, Preset.NONE]
         self._supported_features |= ClimateEntityFeature.PRESET_MODE
         self._manufacturer_ch = self.cluster_handlers["sinope_manufacturer_specific"]
-        self._time_update_task: Task | None = None
+        self._time_update_job: PollJob | None = None
         self.start_polling()
 
     def start_polling(self) -> None:
         """Start polling."""
-        self._time_update_task = self.device.gateway.async_create_background_task(
-            self._update_time(),
-            name=f"sinope_time_updater_{self.unique_id}",
-            eager_start=True,
-            untracked=True,
-        )
-        self._tracked_tasks.append(self._time_update_task)
+        if self._time_update_job is None:
+            self._time_update_job = (
+                self.device.gateway.poll_scheduler.register_periodic(
+                    self._update_time, name=f"sinope_time_updater_{self.unique_id}"
+                )
+            )
+            self._tracked_handles.append(self._time_update_job)
+        else:
+            self._time_update_job.enable()
         self.debug(
             "started time updating interval of %s",
             getattr(self, "__polling_interval"),
@@ -528,10 +535,8 @@ class SinopeTechnologiesThermostat(Thermostat):
     def disable(self) -> None:
         """Disable the entity."""
         super().disable()
-        if self._time_update_task:
-            self._tracked_tasks.remove(self._time_update_task)
-            self._time_update_task.cancel()
-            self._time_update_task = None
+        if self._time_update_job:
+            self._time_update_job.disable()
 
     @periodic((2700, 4500))
     async def _update_time(self) -> None:
@@ -70,12 +70,9 @@ class DeviceScannerEntity(PlatformEntity):
             CLUSTER_HANDLER_ATTRIBUTE_UPDATED,
             self.handle_cluster_handler_attribute_updated,
         )
-        self._tracked_tasks.append(
-            device.gateway.async_create_background_task(
-                self._refresh(),
-                name=f"device_tracker_refresh_{self.unique_id}",
-                eager_start=True,
-                untracked=True,
+        self._tracked_handles.append(
+            device.gateway.poll_scheduler.register_periodic(
+                self._refresh, name=f"device_tracker_refresh_{self.unique_id}"
             )
         )
         self.debug(
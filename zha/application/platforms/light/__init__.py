@@ -6,13 +6,11 @@ from __future__ import annotations
 
 from abc import ABC
 import asyncio
-from collections import Counter
 from collections.abc import Callable
 import contextlib
 import dataclasses
 from dataclasses import dataclass
 import functools
-import itertools
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -24,13 +22,10 @@ from zha.application import Platform
 from zha.application.platforms import (
     BaseEntity,
     BaseEntityInfo,
+    EntityStateChangedEvent,
     GroupEntity,
     PlatformEntity,
-)
-from zha.application.platforms.helpers import (
-    find_state_attributes,
-    mean_tuple,
-    reduce_attribute,
+    cached_state,
 )
 from zha.application.platforms.light.const import (
     ASSUME_UPDATE_GROUP_FROM_CHILD_DELAY,
@@ -38,12 +33,7 @@ from zha.application.platforms.light.const import (
     ATTR_COLOR_MODE,
     ATTR_COLOR_TEMP,
     ATTR_EFFECT,
-    ATTR_EFFECT_LIST,
     ATTR_FLASH,
-    ATTR_MAX_MIREDS,
-    ATTR_MIN_MIREDS,
-    ATTR_SUPPORTED_COLOR_MODES,
-    ATTR_SUPPORTED_FEATURES,
     ATTR_TRANSITION,
     ATTR_XY_COLOR,
     DEFAULT_EXTRA_TRANSITION_DELAY_LONG,
@@ -59,6 +49,7 @@ from zha.application.platforms.light.const import (
     LightEntityFeature,
 )
 from zha.application.platforms.light.helpers import (
+    LightStateAggregate,
     brightness_supported,
     filter_supported_color_modes,
 )
@@ -76,6 +67,7 @@ from zha.zigbee.cluster_handlers.const import (
 from zha.zigbee.cluster_handlers.general import LevelChangeEvent
 
 if TYPE_CHECKING:
+    from zha.poll_scheduler import PollJob
     from zha.zigbee.cluster_handlers import ClusterHandler
     from zha.zigbee.device import Device
     from zha.zigbee.endpoint import Endpoint
@@ -733,7 +725,7 @@ class Light(PlatformEntity, BaseLight):
                 CLUSTER_HANDLER_LEVEL_CHANGED, self.handle_cluster_handler_set_level
             )
 
-        self._refresh_task: asyncio.Task | None = None
+        self._refresh_job: PollJob | None = None
         self.start_polling()
 
     @functools.cached_property
@@ -747,15 +739,38 @@ class Light(PlatformEntity, BaseLight):
             max_mireds=self.max_mireds,
         )
 
+    def _state_snapshot_key(self) -> Any:
+        """Rebuild the state when the availability or the light state changes.
+
+        The supported features, color modes and effects are fixed at creation.
+        """
+        return (
+            self._device.available,
+            self._state,
+            self._brightness,
+            self._xy_color,
+            self._color_temp,
+            self._color_mode,
+            self._effect,
+            self._off_with_transition,
+            self._off_brightness,
+        )
+
+    @property
+    @cached_state
+    def state(self) -> dict[str, Any]:
+        """Return the state of the light."""
+        return super().state
+
     def start_polling(self) -> None:
         """Start polling."""
-        self._refresh_task = self.device.gateway.async_create_background_task(
-            self._refresh(),
-            name=f"light_refresh_{self.unique_id}",
-            eager_start=True,
-            untracked=True,
-        )
-        self._tracked_tasks.append(self._refresh_task)
+        if self._refresh_job is None:
+            self._refresh_job = self.device.gateway.poll_scheduler.register_periodic(
+                self._refresh, name=f"light_refresh_{self.unique_id}"
+            )
+            self._tracked_handles.append(self._refresh_job)
+        else:
+            self._refresh_job.enable()
         self.debug(
             "started polling with refresh interval of %s",
             getattr(self, "__polling_interval"),
@@ -769,10 +784,8 @@ class Light(PlatformEntity, BaseLight):
     def disable(self) -> None:
         """Disable the entity."""
         super().disable()
-        if self._refresh_task:
-            self._tracked_tasks.remove(self._refresh_task)
-            self._refresh_task.cancel()
-            self._refresh_task = None
+        if self._refresh_job:
+            self._refresh_job.disable()
 
     @periodic(_REFRESH_INTERVAL)
     async def _refresh(self) -> None:
@@ -1075,6 +1088,12 @@ class LightGroup(GroupEntity, BaseLight):
         self._color_mode = ColorMode.UNKNOWN
         self._supported_color_modes = {ColorMode.ONOFF}
 
+        # Aggregate of the member states, updated from the members that changed
+        self._aggregate: LightStateAggregate = LightStateAggregate()
+        self._aggregated_entities: list[PlatformEntity] | None = None
+        self._member_states: dict[str, tuple[PlatformEntity, dict[str, Any]]] = {}
+        self._changed_members: set[str] = set()
+
         self._debounced_member_refresh: Debouncer | None = Debouncer(
             self.group.gateway,
             _LOGGER,
@@ -1128,64 +1147,88 @@ class LightGroup(GroupEntity, BaseLight):
         if self._debounced_member_refresh:
             await self._debounced_member_refresh.async_call()
 
+    def debounced_update(self, event: EntityStateChangedEvent | None = None) -> None:
+        """Remember which member changed before debouncing the group update."""
+        if event is not None:
+            self._changed_members.add(event.unique_id)
+        super().debounced_update(event)
+
+    def _aggregate_member_states(self) -> LightStateAggregate:
+        """Update the aggregate of the member states from the members that changed.
+
+        All members are aggregated again when the group members changed or when
+        the changed members are not known, e.g. when updating the group directly.
+        """
+        platform_entities = self._group.get_platform_entities(self.PLATFORM)
+        changed_members, self._changed_members = self._changed_members, set()
+
+        if platform_entities is not self._aggregated_entities or not changed_members:
+            self._aggregated_entities = platform_entities
+            self._aggregate = aggregate = LightStateAggregate()
+            self._member_states = {}
+            for entity in platform_entities:
+                state = entity.state
+                self._member_states[entity.unique_id] = (entity, state)
+                if state:
+                    aggregate.add(state)
+            self.debug(
+                "All platform entity states for group entity members: %s",
+                [state for _, state in self._member_states.values()],
+            )
+            return aggregate
+
+        aggregate = self._aggregate
+        for unique_id in changed_members:
+            if (member := self._member_states.get(unique_id)) is None:
+                continue
+            entity, previous_state = member
+            if (state := entity.state) is previous_state:
+                continue
+            if previous_state:
+                aggregate.remove(previous_state)
+            if state:
+                aggregate.add(state)
+            self._member_states[unique_id] = (entity, state)
+        return aggregate
+
     def update(self, _: Any = None) -> None:
         """Query all members and determine the light group state."""
         self.debug("Updating light group entity state")
-        platform_entities = self._group.get_platform_entities(self.PLATFORM)
-        all_states = [entity.state for entity in platform_entities]
-        states: list = list(filter(None, all_states))
-        self.debug(
-            "All platform entity states for group entity members: %s", all_states
-        )
-        on_states = [state for state in states if state["on"]]
+        aggregate = self._aggregate_member_states()
 
-        self._state = len(on_states) > 0
+        self._state = aggregate.on_count > 0
 
         # reset "off with transition" flag if any member is on
         if self._state:
             self._off_with_transition = False
             self._off_brightness = None
 
-        self._brightness = reduce_attribute(on_states, ATTR_BRIGHTNESS)
-        self._xy_color = reduce_attribute(on_states, ATTR_XY_COLOR, reduce=mean_tuple)
-        self._color_temp = reduce_attribute(on_states, ATTR_COLOR_TEMP)
-        self._min_mireds = reduce_attribute(
-            states, ATTR_MIN_MIREDS, default=153, reduce=min
-        )
-        self._max_mireds = reduce_attribute(
-            states, ATTR_MAX_MIREDS, default=500, reduce=max
-        )
-
-        self._effect_list = None
-        all_effect_lists = list(find_state_attributes(states, ATTR_EFFECT_LIST))
-        if all_effect_lists:
-            # Merge all effects from all effect_lists with a union merge.
-            self._effect_list = list(set().union(*all_effect_lists))
+        self._brightness = aggregate.brightness
+        self._xy_color = aggregate.xy_color
+        self._color_temp = aggregate.color_temp
+        self._min_mireds = aggregate.min_mireds
+        self._max_mireds = aggregate.max_mireds
+        self._effect_list = aggregate.effect_list
 
         self._effect = EFFECT_OFF
-        all_effects = list(find_state_attributes(on_states, ATTR_EFFECT))
-        if all_effects:
+        if aggregate.effects:
             # Report the most common effect.
-            effects_count = Counter(itertools.chain(all_effects))
-            self._effect = effects_count.most_common(1)[0][0]
+            self._effect = aggregate.effects.most_common(1)[0][0]
 
         supported_color_modes = {ColorMode.ONOFF}
-        all_supported_color_modes: list[set[ColorMode]] = list(
-            find_state_attributes(states, ATTR_SUPPORTED_COLOR_MODES)
-        )
-        self._supported_color_modes = set().union(*all_supported_color_modes)
+        all_supported_color_modes = aggregate.supported_color_modes
+        self._supported_color_modes = all_supported_color_modes or set()
 
-        if all_supported_color_modes:
+        if all_supported_color_modes is not None:
             # Merge all color modes.
             self._external_supported_color_modes = supported_color_modes = (
-                filter_supported_color_modes(set().union(*all_supported_color_modes))
+                filter_supported_color_modes(all_supported_color_modes)
             )
 
         self._color_mode = ColorMode.UNKNOWN
-        all_color_modes = list(find_state_attributes(on_states, ATTR_COLOR_MODE))
-        if all_color_modes:
+        if aggregate.color_modes:
             # Report the most common color mode, select brightness and onoff last
-            color_mode_count = Counter(itertools.chain(all_color_modes))
+            color_mode_count = aggregate.color_modes.copy()
             if ColorMode.ONOFF in color_mode_count:
                 if ColorMode.ONOFF in supported_color_modes:
                     color_mode_count[ColorMode.ONOFF] = -1
@@ -1201,11 +1244,7 @@ class LightGroup(GroupEntity, BaseLight):
             else:
                 self._color_mode = next(iter(supported_color_modes))
 
-        self._supported_features = LightEntityFeature(0)
-        for support in find_state_attributes(states, ATTR_SUPPORTED_FEATURES):
-            # Merge supported features by emulating support for every feature
-            # we find.
-            self._supported_features |= support
+        self._supported_features = LightEntityFeature(aggregate.supported_features)
         # Bitwise-and the supported features with the GroupedLight's features
         # so that we don't break in the future when a new feature is added.
         self._supported_features &= (
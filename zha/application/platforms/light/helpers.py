@@ -2,9 +2,25 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import Iterable
+from fractions import Fraction
+from typing import Any
 
-from zha.application.platforms.light.const import COLOR_MODES_BRIGHTNESS, ColorMode
+from zha.application.platforms.light.const import (
+    ATTR_BRIGHTNESS,
+    ATTR_COLOR_MODE,
+    ATTR_COLOR_TEMP,
+    ATTR_EFFECT,
+    ATTR_EFFECT_LIST,
+    ATTR_MAX_MIREDS,
+    ATTR_MIN_MIREDS,
+    ATTR_SUPPORTED_COLOR_MODES,
+    ATTR_SUPPORTED_FEATURES,
+    ATTR_XY_COLOR,
+    COLOR_MODES_BRIGHTNESS,
+    ColorMode,
+)
 from zha.exceptions import ZHAException
 
 
@@ -26,3 +42,129 @@ def brightness_supported(color_modes: Iterable[ColorMode | str] | None) -> bool:
     if not color_modes:
         return False
     return not COLOR_MODES_BRIGHTNESS.isdisjoint(color_modes)
+
+
+def _count(counter: Counter, key: Any, delta: int) -> None:
+    """Add `delta` to the count of `key`, dropping keys that are no longer counted."""
+    if (count := counter[key] + delta) > 0:
+        counter[key] = count
+    else:
+        del counter[key]
+
+
+class LightStateAggregate:
+    """Running aggregates of the states of the members of a light group.
+
+    Member states are added and removed one at a time, so that a change of a
+    single member does not require walking all the other members again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the aggregate without any member."""
+        self.on_count: int = 0
+        self._brightness: list[int] = [0, 0]
+        self._color_temp: list[int] = [0, 0]
+        # Exact sums, so that removing a member does not accumulate rounding errors
+        self._xy_color: list[Fraction] = [Fraction(0), Fraction(0)]
+        self._xy_color_count: int = 0
+        self._min_mireds: Counter[int] = Counter()
+        self._max_mireds: Counter[int] = Counter()
+        self._effect_list_count: int = 0
+        self._effect_list: Counter[str] = Counter()
+        self.effects: Counter[str] = Counter()
+        self._supported_color_modes_count: int = 0
+        self._supported_color_modes: Counter[ColorMode] = Counter()
+        self.color_modes: Counter[ColorMode] = Counter()
+        self._supported_features: Counter[int] = Counter()
+
+    def add(self, state: dict[str, Any]) -> None:
+        """Add the state of a member."""
+        self._apply(state, 1)
+
+    def remove(self, state: dict[str, Any]) -> None:
+        """Remove a previously added state of a member."""
+        self._apply(state, -1)
+
+    def _apply(self, state: dict[str, Any], delta: int) -> None:
+        """Add or remove the contribution of a member state."""
+        if (value := state.get(ATTR_MIN_MIREDS)) is not None:
+            _count(self._min_mireds, value, delta)
+        if (value := state.get(ATTR_MAX_MIREDS)) is not None:
+            _count(self._max_mireds, value, delta)
+        if (value := state.get(ATTR_EFFECT_LIST)) is not None:
+            self._effect_list_count += delta
+            for effect in value:
+                _count(self._effect_list, effect, delta)
+        if (value := state.get(ATTR_SUPPORTED_COLOR_MODES)) is not None:
+            self._supported_color_modes_count += delta
+            for color_mode in value:
+                _count(self._supported_color_modes, color_mode, delta)
+        if (value := state.get(ATTR_SUPPORTED_FEATURES)) is not None:
+            _count(self._supported_features, value, delta)
+
+        if not state["on"]:
+            return
+        self.on_count += delta
+        if (value := state.get(ATTR_BRIGHTNESS)) is not None:
+            self._brightness[0] += delta * value
+            self._brightness[1] += delta
+        if (value := state.get(ATTR_COLOR_TEMP)) is not None:
+            self._color_temp[0] += delta * value
+            self._color_temp[1] += delta
+        if (value := state.get(ATTR_XY_COLOR)) is not None:
+            self._xy_color[0] += delta * Fraction(value[0])
+            self._xy_color[1] += delta * Fraction(value[1])
+            self._xy_color_count += delta
+        if (value := state.get(ATTR_EFFECT)) is not None:
+            _count(self.effects, value, delta)
+        if (value := state.get(ATTR_COLOR_MODE)) is not None:
+            _count(self.color_modes, value, delta)
+
+    @property
+    def brightness(self) -> int | None:
+        """Return the mean brightness of the members that are on."""
+        total, count = self._brightness
+        return int(total / count) if count else None
+
+    @property
+    def color_temp(self) -> int | None:
+        """Return the mean color temperature of the members that are on."""
+        total, count = self._color_temp
+        return int(total / count) if count else None
+
+    @property
+    def xy_color(self) -> tuple[float, float] | None:
+        """Return the mean xy color of the members that are on."""
+        if not (count := self._xy_color_count):
+            return None
+        return (float(self._xy_color[0] / count), float(self._xy_color[1] / count))
+
+    @property
+    def min_mireds(self) -> int:
+        """Return the lowest minimum color temperature of the members."""
+        return min(self._min_mireds, default=153)
+
+    @property
+    def max_mireds(self) -> int:
+        """Return the highest maximum color temperature of the members."""
+        return max(self._max_mireds, default=500)
+
+    @property
+    def effect_list(self) -> list[str] | None:
+        """Return the union of the effect lists of the members, if any has one."""
+        return list(self._effect_list) if self._effect_list_count else None
+
+    @property
+    def supported_color_modes(self) -> set[ColorMode] | None:
+        """Return the union of the supported color modes, if any member has some."""
+        if not self._supported_color_modes_count:
+            return None
+        return set(self._supported_color_modes)
+
+    @property
+    def supported_features(self) -> int:
+        """Return the union of the supported features of the members."""
+        features = 0
+        for support in self._supported_features:
+            features |= support
+        return features
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from asyncio import Task
 from dataclasses import dataclass
 from datetime import UTC, date, datetime
 import enum
 import functools
 import logging
+import math
 import numbers
 from typing import TYPE_CHECKING, Any, Self
 
@@ -21,12 +21,15 @@ from zigpy.zcl.clusters.general import Basic
 
 from zha.application import Platform
 from zha.application.const import ENTITY_METADATA
+from zha.application.counters import CounterKey
 from zha.application.platforms import (
     BaseEntity,
     BaseEntityInfo,
     BaseIdentifiers,
+    DeferredEntity,
     EntityCategory,
     PlatformEntity,
+    cached_state,
 )
 from zha.application.platforms.climate.const import HVACAction
 from zha.application.platforms.helpers import validate_device_class
@@ -82,6 +85,8 @@ from zha.zigbee.cluster_handlers.const import (
 )
 
 if TYPE_CHECKING:
+    from zha.application.gateway import Gateway
+    from zha.poll_scheduler import PollJob
     from zha.zigbee.cluster_handlers import ClusterHandler
     from zha.zigbee.device import Device
     from zha.zigbee.endpoint import Endpoint
@@ -238,6 +243,7 @@ class Sensor(PlatformEntity):
         )
 
     @property
+    @cached_state
     def state(self) -> dict:
         """Return the state for this sensor."""
         response = super().state
@@ -306,7 +312,8 @@ class PollableSensor(Sensor):
     ) -> None:
         """Init this sensor."""
         super().__init__(unique_id, cluster_handlers, endpoint, device, **kwargs)
-        self._polling_task: Task | None = None
+        self._polling_job: PollJob | None = None
+        self._last_polled_value: Any = None
         self.maybe_start_polling()
 
     @property
@@ -314,20 +321,29 @@ class PollableSensor(Sensor):
         """Return True if we need to poll for state changes."""
         return self._use_custom_polling
 
+    @property
+    def polling_interval(self) -> float | None:
+        """Return the current polling interval, if polling."""
+        if self._polling_job is None:
+            return None
+        return self._polling_job.interval
+
     def maybe_start_polling(self) -> None:
         """Start polling if necessary."""
-        if self.should_poll:
-            self._polling_task = self.device.gateway.async_create_background_task(
-                self._refresh(),
+        if not self.should_poll:
+            return
+        if self._polling_job is None:
+            self._polling_job = self.device.gateway.poll_scheduler.register_periodic(
+                self._refresh,
                 name=f"sensor_state_poller_{self.unique_id}_{self.__class__.__name__}",
-                eager_start=True,
-                untracked=True,
-            )
-            self._tracked_tasks.append(self._polling_task)
-            self.debug(
-                "started polling with refresh interval of %s",
-                getattr(self, "__polling_interval"),
             )
+            self._tracked_handles.append(self._polling_job)
+        else:
+            self._polling_job.enable()
+        self.debug(
+            "started polling with refresh interval of %s",
+            getattr(self, "__polling_interval"),
+        )
 
     def enable(self) -> None:
         """Enable the entity."""
@@ -337,10 +353,8 @@ class PollableSensor(Sensor):
     def disable(self) -> None:
         """Disable the entity."""
         super().disable()
-        if self._polling_task:
-            self._tracked_tasks.remove(self._polling_task)
-            self._polling_task.cancel()
-            self._polling_task = None
+        if self._polling_job:
+            self._polling_job.disable()
 
     @periodic(_REFRESH_INTERVAL)
     async def _refresh(self):
@@ -349,6 +363,7 @@ class PollableSensor(Sensor):
             self.debug("polling for updated state")
             await self.async_update()
             self.maybe_emit_state_changed_event()
+            self._adapt_polling_interval()
         else:
             self.debug(
                 "skipping polling for updated state, available: %s, allow polled requests: %s",
@@ -356,6 +371,33 @@ class PollableSensor(Sensor):
                 self.device.gateway.config.allow_polling,
             )
 
+    def _adapt_polling_interval(self) -> None:
+        """Poll sooner after the polled value changed and back off while flat."""
+        options = self.device.gateway.config.config.device_options
+        if not options.enable_adaptive_polling or self._polling_job is None:
+            return
+        value = self._cluster_handler.cluster.get(self._attribute_name)
+        previous, self._last_polled_value = self._last_polled_value, value
+        if not isinstance(value, numbers.Real) or not isinstance(
+            previous, numbers.Real
+        ):
+            return
+
+        current, last = float(value), float(previous)
+        interval = self._polling_job.interval
+        if abs(current - last) > options.adaptive_polling_threshold * max(
+            abs(current), abs(last)
+        ):
+            interval = options.adaptive_polling_min_interval
+        else:
+            # Whole seconds, the intervals of fixed polling are whole as well
+            interval = min(
+                options.adaptive_polling_max_interval, math.ceil(interval * 1.5)
+            )
+        if interval != self._polling_job.interval:
+            self.debug("adapted polling interval to %s", interval)
+            self._polling_job.interval = interval
+
 
 class DeviceCounterSensor(BaseEntity):
     """Device counter sensor."""
@@ -380,6 +422,42 @@ class DeviceCounterSensor(BaseEntity):
         """
         return cls(zha_device, counter_groups, counter_group, counter, **kwargs)
 
+    @classmethod
+    def _defer(
+        cls,
+        zha_device: Device,
+        counter_groups: str,
+        counter_group: str,
+        counter: str,
+        **kwargs: Any,
+    ) -> DeferredEntity | None:
+        """Return a descriptor if creating the entity should be deferred."""
+        if not zha_device.gateway.config.config.device_options.defer_disabled_entities:
+            return None
+        return DeferredEntity(
+            entity_class=cls,
+            args=(zha_device, counter_groups, counter_group, counter),
+            kwargs=kwargs,
+            device=zha_device,
+            unique_id=cls._counter_unique_id(
+                zha_device, counter_groups, counter_group, counter
+            ),
+        )
+
+    @classmethod
+    def _create_deferred(cls, deferred: DeferredEntity) -> BaseEntity | None:
+        """Create the entity described by a deferred entity descriptor, if supported."""
+        return cls.create_platform_entity(*deferred.args, **deferred.kwargs)
+
+    @staticmethod
+    def _counter_unique_id(
+        zha_device: Device, counter_groups: str, counter_group: str, counter: str
+    ) -> str:
+        """Return the unique id of a counter sensor."""
+        # XXX: ZHA uses the IEEE address of the device passed through `slugify`!
+        slugified_device_id = zha_device.unique_id.replace(":", "-")
+        return f"{slugified_device_id}_{counter_groups}_{counter_group}_{counter}"
+
     def __init__(
         self,
         zha_device: Device,
@@ -389,11 +467,10 @@ class DeviceCounterSensor(BaseEntity):
         **kwargs: Any,
     ) -> None:
         """Init this sensor."""
-        # XXX: ZHA uses the IEEE address of the device passed through `slugify`!
-        slugified_device_id = zha_device.unique_id.replace(":", "-")
-
         super().__init__(
-            unique_id=f"{slugified_device_id}_{counter_groups}_{counter_group}_{counter}",
+            unique_id=self._counter_unique_id(
+                zha_device, counter_groups, counter_group, counter
+            ),
             **kwargs,
         )
         self._device: Device = zha_device
@@ -411,7 +488,8 @@ class DeviceCounterSensor(BaseEntity):
         # even if they do not exist.
         # self._attr_translation_key = f"counter_{self._zigpy_counter.name.lower()}"
 
-        self._device.gateway.global_updater.register_update_listener(self.update)
+        self._counter_key: CounterKey = (counter_groups, counter_group, counter)
+        self._device.gateway.counter_collector.subscribe(self._counter_key, self.update)
 
         # we double create these in discovery tests because we reissue the create calls to count and prove them out
         if (self.PLATFORM, self.unique_id) not in self._device.platform_entities:
@@ -457,31 +535,40 @@ class DeviceCounterSensor(BaseEntity):
         """Return the device."""
         return self._device
 
+    @property
+    def gateway(self) -> Gateway:
+        """Return the gateway this entity belongs to."""
+        return self._device.gateway
+
     def enable(self) -> None:
         """Enable the entity."""
         super().enable()
-        self._device.gateway.global_updater.register_update_listener(self.update)
+        self._device.gateway.counter_collector.subscribe(self._counter_key, self.update)
 
     def disable(self) -> None:
         """Disable the entity."""
         super().disable()
-        self._device.gateway.global_updater.remove_update_listener(self.update)
+        self._device.gateway.counter_collector.unsubscribe(self._counter_key)
 
-    def update(self):
-        """Call async_update at a constrained random interval."""
+    def update(self) -> bool:
+        """Emit the state after the counter collector saw the counter change.
+
+        Returns whether the change was handled, the collector retries it otherwise.
+        """
         if self._device.available and self._device.gateway.config.allow_polling:
             self.debug("polling for updated state")
             self.maybe_emit_state_changed_event()
-        else:
-            self.debug(
-                "skipping polling for updated state, available: %s, allow polled requests: %s",
-                self._device.available,
-                self._device.gateway.config.allow_polling,
-            )
+            return True
+        self.debug(
+            "skipping polling for updated state, available: %s, allow polled requests: %s",
+            self._device.available,
+            self._device.gateway.config.allow_polling,
+        )
+        return False
 
     async def on_remove(self) -> None:
         """Cancel tasks this entity owns."""
-        self._device.gateway.global_updater.remove_update_listener(self.update)
+        self._device.gateway.counter_collector.unsubscribe(self._counter_key)
         await super().on_remove()
 
 
@@ -575,6 +662,7 @@ class Battery(Sensor):
         return value
 
     @property
+    @cached_state
     def state(self) -> dict[str, Any]:
         """Return the state for battery sensors."""
         response = super().state
@@ -621,6 +709,7 @@ class ElectricalMeasurement(PollableSensor):
         }
 
     @property
+    @cached_state
     def state(self) -> dict[str, Any]:
         """Return the state for this sensor."""
         response = super().state
@@ -888,6 +977,7 @@ class SmartEnergyMetering(PollableSensor):
             self._attr_state_class = entity_description.state_class
 
     @property
+    @cached_state
     def state(self) -> dict[str, Any]:
         """Return state for this sensor."""
         response = super().state
@@ -1310,6 +1400,7 @@ class ThermostatHVACAction(Sensor):
         return cls(unique_id, cluster_handlers, endpoint, device, **kwargs)
 
     @property
+    @cached_state
     def state(self) -> dict:
         """Return the current HVAC action."""
         response = super().state
@@ -1747,6 +1838,7 @@ class BitMapSensor(Sensor):
         }
 
     @property
+    @cached_state
     def state(self) -> dict[str, Any]:
         """Return the state for this sensor."""
         response = super().state
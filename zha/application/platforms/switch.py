@@ -22,6 +22,7 @@ from zha.application.platforms import (
     EntityCategory,
     GroupEntity,
     PlatformEntity,
+    cached_state,
 )
 from zha.application.registries import PLATFORM_ENTITIES
 from zha.zigbee.cluster_handlers import ClusterAttributeUpdatedEvent
@@ -125,6 +126,12 @@ class Switch(PlatformEntity, BaseSwitch):
             self.handle_cluster_handler_attribute_updated,
         )
 
+    @property
+    @cached_state
+    def state(self) -> dict[str, Any]:
+        """Return the state of the switch."""
+        return super().state
+
     def handle_cluster_handler_attribute_updated(
         self,
         event: ClusterAttributeUpdatedEvent,  # pylint: disable=unused-argument
@@ -263,6 +270,7 @@ class ConfigurableAttributeSwitch(PlatformEntity):
         )
 
     @property
+    @cached_state
     def state(self) -> dict[str, Any]:
         """Return the state of the switch."""
         response = super().state
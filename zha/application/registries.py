@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import collections
-from collections.abc import Callable
+from collections.abc import Callable, Collection, Iterable
 import dataclasses
+import functools
 from operator import attrgetter
 from typing import TYPE_CHECKING
 
@@ -133,7 +134,7 @@ class MatchRule:
         )
         object.__setattr__(self, "quirk_ids", set_or_callable(self.quirk_ids))
 
-    @property
+    @functools.cached_property
     def weight(self) -> int:
         """Return the weight of the matching rule.
 
@@ -193,6 +194,46 @@ class MatchRule:
         """Return True if this device matches the criteria."""
         return all(self._matched(manufacturer, model, cluster_handlers, quirk_id))
 
+    def _strict_matched_sets(
+        self,
+        manufacturer: str,
+        model: str,
+        cluster_handler_names: set[str],
+        generic_ids: set[str],
+        quirk_id: str | None,
+    ) -> bool:
+        """Return True if this device matches, given its handler names and ids."""
+        if self.cluster_handler_names and not self.cluster_handler_names.issubset(
+            cluster_handler_names
+        ):
+            return False
+        if self.generic_ids and not self.generic_ids.issubset(generic_ids):
+            return False
+        if self.manufacturers and not (
+            self.manufacturers(manufacturer)
+            if callable(self.manufacturers)
+            else manufacturer in self.manufacturers
+        ):
+            return False
+        if self.models and not (
+            self.models(model) if callable(self.models) else model in self.models
+        ):
+            return False
+        if self.quirk_ids and not (
+            self.quirk_ids(quirk_id)
+            if callable(self.quirk_ids)
+            else quirk_id in self.quirk_ids
+        ):
+            return False
+        return bool(
+            self.cluster_handler_names
+            or self.generic_ids
+            or self.manufacturers
+            or self.models
+            or self.aux_cluster_handlers
+            or self.quirk_ids
+        )
+
     def loose_matched(
         self,
         manufacturer: str,
@@ -253,6 +294,51 @@ class MatchRule:
         return matches
 
 
+class _RuleIndex:
+    """Match rules sorted by descending weight and bucketed by a required key.
+
+    A rule requiring cluster handler names is only a candidate for devices
+    having one of them, so it is filed under one of its names. Rules without
+    names are filed under one of their generic ids and the remaining rules are
+    candidates for every device.
+    """
+
+    __slots__ = ("_by_cluster_handler", "_by_generic_id", "_unindexed", "rules")
+
+    def __init__(self, rules: Iterable[MatchRule]) -> None:
+        """Initialize the index, keeping the order of equally weighted rules."""
+        self.rules: tuple[MatchRule, ...] = tuple(
+            sorted(rules, key=WEIGHT_ATTR, reverse=True)
+        )
+        self._by_cluster_handler: dict[str, list[int]] = collections.defaultdict(list)
+        self._by_generic_id: dict[str, list[int]] = collections.defaultdict(list)
+        self._unindexed: list[int] = []
+        for position, rule in enumerate(self.rules):
+            if isinstance(rule.cluster_handler_names, frozenset) and (
+                rule.cluster_handler_names
+            ):
+                self._by_cluster_handler[min(rule.cluster_handler_names)].append(
+                    position
+                )
+            elif isinstance(rule.generic_ids, frozenset) and rule.generic_ids:
+                self._by_generic_id[min(rule.generic_ids)].append(position)
+            else:
+                self._unindexed.append(position)
+
+    def candidates(
+        self, cluster_handler_names: Collection[str], generic_ids: Collection[str]
+    ) -> list[MatchRule]:
+        """Return the rules that may match, by descending weight."""
+        positions = list(self._unindexed)
+        for name in cluster_handler_names:
+            positions.extend(self._by_cluster_handler.get(name, ()))
+        for generic_id in generic_ids:
+            positions.extend(self._by_generic_id.get(generic_id, ()))
+        positions.sort()
+        rules = self.rules
+        return [rules[position] for position in positions]
+
+
 @dataclasses.dataclass
 class EntityClassAndClusterHandlers:
     """Container for entity class and corresponding cluster handlers."""
@@ -285,6 +371,42 @@ class PlatformEntityRegistry:
         self.single_device_matches: dict[Platform, dict[EUI64, list[str]]] = (
             collections.defaultdict(lambda: collections.defaultdict(list))
         )
+        # Incremented whenever a match rule is registered
+        self.version: int = 0
+        self._index_version: int | None = None
+        self._strict_index: dict[Platform, _RuleIndex] = {}
+        self._multi_entity_index: dict[
+            Platform, dict[int | str | None, _RuleIndex]
+        ] = {}
+        self._config_diagnostic_entity_index: dict[
+            Platform, dict[int | str | None, _RuleIndex]
+        ] = {}
+
+    def _ensure_index(self) -> None:
+        """Build the rule indexes if rules were registered since the last build."""
+        if self._index_version == self.version:
+            return
+        self._strict_index = {
+            platform: _RuleIndex(rules)
+            for platform, rules in self._strict_registry.items()
+        }
+        self._multi_entity_index = {
+            platform: {
+                stop_match_grp: _RuleIndex(rules)
+                for stop_match_grp, rules in stop_match_groups.items()
+            }
+            for platform, stop_match_groups in self._multi_entity_registry.items()
+        }
+        self._config_diagnostic_entity_index = {
+            platform: {
+                stop_match_grp: _RuleIndex(rules)
+                for stop_match_grp, rules in stop_match_groups.items()
+            }
+            for platform, stop_match_groups in (
+                self._config_diagnostic_entity_registry.items()
+            )
+        }
+        self._index_version = self.version
 
     def get_entity(
         self,
@@ -296,9 +418,16 @@ class PlatformEntityRegistry:
         default: type[PlatformEntity] | None = None,
     ) -> tuple[type[PlatformEntity] | None, list[ClusterHandler]]:
         """Match a ZHA ClusterHandler to a ZHA Entity class."""
-        matches = self._strict_registry[platform]
-        for match in sorted(matches, key=WEIGHT_ATTR, reverse=True):
-            if match.strict_matched(manufacturer, model, cluster_handlers, quirk_id):
+        self._ensure_index()
+        if (index := self._strict_index.get(platform)) is None:
+            return default, []
+
+        names = {ch.name for ch in cluster_handlers}
+        generic_ids = {ch.generic_id for ch in cluster_handlers}
+        for match in index.candidates(names, generic_ids):
+            if match._strict_matched_sets(
+                manufacturer, model, names, generic_ids, quirk_id
+            ):
                 claimed = match.claim_cluster_handlers(cluster_handlers)
                 return self._strict_registry[platform][match], claimed
 
@@ -314,28 +443,15 @@ class PlatformEntityRegistry:
         dict[Platform, list[EntityClassAndClusterHandlers]], list[ClusterHandler]
     ]:
         """Match ZHA cluster handlers to potentially multiple ZHA Entity classes."""
-        result: dict[Platform, list[EntityClassAndClusterHandlers]] = (
-            collections.defaultdict(list)
+        self._ensure_index()
+        return self._match_multi_entities(
+            self._multi_entity_registry,
+            self._multi_entity_index,
+            manufacturer,
+            model,
+            cluster_handlers,
+            quirk_id,
         )
-        all_claimed: set[ClusterHandler] = set()
-        for platform, stop_match_groups in self._multi_entity_registry.items():
-            for stop_match_grp, matches in stop_match_groups.items():
-                sorted_matches = sorted(matches, key=WEIGHT_ATTR, reverse=True)
-                for match in sorted_matches:
-                    if match.strict_matched(
-                        manufacturer, model, cluster_handlers, quirk_id
-                    ):
-                        claimed = match.claim_cluster_handlers(cluster_handlers)
-                        for ent_class in stop_match_groups[stop_match_grp][match]:
-                            ent_n_cluster_handlers = EntityClassAndClusterHandlers(
-                                ent_class, claimed
-                            )
-                            result[platform].append(ent_n_cluster_handlers)
-                        all_claimed |= set(claimed)
-                        if stop_match_grp:
-                            break
-
-        return result, list(all_claimed)
 
     def get_config_diagnostic_entity(
         self,
@@ -347,22 +463,45 @@ class PlatformEntityRegistry:
         dict[Platform, list[EntityClassAndClusterHandlers]], list[ClusterHandler]
     ]:
         """Match ZHA cluster handlers to potentially multiple ZHA Entity classes."""
+        self._ensure_index()
+        return self._match_multi_entities(
+            self._config_diagnostic_entity_registry,
+            self._config_diagnostic_entity_index,
+            manufacturer,
+            model,
+            cluster_handlers,
+            quirk_id,
+        )
+
+    @staticmethod
+    def _match_multi_entities(
+        registry: dict[
+            Platform,
+            dict[int | str | None, dict[MatchRule, list[type[PlatformEntity]]]],
+        ],
+        index: dict[Platform, dict[int | str | None, _RuleIndex]],
+        manufacturer: str,
+        model: str,
+        cluster_handlers: Collection[ClusterHandler],
+        quirk_id: str | None,
+    ) -> tuple[
+        dict[Platform, list[EntityClassAndClusterHandlers]], list[ClusterHandler]
+    ]:
+        """Match cluster handlers against the indexed rules of a multi registry."""
         result: dict[Platform, list[EntityClassAndClusterHandlers]] = (
             collections.defaultdict(list)
         )
         all_claimed: set[ClusterHandler] = set()
-        for (
-            platform,
-            stop_match_groups,
-        ) in self._config_diagnostic_entity_registry.items():
-            for stop_match_grp, matches in stop_match_groups.items():
-                sorted_matches = sorted(matches, key=WEIGHT_ATTR, reverse=True)
-                for match in sorted_matches:
-                    if match.strict_matched(
-                        manufacturer, model, cluster_handlers, quirk_id
+        names = {ch.name for ch in cluster_handlers}
+        generic_ids = {ch.generic_id for ch in cluster_handlers}
+        for platform, stop_match_groups in index.items():
+            for stop_match_grp, rule_index in stop_match_groups.items():
+                for match in rule_index.candidates(names, generic_ids):
+                    if match._strict_matched_sets(
+                        manufacturer, model, names, generic_ids, quirk_id
                     ):
                         claimed = match.claim_cluster_handlers(cluster_handlers)
-                        for ent_class in stop_match_groups[stop_match_grp][match]:
+                        for ent_class in registry[platform][stop_match_grp][match]:
                             ent_n_cluster_handlers = EntityClassAndClusterHandlers(
                                 ent_class, claimed
                             )
@@ -404,6 +543,7 @@ class PlatformEntityRegistry:
             All non-empty fields of a match rule must match.
             """
             self._strict_registry[platform][rule] = zha_ent
+            self.version += 1
             return zha_ent
 
         return decorator
@@ -439,6 +579,7 @@ class PlatformEntityRegistry:
             self._multi_entity_registry[platform][stop_on_match_group][rule].append(
                 zha_entity
             )
+            self.version += 1
             return zha_entity
 
         return decorator
@@ -474,6 +615,7 @@ class PlatformEntityRegistry:
             self._config_diagnostic_entity_registry[platform][stop_on_match_group][
                 rule
             ].append(zha_entity)
+            self.version += 1
             return zha_entity
 
         return decorator
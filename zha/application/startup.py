@@ -0,0 +1,219 @@
+"""Startup timing report for Zigbee Home Automation."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import contextlib
+from dataclasses import dataclass, field
+import enum
+import logging
+import time
+from typing import Final
+
+import zigpy.device
+from zigpy.types.named import EUI64
+
+from zha.application.const import ZHA_GW_MSG, ZHA_GW_MSG_STARTUP_REPORT
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SLOWEST_DEVICES: Final[int] = 10
+
+
+class StartupPhase(enum.StrEnum):
+    """Phase of the gateway startup."""
+
+    LOAD_QUIRKS = "load_quirks"
+    RADIO_STARTUP = "radio_startup"
+    LOAD_DEVICES = "load_devices"
+    CREATE_PLATFORM_ENTITIES = "create_platform_entities"
+    LOAD_GROUPS = "load_groups"
+    INITIALIZE_FROM_CACHE = "initialize_from_cache"
+    MAINS_POLLING = "mains_polling"
+
+
+class DeviceStartupStage(enum.StrEnum):
+    """Per device stage of the gateway startup."""
+
+    DISCOVERY = "discovery"
+    INITIALIZE = "initialize"
+    REFRESH = "refresh"
+
+
+@dataclass(frozen=True, kw_only=True)
+class PhaseTiming:
+    """Timing of a single startup phase, in seconds since startup began."""
+
+    phase: StartupPhase
+    started: float
+    duration: float | None
+
+
+@dataclass(frozen=True, kw_only=True)
+class DeviceStartupTiming:
+    """Startup durations of a single device, in seconds."""
+
+    ieee: EUI64
+    nwk: int
+    manufacturer: str | None
+    model: str | None
+    durations: dict[DeviceStartupStage, float]
+
+    @property
+    def total(self) -> float:
+        """Return the total time spent on this device."""
+        return sum(self.durations.values())
+
+
+@dataclass(frozen=True, kw_only=True)
+class StartupReport:
+    """Structured report of where the gateway startup time went."""
+
+    complete: bool
+    total: float
+    phases: list[PhaseTiming]
+    devices: int
+    slowest_devices: list[DeviceStartupTiming]
+
+
+@dataclass(kw_only=True, frozen=True)
+class StartupReportEvent:
+    """Event to signal that the gateway startup has completed."""
+
+    report: StartupReport
+    event_type: Final[str] = ZHA_GW_MSG
+    event: Final[str] = ZHA_GW_MSG_STARTUP_REPORT
+
+
+@dataclass(kw_only=True)
+class _DeviceTimes:
+    """Mutable per device timings."""
+
+    ieee: EUI64
+    nwk: int
+    manufacturer: str | None
+    model: str | None
+    durations: dict[DeviceStartupStage, float] = field(default_factory=dict)
+
+
+class StartupTimer:
+    """Record monotonic timings of the startup phases and of each device.
+
+    Nothing is recorded outside of a startup, so the timers can stay in place
+    around code that also runs when devices join later on.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the startup timer."""
+        self._start: float | None = None
+        self._end: float | None = None
+        self._complete: bool = False
+        self._phases: dict[StartupPhase, tuple[float, float | None]] = {}
+        self._devices: dict[EUI64, _DeviceTimes] = {}
+
+    @property
+    def recording(self) -> bool:
+        """Return whether a startup is being recorded."""
+        return self._start is not None and self._end is None
+
+    def start(self) -> None:
+        """Begin recording a startup, unless one is already being recorded."""
+        if self.recording:
+            return
+        self._start = time.monotonic()
+        self._end = None
+        self._complete = False
+        self._phases.clear()
+        self._devices.clear()
+
+    def finish(self) -> StartupReport | None:
+        """Stop recording and return the final report."""
+        if not self.recording:
+            return None
+        self._end = time.monotonic()
+        self._complete = True
+        report = self.report()
+        _LOGGER.debug(
+            "Startup completed in %.3fs: %s",
+            report.total,
+            ", ".join(
+                f"{timing.phase}={timing.duration:.3f}s"
+                for timing in report.phases
+                if timing.duration is not None
+            ),
+        )
+        return report
+
+    def cancel(self) -> None:
+        """Stop recording, keeping the timings of the incomplete startup."""
+        if self.recording:
+            self._end = time.monotonic()
+
+    @contextlib.contextmanager
+    def phase(self, phase: StartupPhase) -> Iterator[None]:
+        """Time a startup phase."""
+        if not self.recording:
+            yield
+            return
+        start = time.monotonic()
+        self._phases[phase] = (start, None)
+        try:
+            yield
+        finally:
+            self._phases[phase] = (start, time.monotonic() - start)
+
+    @contextlib.contextmanager
+    def device(
+        self, device: zigpy.device.Device, stage: DeviceStartupStage
+    ) -> Iterator[None]:
+        """Time a startup stage of a single device."""
+        if not self.recording:
+            yield
+            return
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            if (times := self._devices.get(device.ieee)) is None:
+                times = self._devices[device.ieee] = _DeviceTimes(
+                    ieee=device.ieee,
+                    nwk=device.nwk,
+                    manufacturer=device.manufacturer,
+                    model=device.model,
+                )
+            times.durations[stage] = time.monotonic() - start
+
+    def report(self, slowest: int = DEFAULT_SLOWEST_DEVICES) -> StartupReport:
+        """Return the startup report, listing the `slowest` devices."""
+        if self._start is None:
+            return StartupReport(
+                complete=False, total=0.0, phases=[], devices=0, slowest_devices=[]
+            )
+
+        end = self._end if self._end is not None else time.monotonic()
+        devices = sorted(
+            (
+                DeviceStartupTiming(
+                    ieee=times.ieee,
+                    nwk=times.nwk,
+                    manufacturer=times.manufacturer,
+                    model=times.model,
+                    durations=dict(times.durations),
+                )
+                for times in self._devices.values()
+            ),
+            key=lambda timing: timing.total,
+            reverse=True,
+        )
+        return StartupReport(
+            complete=self._complete,
+            total=end - self._start,
+            phases=[
+                PhaseTiming(phase=phase, started=start - self._start, duration=duration)
+                for phase, (start, duration) in sorted(
+                    self._phases.items(), key=lambda item: item[1][0]
+                )
+            ],
+            devices=len(devices),
+            slowest_devices=devices[:slowest],
+        )
@@ -4,6 +4,7 @@ from enum import StrEnum
 from typing import Final
 
 STATE_CHANGED: Final[str] = "state_changed"
+STATE_CHANGED_BATCH: Final[str] = "state_changed_batch"
 EVENT: Final[str] = "event"
 EVENT_TYPE: Final[str] = "event_type"
 
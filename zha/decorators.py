@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
 import logging
 import random
 from typing import Any, TypeVar
@@ -58,8 +59,22 @@ class SetRegistry(set[int | str]):
         return decorator
 
 
+@dataclass(frozen=True, slots=True)
+class PeriodicSpec:
+    """Schedule of a method decorated with `periodic`."""
+
+    refresh_interval: tuple
+    run_immediately: bool
+    func: Callable[..., Coroutine[Any, Any, None]]
+
+
 def periodic(refresh_interval: tuple, run_immediately=False) -> Callable:
-    """Make a method with periodic refresh."""
+    """Make a method with periodic refresh.
+
+    Awaiting the decorated method loops forever in the calling task. The method
+    can instead be registered with `PollScheduler.register_periodic`, which runs
+    the undecorated method on the same schedule without a dedicated task.
+    """
 
     def scheduler(func: Callable) -> Callable[[Any, Any], Coroutine[Any, Any, None]]:
         async def wrapper(*args: Any, **kwargs: Any) -> None:
@@ -97,6 +112,11 @@ def periodic(refresh_interval: tuple, run_immediately=False) -> Callable:
                     )
                 await asyncio.sleep(sleep_time)
 
+        wrapper.periodic_spec = PeriodicSpec(  # type: ignore[attr-defined]
+            refresh_interval=refresh_interval,
+            run_immediately=run_immediately,
+            func=func,
+        )
         return wrapper
 
     return scheduler
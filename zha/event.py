@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 import dataclasses
 import inspect
 import logging
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
+
+from zha.trace import TRACER, TraceKind
 
 _LOGGER = logging.getLogger(__package__)
 
+# Sync and async listeners of an event
+_Dispatch = tuple[tuple["EventListener", ...], tuple["EventListener", ...]]
+
+# Shared empty containers used until an object gets its first listener or task
+_NO_LISTENERS: Final[Mapping[str, tuple[EventListener, ...]]] = MappingProxyType({})
+_NO_DISPATCH: Final[Mapping[str, _Dispatch]] = MappingProxyType({})
+_NO_EVENT_TASKS: Final[tuple[asyncio.Task, ...]] = ()
+_EMPTY_DISPATCH: Final[tuple[tuple[()], tuple[()]]] = ((), ())
+
 
 @dataclasses.dataclass(frozen=True, slots=True)
 class EventListener:
@@ -18,31 +30,62 @@ class EventListener:
 
     callback: Callable
     with_context: bool
+    is_coroutine: bool = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Classify the callback once so emitting does not have to."""
+        object.__setattr__(
+            self, "is_coroutine", inspect.iscoroutinefunction(self.callback)
+        )
+
+
+def _remove_listener(
+    listeners: tuple[EventListener, ...], listener: EventListener
+) -> tuple[EventListener, ...]:
+    """Return a copy of `listeners` without the first occurrence of `listener`."""
+    index = listeners.index(listener)
+    return listeners[:index] + listeners[index + 1 :]
 
 
 class EventBase:
-    """Base class for event handling and emitting objects."""
+    """Base class for event handling and emitting objects.
+
+    Listener collections are immutable tuples that are replaced whenever a listener
+    is added or removed. The sync and async listeners for each event are compiled
+    into a dispatch entry on the first emit after a change, so emitting an event
+    that nobody (un)subscribed from since the last emit does not allocate.
+
+    Most objects never get a listener, so the listener, dispatch and task
+    containers are shared empty class defaults until they are first needed.
+    """
+
+    _listeners: (
+        dict[str, tuple[EventListener, ...]] | Mapping[str, tuple[EventListener, ...]]
+    ) = _NO_LISTENERS
+    _global_listeners: tuple[EventListener, ...] = ()
+    _dispatch: dict[str, _Dispatch] | Mapping[str, _Dispatch] = _NO_DISPATCH
+    _event_tasks: list[asyncio.Task] | tuple[asyncio.Task, ...] = _NO_EVENT_TASKS
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize event base."""
         super().__init__(*args, **kwargs)
-        self._listeners: dict[str, list[EventListener]] = {}
-        self._event_tasks: list[asyncio.Task] = []
-        self._global_listeners: list[EventListener] = []
 
     def on_event(  # pylint: disable=invalid-name
         self, event_name: str, callback: Callable, with_context: bool = False
     ) -> Callable:
         """Register an event callback."""
         listener = EventListener(callback=callback, with_context=with_context)
-
-        listeners: list = self._listeners.setdefault(event_name, [])
-        listeners.append(listener)
+        if not isinstance(self._listeners, dict):
+            self._listeners = {}
+        self._listeners[event_name] = (*self._listeners.get(event_name, ()), listener)
+        self._invalidate_dispatch(event_name)
 
         def unsubscribe() -> None:
             """Unsubscribe listeners."""
-            if listener in listeners:
-                listeners.remove(listener)
+            listeners = self._listeners.get(event_name, ())
+            if listener in listeners and isinstance(self._listeners, dict):
+                self._listeners[event_name] = _remove_listener(listeners, listener)
+                self._invalidate_dispatch(event_name)
 
         return unsubscribe
 
@@ -51,12 +94,16 @@ class EventBase:
     ) -> Callable:
         """Register a callback for all events."""
         listener = EventListener(callback=callback, with_context=with_context)
-        self._global_listeners.append(listener)
+        self._global_listeners = (*self._global_listeners, listener)
+        self._invalidate_dispatch()
 
         def unsubscribe() -> None:
             """Unsubscribe listeners."""
             if listener in self._global_listeners:
-                self._global_listeners.remove(listener)
+                self._global_listeners = _remove_listener(
+                    self._global_listeners, listener
+                )
+                self._invalidate_dispatch()
 
         return unsubscribe
 
@@ -68,9 +115,7 @@ class EventBase:
 
             async def async_event_listener(*args, **kwargs) -> None:
                 unsub()
-                task = asyncio.create_task(callback(*args, **kwargs))
-                self._event_tasks.append(task)
-                task.add_done_callback(self._event_tasks.remove)
+                self._track_event_task(asyncio.create_task(callback(*args, **kwargs)))
 
             unsub = self.on_event(
                 event_name, async_event_listener, with_context=with_context
@@ -84,26 +129,66 @@ class EventBase:
         unsub = self.on_event(event_name, event_listener, with_context=with_context)
         return unsub
 
+    def _invalidate_dispatch(self, event_name: str | None = None) -> None:
+        """Drop the compiled dispatch of an event, or of all events."""
+        if event_name is None:
+            self._dispatch = _NO_DISPATCH
+        elif isinstance(self._dispatch, dict):
+            self._dispatch.pop(event_name, None)
+
+    def _track_event_task(self, task: asyncio.Task) -> None:
+        """Keep a reference to a task started for an event until it is done."""
+        if not isinstance(self._event_tasks, list):
+            self._event_tasks = []
+        self._event_tasks.append(task)
+        task.add_done_callback(self._event_tasks.remove)
+
+    def _compile_dispatch(self, event_name: str) -> _Dispatch:
+        """Split the listeners for an event into sync and async buckets."""
+        listeners = (*self._listeners.get(event_name, ()), *self._global_listeners)
+        if not listeners and self._dispatch is _NO_DISPATCH:
+            # Objects that never had a listener do not get a dispatch table
+            return _EMPTY_DISPATCH
+        dispatch = (
+            tuple(listener for listener in listeners if not listener.is_coroutine),
+            tuple(listener for listener in listeners if listener.is_coroutine),
+        )
+        if not isinstance(self._dispatch, dict):
+            self._dispatch = {}
+        self._dispatch[event_name] = dispatch
+        return dispatch
+
     def emit(self, event_name: str, data=None) -> None:
         """Run all callbacks for an event."""
-        listeners = [*self._listeners.get(event_name, []), *self._global_listeners]
-        _LOGGER.debug(
-            "Emitting event %s with data %r (%d listeners)",
-            event_name,
-            data,
-            len(listeners),
-        )
+        dispatch = self._dispatch.get(event_name)
+        if dispatch is None:
+            dispatch = self._compile_dispatch(event_name)
+        sync_listeners, async_listeners = dispatch
+
+        if TRACER.enabled:
+            TRACER.record(
+                TraceKind.EVENT, None, None, (type(self).__name__, event_name)
+            )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Emitting event %s with data %r (%d listeners)",
+                event_name,
+                data,
+                len(sync_listeners) + len(async_listeners),
+            )
 
-        for listener in listeners:
+        for listener in sync_listeners:
+            if listener.with_context:
+                listener.callback(event_name, data)
+            else:
+                listener.callback(data)
+
+        for listener in async_listeners:
             if listener.with_context:
                 call = listener.callback(event_name, data)
             else:
                 call = listener.callback(data)
-
-            if inspect.iscoroutinefunction(listener.callback):
-                task = asyncio.create_task(call)
-                self._event_tasks.append(task)
-                task.add_done_callback(self._event_tasks.remove)
+            self._track_event_task(asyncio.create_task(call))
 
     def _handle_event_protocol(self, event) -> None:
         """Process an event based on event protocol."""
@@ -115,8 +200,6 @@ class EventBase:
             _LOGGER.warning("Received unknown event: %s", event)
             return
         if inspect.iscoroutinefunction(handler):
-            task = asyncio.create_task(handler(event))
-            self._event_tasks.append(task)
-            task.add_done_callback(self._event_tasks.remove)
+            self._track_event_task(asyncio.create_task(handler(event)))
         else:
             handler(event)
@@ -0,0 +1,227 @@
+"""Passive device liveness inference for Zigbee Home Automation.
+
+Before a device that missed its availability window is pinged, the liveness
+engine looks for evidence that it is alive which was gathered without sending
+anything: router entries in the neighbor tables reported by routers during
+topology scans, with a sufficient LQI, and route records of packets that were relayed through it.
+Pings that are still needed are sent under a global rate budget, so that a mesh
+hiccup does not turn into a burst of unicasts.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import time
+from typing import TYPE_CHECKING
+
+import zigpy.device
+import zigpy.topology
+import zigpy.types
+import zigpy.zdo.types as zdo_t
+
+if TYPE_CHECKING:
+    from zha.application.gateway import Gateway
+    from zha.application.helpers import LivenessOptions
+    from zha.zigbee.device import Device
+
+_LOGGER = logging.getLogger(__name__)
+
+# Routers keep child entries until the child is removed, so a dead end device is
+# still listed by its parent
+_CHILD_RELATIONSHIPS = (
+    zdo_t.Neighbor.Relationship.Child,
+    zdo_t.Neighbor.Relationship.PreviousChild,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class LivenessMetrics:
+    """Snapshot of the liveness engine counters."""
+
+    devices_with_evidence: int
+    inferred: int
+    pings: int
+    pings_deferred: int
+    ping_tokens: float
+
+
+class LivenessEngine:
+    """Collect passive liveness evidence and budget availability pings."""
+
+    def __init__(self, gateway: Gateway) -> None:
+        """Initialize the liveness engine."""
+        self._gateway: Gateway = gateway
+        self._started: bool = False
+        self._evidence: dict[zigpy.types.EUI64, float] = {}
+        # Tables of the last scans, failed scans keep the previous table object
+        self._tables: dict[tuple[str, zigpy.types.EUI64], list] = {}
+        self._attached: set[zigpy.types.EUI64] = set()
+        self._ping_tokens: float = 0.0
+        self._ping_refill: float = 0.0
+        self.inferred: int = 0
+        self.pings: int = 0
+        self.pings_deferred: int = 0
+
+    @property
+    def options(self) -> LivenessOptions:
+        """Return the liveness options."""
+        return self._gateway.config.config.liveness_options
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether liveness inference is running."""
+        return self._started
+
+    @property
+    def metrics(self) -> LivenessMetrics:
+        """Return the evidence and ping budget counters."""
+        return LivenessMetrics(
+            devices_with_evidence=len(self._evidence),
+            inferred=self.inferred,
+            pings=self.pings,
+            pings_deferred=self.pings_deferred,
+            ping_tokens=self._refill(),
+        )
+
+    def start(self) -> None:
+        """Start collecting evidence, if enabled in the liveness options."""
+        if self._started or not self.options.enabled:
+            return
+        if self.options.pings_per_minute <= 0:
+            raise ValueError(
+                "Liveness pings per minute must be positive, got"
+                f" {self.options.pings_per_minute}"
+            )
+        self._started = True
+        self._ping_tokens = float(self.options.pings_per_minute)
+        self._ping_refill = self._gateway.loop.time()
+        self._gateway.application_controller.topology.add_context_listener(self)
+        for device in self._gateway.devices.values():
+            self.attach(device)
+        _LOGGER.debug(
+            "started liveness inference with a budget of %s pings per minute",
+            self.options.pings_per_minute,
+        )
+
+    def stop(self) -> None:
+        """Stop collecting evidence and forget it."""
+        if not self._started:
+            return
+        self._started = False
+        if (app := self._gateway.application_controller) is not None:
+            app.topology.remove_listener(self)
+        for device in self._gateway.devices.values():
+            self.detach(device)
+        self._attached.clear()
+        self._evidence.clear()
+        self._tables.clear()
+
+    def attach(self, device: Device) -> None:
+        """Listen for route records relayed through and by a device."""
+        if not self._started or device.ieee in self._attached:
+            return
+        self._attached.add(device.ieee)
+        device.device.add_context_listener(self)
+
+    def detach(self, device: Device) -> None:
+        """Stop listening to a device and drop its evidence."""
+        if device.ieee in self._attached:
+            self._attached.discard(device.ieee)
+            device.device.remove_listener(self)
+        self._evidence.pop(device.ieee, None)
+
+    def last_evidence(self, device: Device) -> float | None:
+        """Return when a device was last inferred to be alive."""
+        return self._evidence.get(device.ieee)
+
+    def infer_alive(self, device: Device) -> bool:
+        """Return whether there is recent evidence that a device is alive."""
+        evidence = self._evidence.get(device.ieee)
+        if (
+            evidence is None
+            or time.time() - evidence >= device.consider_unavailable_time
+        ):
+            return False
+        self.inferred += 1
+        return True
+
+    def acquire_ping(self) -> bool:
+        """Take a ping from the global budget, if there is one left."""
+        tokens = self._refill()
+        if tokens < 1:
+            self.pings_deferred += 1
+            return False
+        self._ping_tokens = tokens - 1
+        self.pings += 1
+        return True
+
+    def _refill(self) -> float:
+        """Refill the ping budget for the time passed since the last refill."""
+        now = self._gateway.loop.time()
+        budget = self.options.pings_per_minute
+        self._ping_tokens = min(
+            budget, self._ping_tokens + (now - self._ping_refill) * budget / 60
+        )
+        self._ping_refill = now
+        return self._ping_tokens
+
+    def _record(self, ieee: zigpy.types.EUI64, timestamp: float) -> None:
+        """Record evidence that a known device was alive at a given time."""
+        if ieee in self._gateway.devices:
+            self._evidence[ieee] = timestamp
+
+    def _scanned(self, kind: str, ieee: zigpy.types.EUI64, table: list) -> bool:
+        """Return whether a topology table comes from a successful new scan."""
+        key = (kind, ieee)
+        if self._tables.get(key) is table:
+            return False
+        self._tables[key] = table
+        return True
+
+    def neighbors_updated(
+        self,
+        topology: zigpy.topology.Topology,
+        ieee: zigpy.types.EUI64,
+        neighbors: list[zdo_t.Neighbor],
+    ) -> None:
+        """Handle the neighbor table of a router being scanned."""
+        # An empty table is also what a router that was never scanned reports
+        if not self._scanned("neighbors", ieee, neighbors) or not neighbors:
+            return
+        now = time.time()
+        # The router answered the scan
+        self._record(ieee, now)
+        min_lqi = self.options.min_lqi
+        for neighbor in neighbors:
+            if (
+                neighbor.lqi >= min_lqi
+                and neighbor.device_type != zdo_t.Neighbor.DeviceType.EndDevice
+                and neighbor.relationship not in _CHILD_RELATIONSHIPS
+            ):
+                self._record(neighbor.ieee, now)
+
+    def routes_updated(
+        self,
+        topology: zigpy.topology.Topology,
+        ieee: zigpy.types.EUI64,
+        routes: list[zdo_t.Route],
+    ) -> None:
+        """Handle the routing table of a router being scanned."""
+        if self._scanned("routes", ieee, routes) and routes:
+            self._record(ieee, time.time())
+
+    def device_relays_updated(
+        self, device: zigpy.device.Device, relays: list[zigpy.types.NWK] | None
+    ) -> None:
+        """Handle a route record of a packet relayed through other devices."""
+        if not relays:
+            return
+        now = time.time()
+        get_device = self._gateway.application_controller.get_device
+        for nwk in relays:
+            try:
+                relay = get_device(nwk=nwk)
+            except KeyError:
+                continue
+            self._record(relay.ieee, now)
@@ -0,0 +1,285 @@
+"""Central poll scheduler for Zigbee Home Automation."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+import functools
+import heapq
+import itertools
+import logging
+import random
+from typing import TYPE_CHECKING, Any, Final
+
+from zha.decorators import PeriodicSpec
+from zha.request_scheduler import RequestPriority, request_priority
+
+if TYPE_CHECKING:
+    from zha.application.gateway import Gateway
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT_POLLS: Final[int] = 8
+
+
+@dataclass(frozen=True, kw_only=True)
+class PollSchedulerMetrics:
+    """Snapshot of the poll scheduler state."""
+
+    jobs: int
+    queue_depth: int
+    due: int
+    running: int
+    max_concurrency: int
+    runs: int
+    last_lag: float
+    max_lag: float
+
+
+class PollJob:
+    """A recurring poll registered with the `PollScheduler`."""
+
+    __slots__ = (
+        "_cancelled",
+        "_deadline",
+        "_scheduler",
+        "_task",
+        "enabled",
+        "interval",
+        "name",
+        "target",
+    )
+
+    def __init__(
+        self,
+        scheduler: PollScheduler,
+        target: Callable[[], Coroutine[Any, Any, Any]],
+        interval: float,
+        name: str,
+    ) -> None:
+        """Initialize the poll job."""
+        self._scheduler: PollScheduler = scheduler
+        self.target: Callable[[], Coroutine[Any, Any, Any]] = target
+        self.interval: float = interval
+        self.name: str = name
+        self.enabled: bool = True
+        self._cancelled: bool = False
+        self._deadline: float | None = None
+        self._task: asyncio.Task | None = None
+
+    def __repr__(self) -> str:
+        """Return a representation of the poll job."""
+        return (
+            f"<{self.__class__.__name__} name={self.name} interval={self.interval}"
+            f" enabled={self.enabled} deadline={self._deadline}>"
+        )
+
+    @property
+    def deadline(self) -> float | None:
+        """Return the loop time of the next run, if scheduled."""
+        return self._deadline
+
+    @property
+    def running(self) -> bool:
+        """Return whether the job is currently running."""
+        return self._task is not None
+
+    def enable(self) -> None:
+        """Resume scheduling this job, one interval from now."""
+        if self._cancelled or (self.enabled and self._deadline is not None):
+            return
+        self.enabled = True
+        if not self.running:
+            self._scheduler._schedule(self, self._scheduler.loop.time() + self.interval)
+
+    def disable(self) -> None:
+        """Stop scheduling this job, letting an in-flight run finish."""
+        self.enabled = False
+        self._deadline = None
+
+    def cancel(self) -> None:
+        """Remove this job from the scheduler and cancel an in-flight run."""
+        self.disable()
+        self._cancelled = True
+        self._scheduler._jobs.discard(self)
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+
+class PollScheduler:
+    """Run recurring poll jobs from a single deadline heap.
+
+    Jobs are kept in a heap ordered by their next deadline and a single timer is
+    armed for the earliest one. Due jobs are started as short lived tasks, at
+    most `max_concurrency` at a time, and rescheduled one interval after they
+    complete.
+    """
+
+    def __init__(
+        self,
+        gateway: Gateway,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_POLLS,
+    ) -> None:
+        """Initialize the poll scheduler."""
+        self._gateway: Gateway = gateway
+        self.loop: asyncio.AbstractEventLoop = gateway.loop
+        self.max_concurrency: int = max_concurrency
+        self._heap: list[tuple[float, int, PollJob]] = []
+        self._sequence = itertools.count()
+        self._jobs: set[PollJob] = set()
+        self._running: set[PollJob] = set()
+        self._timer: asyncio.TimerHandle | None = None
+        self._started: bool = False
+        self._runs: int = 0
+        self._last_lag: float = 0.0
+        self._max_lag: float = 0.0
+
+    @property
+    def metrics(self) -> PollSchedulerMetrics:
+        """Return queue depth, lag and concurrency metrics."""
+        now = self.loop.time()
+        deadlines = [job.deadline for job in self._jobs if job.deadline is not None]
+        return PollSchedulerMetrics(
+            jobs=len(self._jobs),
+            queue_depth=len(deadlines),
+            due=sum(1 for deadline in deadlines if deadline <= now),
+            running=len(self._running),
+            max_concurrency=self.max_concurrency,
+            runs=self._runs,
+            last_lag=self._last_lag,
+            max_lag=self._max_lag,
+        )
+
+    def start(self) -> None:
+        """Start running scheduled jobs."""
+        self._started = True
+        self._arm()
+        _LOGGER.debug(
+            "started poll scheduler with %s jobs and a concurrency of %s",
+            len(self._jobs),
+            self.max_concurrency,
+        )
+
+    def stop(self) -> None:
+        """Stop the scheduler and forget all jobs."""
+        self._started = False
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for job in list(self._jobs):
+            job.cancel()
+        self._heap.clear()
+        _LOGGER.debug("poll scheduler stopped")
+
+    def register(
+        self,
+        target: Callable[[], Coroutine[Any, Any, Any]],
+        interval: float,
+        *,
+        name: str,
+        run_immediately: bool = False,
+    ) -> PollJob:
+        """Register a coroutine function to be called every `interval` seconds."""
+        if interval <= 0:
+            raise ValueError(f"Poll interval must be positive, got {interval}")
+        job = PollJob(self, target, interval, name)
+        self._jobs.add(job)
+        now = self.loop.time()
+        self._schedule(job, now if run_immediately else now + interval)
+        return job
+
+    def register_periodic(
+        self, method: Callable[..., Any], *, name: str | None = None
+    ) -> PollJob:
+        """Register a bound method decorated with `periodic`."""
+        spec: PeriodicSpec = method.periodic_spec  # type: ignore[attr-defined]
+        instance = method.__self__  # type: ignore[attr-defined]
+        interval = random.randint(*spec.refresh_interval)
+        setattr(instance, "__polling_interval", interval)
+        return self.register(
+            functools.partial(spec.func, instance),
+            interval,
+            name=name or f"[{spec.func.__module__}::{spec.func.__qualname__}]",
+            run_immediately=spec.run_immediately,
+        )
+
+    def _schedule(self, job: PollJob, deadline: float) -> None:
+        """Push a job onto the heap."""
+        job._deadline = deadline
+        heapq.heappush(self._heap, (deadline, next(self._sequence), job))
+        self._arm()
+
+    def _arm(self) -> None:
+        """Arm the timer for the earliest live deadline."""
+        heap = self._heap
+        # Entries for disabled, cancelled or rescheduled jobs are dropped lazily
+        while heap and heap[0][2]._deadline != heap[0][0]:
+            heapq.heappop(heap)
+
+        if not self._started or not heap or len(self._running) >= self.max_concurrency:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            return
+
+        deadline = heap[0][0]
+        if self._timer is not None:
+            if self._timer.when() == deadline:
+                return
+            self._timer.cancel()
+        self._timer = self.loop.call_at(deadline, self._run_due)
+
+    def _run_due(self) -> None:
+        """Start all due jobs while there are free slots."""
+        # The loop may run a timer up to one clock resolution early
+        now = self.loop.time()
+        if self._timer is not None:
+            now = max(now, self._timer.when())
+            self._timer = None
+        heap = self._heap
+        while heap and len(self._running) < self.max_concurrency:
+            deadline, _, job = heap[0]
+            if job._deadline != deadline:
+                heapq.heappop(heap)
+                continue
+            if deadline > now:
+                break
+            heapq.heappop(heap)
+            self._start(job, now - deadline)
+        self._arm()
+
+    def _start(self, job: PollJob, lag: float) -> None:
+        """Start a single run of a job."""
+        job._deadline = None
+        self._runs += 1
+        self._last_lag = lag
+        self._max_lag = max(self._max_lag, lag)
+        self._running.add(job)
+        task = self._gateway.async_create_background_task(
+            self._run(job),
+            name=f"poll_job_{job.name}",
+            eager_start=True,
+        )
+        if not task.done():
+            job._task = task
+
+    async def _run(self, job: PollJob) -> None:
+        """Run a job and reschedule it."""
+        reschedule = True
+        try:
+            with request_priority(RequestPriority.POLLING):
+                await job.target()
+        except asyncio.CancelledError:
+            _LOGGER.debug("Poll job %s cancelled", job.name)
+            reschedule = False
+            raise
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.warning("Failed to poll using job %s", job.name, exc_info=ex)
+        finally:
+            job._task = None
+            self._running.discard(job)
+            if reschedule and job.enabled and self._started:
+                self._schedule(job, self.loop.time() + job.interval)
+            else:
+                self._arm()
@@ -0,0 +1,164 @@
+"""Priority aware radio request scheduler for Zigbee Home Automation."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+import contextlib
+from contextvars import ContextVar
+from dataclasses import dataclass
+import enum
+import heapq
+import itertools
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from zha.application.gateway import Gateway
+
+
+DEFAULT_MAX_CONCURRENT_REQUESTS: Final[int] = 8
+
+
+class RequestPriority(enum.IntEnum):
+    """Priority class of a radio request, lower values are served first."""
+
+    INTERACTIVE = 0
+    CONFIGURATION = 1
+    POLLING = 2
+    DIAGNOSTICS = 3
+
+
+REQUEST_PRIORITY: ContextVar[RequestPriority] = ContextVar(
+    "zha_request_priority", default=RequestPriority.INTERACTIVE
+)
+
+
+@contextlib.contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Send all requests made within the block with the given priority."""
+    token = REQUEST_PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        REQUEST_PRIORITY.reset(token)
+
+
+@dataclass(frozen=True, kw_only=True)
+class RequestClassStats:
+    """Wait time statistics for a single request priority class."""
+
+    requests: int
+    queued: int
+    pending: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def average_wait(self) -> float:
+        """Return the average time a request waited for a slot."""
+        return self.total_wait / self.requests if self.requests else 0.0
+
+
+class RequestScheduler:
+    """Hand out radio request slots by priority.
+
+    At most `max_concurrency` requests are in flight at once. When all slots are
+    taken, waiting requests are served by priority and then in arrival order, so
+    that interactive commands never queue behind a polling sweep.
+    """
+
+    def __init__(self, gateway: Gateway, max_concurrency: int | None = None) -> None:
+        """Initialize the request scheduler."""
+        self._gateway: Gateway = gateway
+        self._max_concurrency: int | None = max_concurrency
+        self._active: int = 0
+        self._waiters: list[tuple[RequestPriority, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._requests: dict[RequestPriority, int] = dict.fromkeys(RequestPriority, 0)
+        self._queued: dict[RequestPriority, int] = dict.fromkeys(RequestPriority, 0)
+        self._total_wait: dict[RequestPriority, float] = dict.fromkeys(
+            RequestPriority, 0.0
+        )
+        self._max_wait: dict[RequestPriority, float] = dict.fromkeys(
+            RequestPriority, 0.0
+        )
+
+    @property
+    def max_concurrency(self) -> int:
+        """Return the number of requests allowed in flight at once."""
+        if self._max_concurrency is not None:
+            return self._max_concurrency
+        if self._gateway.application_controller is not None:
+            return self._gateway.radio_concurrency
+        return DEFAULT_MAX_CONCURRENT_REQUESTS
+
+    @property
+    def active(self) -> int:
+        """Return the number of requests in flight."""
+        return self._active
+
+    @property
+    def stats(self) -> dict[RequestPriority, RequestClassStats]:
+        """Return wait time statistics per priority class."""
+        pending = dict.fromkeys(RequestPriority, 0)
+        for priority, _, _ in self._waiters:
+            pending[priority] += 1
+        return {
+            priority: RequestClassStats(
+                requests=self._requests[priority],
+                queued=self._queued[priority],
+                pending=pending[priority],
+                total_wait=self._total_wait[priority],
+                max_wait=self._max_wait[priority],
+            )
+            for priority in RequestPriority
+        }
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self, priority: RequestPriority | None = None
+    ) -> AsyncIterator[None]:
+        """Hold a request slot for the duration of the block."""
+        if priority is None:
+            priority = REQUEST_PRIORITY.get()
+
+        loop = self._gateway.loop
+        wait = 0.0
+        if self._active < self.max_concurrency and not self._waiters:
+            self._active += 1
+        else:
+            start = loop.time()
+            waiter: asyncio.Future[None] = loop.create_future()
+            entry = (priority, next(self._sequence), waiter)
+            heapq.heappush(self._waiters, entry)
+            self._queued[priority] += 1
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # The slot was handed over right before cancellation
+                    self._release()
+                elif entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                raise
+            wait = loop.time() - start
+
+        self._requests[priority] += 1
+        self._total_wait[priority] += wait
+        self._max_wait[priority] = max(self._max_wait[priority], wait)
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        """Hand the slot to the next waiter or free it."""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            # Waiters cancelled in this loop iteration are still queued
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
@@ -0,0 +1,107 @@
+"""Structured tracing of hot paths for Zigbee Home Automation.
+
+Tracing keeps the most recent records of attribute updates, events, availability
+checks and log calls in a fixed size ring buffer, without formatting anything.
+It is disabled by default and call sites check `TRACER.enabled` before building
+a record, so that tracing costs a single attribute lookup when it is off.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+import enum
+import time
+from typing import Any, Final
+
+DEFAULT_TRACE_SIZE: Final[int] = 10_000
+
+
+class TraceKind(enum.StrEnum):
+    """Kind of a trace record."""
+
+    ATTRIBUTE_UPDATED = "attribute_updated"
+    AVAILABILITY_CHECK = "availability_check"
+    EVENT = "event"
+    LOG = "log"
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class TraceRecord:
+    """A single trace record."""
+
+    timestamp: float
+    nwk: int | None
+    cluster: int | None
+    kind: TraceKind
+    value: Any
+
+
+class Tracer:
+    """Record structured trace records into a ring buffer."""
+
+    def __init__(self, size: int = DEFAULT_TRACE_SIZE) -> None:
+        """Initialize the tracer."""
+        self.enabled: bool = False
+        self._devices: frozenset[int] | None = None
+        self._clusters: frozenset[int] | None = None
+        self._records: deque[tuple[float, int | None, int | None, TraceKind, Any]] = (
+            deque(maxlen=size)
+        )
+
+    @property
+    def size(self) -> int:
+        """Return the number of records kept."""
+        return self._records.maxlen or 0
+
+    def enable(
+        self,
+        *,
+        devices: Iterable[int] | None = None,
+        clusters: Iterable[int] | None = None,
+        size: int | None = None,
+    ) -> None:
+        """Start tracing, optionally only the given device NWKs and cluster ids.
+
+        Records that are not about a device or a cluster, like events emitted by
+        other objects, are only kept when the respective filter is not set.
+        """
+        self._devices = None if devices is None else frozenset(devices)
+        self._clusters = None if clusters is None else frozenset(clusters)
+        if size is not None and size != self.size:
+            self._records = deque(self._records, maxlen=size)
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop tracing, keeping the records traced so far."""
+        self.enabled = False
+
+    def clear(self) -> None:
+        """Drop all records."""
+        self._records.clear()
+
+    def record(
+        self, kind: TraceKind, nwk: int | None, cluster: int | None, value: Any
+    ) -> None:
+        """Record a trace record if it passes the filters."""
+        if self._devices is not None and nwk not in self._devices:
+            return
+        if self._clusters is not None and cluster not in self._clusters:
+            return
+        self._records.append((time.time(), nwk, cluster, kind, value))
+
+    def dump(self, *, clear: bool = False) -> list[TraceRecord]:
+        """Return the records in the buffer, oldest first."""
+        records = [
+            TraceRecord(
+                timestamp=timestamp, nwk=nwk, cluster=cluster, kind=kind, value=value
+            )
+            for timestamp, nwk, cluster, kind, value in self._records
+        ]
+        if clear:
+            self.clear()
+        return records
+
+
+TRACER: Final[Tracer] = Tracer()
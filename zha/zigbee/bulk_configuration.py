@@ -0,0 +1,220 @@
+"""Bulk device configuration for Zigbee Home Automation.
+
+Reconfiguring a whole network, after the coordinator was replaced or the
+channel changed, binds clusters and configures reporting on every cluster
+handler of every device. Bulk configuration runs these steps for a few devices
+at a time under a budget of requests per second shared by all of them, starting
+with mains powered routers which the rest of the mesh relies on. Steps that
+failed are retried in later rounds, once every other device had its turn.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+import logging
+from typing import TYPE_CHECKING, Final
+
+from zigpy.types import EUI64
+
+from zha.application.const import ZHA_GW_MSG, ZHA_GW_MSG_BULK_CONFIGURATION_PROGRESS
+from zha.async_ import gather_with_limited_concurrency
+from zha.request_scheduler import RequestPriority, request_priority
+from zha.zigbee.cluster_handlers import ConfigurationStep
+
+if TYPE_CHECKING:
+    from zha.application.gateway import Gateway
+    from zha.application.helpers import BulkConfigurationOptions
+    from zha.zigbee.device import Device
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(kw_only=True, frozen=True)
+class BulkConfigurationProgressEvent:
+    """Event to signal that a device finished a round of bulk configuration."""
+
+    device_ieee: EUI64
+    round: int
+    failed_steps: int
+    devices_done: int
+    devices_total: int
+    event_type: Final[str] = ZHA_GW_MSG
+    event: Final[str] = ZHA_GW_MSG_BULK_CONFIGURATION_PROGRESS
+
+
+@dataclass(frozen=True, kw_only=True)
+class BulkConfigurationSummary:
+    """Outcome of configuring a set of devices."""
+
+    devices: int
+    configured: int
+    steps: int
+    retried: int
+    rounds: int
+    # Steps that failed in every round, by the name of the cluster they configure
+    failures: dict[str, int]
+    failed_devices: list[EUI64]
+
+
+def _rank(device: Device) -> int:
+    """Return the configuration order of a device, routers first."""
+    if device.is_mains_powered:
+        return 0 if device.is_router else 1
+    return 2
+
+
+class BulkConfiguration:
+    """Configure devices under a shared concurrency and airtime budget."""
+
+    def __init__(self, gateway: Gateway, devices: Iterable[Device]) -> None:
+        """Initialize the bulk configuration."""
+        self._gateway: Gateway = gateway
+        if self.options.requests_per_second <= 0:
+            raise ValueError(
+                "Bulk configuration requests per second must be positive, got"
+                f" {self.options.requests_per_second}"
+            )
+        self._devices: list[Device] = sorted(devices, key=_rank)
+        self._tokens: float = self._capacity
+        self._refilled: float = gateway.loop.time()
+        self._steps: int = 0
+        self._retried: int = 0
+        # The current round, the devices it configures and those done so far
+        self._round: int = 0
+        self._round_devices: int = 0
+        self._done: int = 0
+
+    @property
+    def options(self) -> BulkConfigurationOptions:
+        """Return the bulk configuration options."""
+        return self._gateway.config.config.bulk_configuration_options
+
+    @property
+    def _capacity(self) -> float:
+        """Return the requests that can be sent in a single burst."""
+        return max(float(self.options.requests_per_second), 1.0)
+
+    async def run(self) -> BulkConfigurationSummary:
+        """Configure the devices and retry failed steps."""
+        options = self.options
+        _LOGGER.debug(
+            "configuring %s devices, %s at a time with a budget of %s requests/s",
+            len(self._devices),
+            options.max_concurrency,
+            options.requests_per_second,
+        )
+        pending: dict[EUI64, list[tuple[str, ConfigurationStep]]] = {}
+        with request_priority(RequestPriority.CONFIGURATION):
+            devices = self._devices
+            while devices:
+                self._done = 0
+                self._round_devices = len(devices)
+                results = await gather_with_limited_concurrency(
+                    options.max_concurrency,
+                    *(
+                        self._configure(device, pending.get(device.ieee))
+                        for device in devices
+                    ),
+                )
+                pending = {
+                    device.ieee: failed
+                    for device, failed in zip(devices, results)
+                    if failed
+                }
+                if not pending or self._round >= options.retries:
+                    break
+                self._round += 1
+                _LOGGER.debug(
+                    "retrying the failed configuration steps of %s devices in %ss",
+                    len(pending),
+                    options.retry_delay,
+                )
+                await asyncio.sleep(options.retry_delay)
+                devices = [
+                    device
+                    for device in self._devices
+                    if device.ieee in pending
+                    and self._gateway.devices.get(device.ieee) is device
+                ]
+
+        return BulkConfigurationSummary(
+            devices=len(self._devices),
+            configured=len(self._devices) - len(pending),
+            steps=self._steps,
+            retried=self._retried,
+            rounds=self._round + 1,
+            failures=dict(
+                Counter(cluster for failed in pending.values() for cluster, _ in failed)
+            ),
+            failed_devices=list(pending),
+        )
+
+    async def _configure(
+        self,
+        device: Device,
+        steps: list[tuple[str, ConfigurationStep]] | None,
+    ) -> list[tuple[str, ConfigurationStep]]:
+        """Run the configuration steps of a device and return the failed ones."""
+        if steps is None:
+            device.debug("started bulk configuration")
+            failed = await self._run_steps(device, device.configuration_steps())
+            device.configuration_finished()
+        else:
+            failed = await self._run_steps(device, steps)
+            self._retried += len(steps)
+
+        self._done += 1
+        self._gateway.emit(
+            ZHA_GW_MSG_BULK_CONFIGURATION_PROGRESS,
+            BulkConfigurationProgressEvent(
+                device_ieee=device.ieee,
+                round=self._round,
+                failed_steps=len(failed),
+                devices_done=self._done,
+                devices_total=self._round_devices,
+            ),
+        )
+        return failed
+
+    async def _run_steps(
+        self, device: Device, steps: list[tuple[str, ConfigurationStep]]
+    ) -> list[tuple[str, ConfigurationStep]]:
+        """Run configuration steps one by one and return the failed ones."""
+        failed = []
+        for cluster, step in steps:
+            await self._spend(step.requests)
+            self._steps += 1
+            try:
+                succeeded = await step.run() is not False
+            except Exception as ex:  # pylint: disable=broad-except
+                device.debug(
+                    "'%s' configuration step of the '%s' cluster failed: %s",
+                    step.name,
+                    cluster,
+                    ex,
+                    exc_info=ex,
+                )
+                succeeded = False
+            if not succeeded:
+                failed.append((cluster, step))
+        return failed
+
+    async def _spend(self, requests: int) -> None:
+        """Wait until the airtime budget allows sending `requests` requests."""
+        if requests <= 0:
+            return
+        loop = self._gateway.loop
+        rate = self.options.requests_per_second
+        capacity = self._capacity
+        requests = min(requests, capacity)
+        while True:
+            now = loop.time()
+            self._tokens = min(capacity, self._tokens + (now - self._refilled) * rate)
+            self._refilled = now
+            if self._tokens >= requests:
+                self._tokens -= requests
+                return
+            await asyncio.sleep((requests - self._tokens) / rate)
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable, Coroutine, Iterator
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine, Iterator, Mapping
 import contextlib
 from dataclasses import dataclass
 from enum import Enum
 import functools
 import logging
+import math
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Final, ParamSpec, TypedDict
 
 import zigpy.exceptions
@@ -16,11 +19,15 @@ import zigpy.zcl
 from zigpy.zcl.foundation import (
     CommandSchema,
     ConfigureReportingResponseRecord,
+    GeneralCommand,
     Status,
     ZCLAttributeDef,
+    ZCLHeader,
 )
 
 from zha.application.const import (
+    REPORT_CONFIG,
+    ZCL_INIT_ATTRS,
     ZHA_CLUSTER_HANDLER_MSG,
     ZHA_CLUSTER_HANDLER_MSG_BIND,
     ZHA_CLUSTER_HANDLER_MSG_CFG_RPT,
@@ -29,6 +36,8 @@ from zha.application.helpers import safe_read
 from zha.event import EventBase
 from zha.exceptions import ZHAException
 from zha.mixins import LogMixin
+from zha.request_scheduler import REQUEST_PRIORITY, RequestPriority, request_priority
+from zha.trace import TRACER, TraceKind
 from zha.zigbee.cluster_handlers.const import (
     ARGS,
     ATTRIBUTE_ID,
@@ -38,6 +47,7 @@ from zha.zigbee.cluster_handlers.const import (
     CLUSTER_HANDLER_EVENT,
     CLUSTER_HANDLER_ZDO,
     CLUSTER_ID,
+    CLUSTER_READ_COALESCE_WINDOW,
     CLUSTER_READS_PER_REQ,
     COMMAND,
     PARAMS,
@@ -79,10 +89,12 @@ def wrap_zigpy_exceptions() -> Iterator[None]:
 def retry_request(func: _FuncType[_P]) -> _ReturnFuncType[_P]:
     """Send a request with retries and wrap expected zigpy exceptions."""
 
+    retrying_func = RETRYABLE_REQUEST_DECORATOR(func)
+
     @functools.wraps(func)
     async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> Any:
         with wrap_zigpy_exceptions():
-            return await RETRYABLE_REQUEST_DECORATOR(func)(*args, **kwargs)
+            return await retrying_func(*args, **kwargs)
 
     return wrapper
 
@@ -183,6 +195,117 @@ class ClusterHandlerInfo:
     value_attribute: str | None = None
 
 
+# Whether the cache may be used, the manufacturer code and whether errors are raised
+_PendingReadKey = tuple[bool, int | None, bool]
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    """Mark the exception of a future as retrieved."""
+    if not future.cancelled():
+        future.exception()
+
+
+class _PendingRead:
+    """Attribute reads to a cluster waiting to be sent as one request."""
+
+    __slots__ = ("attributes", "future", "priority")
+
+    def __init__(self, future: asyncio.Future) -> None:
+        """Initialize the pending read."""
+        self.attributes: dict[int | str, None] = {}
+        self.future: asyncio.Future[
+            tuple[dict[int | str, Any], dict[int | str, Exception]]
+        ] = future
+        self.priority: RequestPriority = REQUEST_PRIORITY.get()
+        # Waiters may all be cancelled before the read fails
+        future.add_done_callback(_retrieve_exception)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ConfigurationStep:
+    """A single step of configuring a cluster handler."""
+
+    name: str
+    # Returns False or raises when the step failed
+    run: Callable[[], Awaitable[bool | None]]
+    # Number of requests the step sends
+    requests: int = 1
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class AttributePlan:
+    """Attributes a cluster handler reads and reports, resolved once."""
+
+    cached_init_attributes: tuple[str, ...]
+    uncached_init_attributes: tuple[str, ...]
+    # (attribute name, attribute as configured, reporting config) per attribute
+    reported_attributes: tuple[tuple[str, int | str, tuple[int, int, float | int]], ...]
+    # Reporting configuration batched by `REPORT_CONFIG_ATTR_PER_REQ`
+    report_chunks: tuple[dict[int | str, tuple[int, int, float | int]], ...]
+    manufacturer_specific: bool
+
+    @classmethod
+    def build(
+        cls,
+        cluster: zigpy.zcl.Cluster,
+        init_attrs: dict[str, bool],
+        report_config: tuple[AttrReportConfig, ...],
+    ) -> AttributePlan:
+        """Resolve the attribute plan of a cluster handler for a cluster."""
+        reported_attributes = []
+        for attr_report in report_config:
+            attr = attr_report["attr"]
+            try:
+                attr_name = cluster.find_attribute(attr).name
+            except KeyError:
+                attr_name = attr
+            reported_attributes.append((attr_name, attr, attr_report["config"]))
+
+        return cls(
+            cached_init_attributes=tuple(
+                attr for attr, cached in init_attrs.items() if cached
+            ),
+            uncached_init_attributes=(
+                *(attr for attr, cached in init_attrs.items() if not cached),
+                *(attr_report["attr"] for attr_report in report_config),
+            ),
+            reported_attributes=tuple(reported_attributes),
+            report_chunks=tuple(
+                {
+                    attr_report["attr"]: attr_report["config"]
+                    for attr_report in report_config[
+                        index : index + REPORT_CONFIG_ATTR_PER_REQ
+                    ]
+                }
+                for index in range(0, len(report_config), REPORT_CONFIG_ATTR_PER_REQ)
+            ),
+            manufacturer_specific=cluster.cluster_id >= 0xFC00,
+        )
+
+
+# Plans of cluster handlers using their class level attributes
+_ATTRIBUTE_PLANS: dict[
+    tuple[type[ClusterHandler], type[zigpy.zcl.Cluster]], AttributePlan
+] = {}
+_NO_PENDING_READS: Final[Mapping[_PendingReadKey, _PendingRead]] = MappingProxyType({})
+_NO_PROXIED_COMMANDS: Final[Mapping[str, tuple[Any, _ReturnFuncType]]] = (
+    MappingProxyType({})
+)
+_NO_REPORTS: Final[Mapping[int, float]] = MappingProxyType({})
+
+
+def _cluster_command_source(cluster: zigpy.zcl.Cluster, name: str) -> Any:
+    """Return what a cluster attribute resolves from, to detect it being replaced.
+
+    Commands resolved by `Cluster.__getattr__` have no source of their own and
+    only depend on the cluster class.
+    """
+    try:
+        return cluster.__dict__[name]
+    except KeyError:
+        return getattr(type(cluster), name, None)
+
+
 class ClusterHandler(LogMixin, EventBase):
     """Base cluster handler for a Zigbee cluster."""
 
@@ -194,6 +317,31 @@ class ClusterHandler(LogMixin, EventBase):
     # attribute read is acceptable.
     ZCL_INIT_ATTRS: dict[str, bool] = {}
 
+    # Number of attribute updates received, to invalidate state built from them
+    attribute_updates: int = 0
+
+    # Allocated on the first attribute read
+    _pending_reads: (
+        dict[_PendingReadKey, _PendingRead] | Mapping[_PendingReadKey, _PendingRead]
+    ) = _NO_PENDING_READS
+    # Allocated on the first proxied cluster command, by name
+    _proxied_commands: (
+        dict[str, tuple[Any, _ReturnFuncType]]
+        | Mapping[str, tuple[Any, _ReturnFuncType]]
+    ) = _NO_PROXIED_COMMANDS
+    # Coalesced reads being sent to the device
+    _reads_in_flight: int = 0
+    # Loop time of the last report of each attribute, allocated on the first report
+    _last_reports: dict[int, float] | Mapping[int, float] = _NO_REPORTS
+
+    # Polls of attributes reported this recently are skipped, the shortest interval
+    # entities poll at
+    POLL_REPORT_WINDOW: float = 30
+    # Polls skipped entirely and attribute reads left out of polls, as all or some
+    # of the polled attributes were reported within the window
+    polls_avoided: int = 0
+    attribute_polls_avoided: int = 0
+
     def __init__(self, cluster: zigpy.zcl.Cluster, endpoint: Endpoint) -> None:
         """Initialize ClusterHandler."""
         super().__init__()
@@ -217,6 +365,34 @@ class ClusterHandler(LogMixin, EventBase):
         """Filter the cluster match for specific devices."""
         return True
 
+    @property
+    def attribute_plan(self) -> AttributePlan:
+        """Return the attributes this cluster handler reads and reports.
+
+        Plans are shared by all handlers of a class for the same cluster class.
+        Handlers that set their own `ZCL_INIT_ATTRS` or `REPORT_CONFIG` keep a
+        plan of their own.
+        """
+        instance_attrs = self.__dict__
+        if ZCL_INIT_ATTRS in instance_attrs or REPORT_CONFIG in instance_attrs:
+            init_attrs, report_config = self.ZCL_INIT_ATTRS, self.REPORT_CONFIG
+            own = instance_attrs.get("_attribute_plan")
+            if own is None or own[0] is not init_attrs or own[1] is not report_config:
+                own = (
+                    init_attrs,
+                    report_config,
+                    AttributePlan.build(self._cluster, init_attrs, report_config),
+                )
+                instance_attrs["_attribute_plan"] = own
+            return own[2]
+
+        key = (type(self), type(self._cluster))
+        if (plan := _ATTRIBUTE_PLANS.get(key)) is None:
+            plan = _ATTRIBUTE_PLANS[key] = AttributePlan.build(
+                self._cluster, self.ZCL_INIT_ATTRS, self.REPORT_CONFIG
+            )
+        return plan
+
     @functools.cached_property
     def info_object(self) -> ClusterHandlerInfo:
         """Return info about this cluster handler."""
@@ -270,14 +446,14 @@ class ClusterHandler(LogMixin, EventBase):
         """Make this a hashable."""
         return hash(self._unique_id)
 
-    async def bind(self) -> None:
-        """Bind a zigbee cluster.
+    async def bind(self) -> bool:
+        """Bind a zigbee cluster, returning whether it succeeded.
 
         This also swallows ZigbeeException exceptions that are thrown when
         devices are unreachable.
         """
         try:
-            res = await self.cluster.bind()
+            res = await self._scheduled_request(self.cluster.bind)()
             self.debug("bound '%s' cluster: %s", self.cluster.ep_attribute, res[0])
             self._endpoint.device.emit(
                 ZHA_CLUSTER_HANDLER_MSG_BIND,
@@ -288,6 +464,7 @@ class ClusterHandler(LogMixin, EventBase):
                     success=res[0] == 0,
                 ),
             )
+            return res[0] == 0
         except (zigpy.exceptions.ZigbeeException, TimeoutError) as ex:
             self.debug(
                 "Failed to bind '%s' cluster: %s",
@@ -304,30 +481,23 @@ class ClusterHandler(LogMixin, EventBase):
                     success=False,
                 ),
             )
+            return False
 
-    async def configure_reporting(self) -> None:
+    async def configure_reporting(self) -> bool:
         """Configure attribute reporting for a cluster.
 
-        This also swallows ZigbeeException exceptions that are thrown when
-        devices are unreachable.
+        Returns whether all requests were answered, attributes the device
+        refused to report on do not count as a failure. This also swallows
+        ZigbeeException exceptions that are thrown when devices are unreachable.
         """
-        event_data = {}
+        answered = True
+        plan = self.attribute_plan
         kwargs = {}
-        if (
-            self.cluster.cluster_id >= 0xFC00
-            and self._endpoint.device.manufacturer_code
-        ):
+        if plan.manufacturer_specific and self._endpoint.device.manufacturer_code:
             kwargs["manufacturer"] = self._endpoint.device.manufacturer_code
 
-        for attr_report in self.REPORT_CONFIG:
-            attr, config = attr_report["attr"], attr_report["config"]
-
-            try:
-                attr_name = self.cluster.find_attribute(attr).name
-            except KeyError:
-                attr_name = attr
-
-            event_data[attr_name] = {
+        event_data = {
+            attr_name: {
                 "min": config[0],
                 "max": config[1],
                 "id": attr,
@@ -335,16 +505,14 @@ class ClusterHandler(LogMixin, EventBase):
                 "change": config[2],
                 "status": None,
             }
+            for attr_name, attr, config in plan.reported_attributes
+        }
 
-        to_configure = [*self.REPORT_CONFIG]
-        chunk, rest = (
-            to_configure[:REPORT_CONFIG_ATTR_PER_REQ],
-            to_configure[REPORT_CONFIG_ATTR_PER_REQ:],
-        )
-        while chunk:
-            reports = {rec["attr"]: rec["config"] for rec in chunk}
+        for reports in plan.report_chunks:
             try:
-                res = await self.cluster.configure_reporting_multiple(reports, **kwargs)
+                res = await self._scheduled_request(
+                    self.cluster.configure_reporting_multiple
+                )(reports, **kwargs)
                 self._configure_reporting_status(reports, res[0], event_data)
             except (zigpy.exceptions.ZigbeeException, TimeoutError) as ex:
                 self.debug(
@@ -352,11 +520,8 @@ class ClusterHandler(LogMixin, EventBase):
                     self.cluster.ep_attribute,
                     str(ex),
                 )
+                answered = False
                 break
-            chunk, rest = (
-                rest[:REPORT_CONFIG_ATTR_PER_REQ],
-                rest[REPORT_CONFIG_ATTR_PER_REQ:],
-            )
 
         self._endpoint.device.emit(
             ZHA_CLUSTER_HANDLER_MSG_CFG_RPT,
@@ -367,6 +532,7 @@ class ClusterHandler(LogMixin, EventBase):
                 attributes=event_data,
             ),
         )
+        return answered
 
     def _configure_reporting_status(
         self,
@@ -430,34 +596,66 @@ class ClusterHandler(LogMixin, EventBase):
     async def async_configure(self) -> None:
         """Set cluster binding and attribute reporting."""
         if not self._endpoint.device.skip_configuration:
-            if self.BIND:
-                self.debug("Performing cluster binding")
-                await self.bind()
-            if self.cluster.is_server:
-                self.debug("Configuring cluster attribute reporting")
-                await self.configure_reporting()
-            ch_specific_cfg = getattr(
-                self, "async_configure_cluster_handler_specific", None
-            )
-            if ch_specific_cfg:
-                self.debug("Performing cluster handler specific configuration")
-                await ch_specific_cfg()
+            for step in self._configuration_steps():
+                self.debug("performing the '%s' configuration step", step.name)
+                await step.run()
             self.debug("finished cluster handler configuration")
         else:
             self.debug("skipping cluster handler configuration")
         self._status = ClusterHandlerStatus.CONFIGURED
 
+    def configuration_steps(self) -> list[ConfigurationStep]:
+        """Return the steps `async_configure` takes, to run them one by one.
+
+        Steps return False or raise when they failed. Cluster handlers with their
+        own `async_configure` are configured in a single step.
+        """
+        if type(self).async_configure is not ClusterHandler.async_configure:
+            return [ConfigurationStep(name="configure", run=self.async_configure)]
+        if self._endpoint.device.skip_configuration:
+            return []
+        return self._configuration_steps()
+
+    def _configuration_steps(self) -> list[ConfigurationStep]:
+        """Return the binding, reporting and specific configuration steps."""
+        steps = []
+        if self.BIND:
+            steps.append(ConfigurationStep(name="bind", run=self.bind))
+        if self.cluster.is_server:
+            steps.append(
+                ConfigurationStep(
+                    name="configure_reporting",
+                    run=self.configure_reporting,
+                    requests=max(len(self.attribute_plan.report_chunks), 1),
+                )
+            )
+        ch_specific_cfg = getattr(
+            self, "async_configure_cluster_handler_specific", None
+        )
+        if ch_specific_cfg:
+            steps.append(ConfigurationStep(name="configure", run=ch_specific_cfg))
+        return steps
+
+    def configuration_finished(self) -> None:
+        """Mark the cluster handler configured after running its steps."""
+        if type(self).async_configure is ClusterHandler.async_configure:
+            self._status = ClusterHandlerStatus.CONFIGURED
+
     async def async_initialize(self, from_cache: bool) -> None:
         """Initialize cluster handler."""
-        if not from_cache and self._endpoint.device.skip_configuration:
+        if from_cache:
+            self.initialize_from_cache()
+            return
+
+        if self._endpoint.device.skip_configuration:
             self.debug("Skipping cluster handler initialization")
             self._status = ClusterHandlerStatus.INITIALIZED
             return
 
         self.debug("initializing cluster handler: from_cache: %s", from_cache)
-        cached = [a for a, cached in self.ZCL_INIT_ATTRS.items() if cached]
-        uncached = [a for a, cached in self.ZCL_INIT_ATTRS.items() if not cached]
-        uncached.extend([cfg["attr"] for cfg in self.REPORT_CONFIG])
+        plan = self.attribute_plan
+        cached = plan.cached_init_attributes
+        uncached = plan.uncached_init_attributes
 
         if cached:
             self.debug("initializing cached cluster handler attributes: %s", cached)
@@ -486,19 +684,71 @@ class ClusterHandler(LogMixin, EventBase):
         self.debug("finished cluster handler initialization")
         self._status = ClusterHandlerStatus.INITIALIZED
 
+    def initialize_from_cache(self) -> None:
+        """Initialize cluster handler from the zigpy attribute cache.
+
+        Nothing is sent to the device, so this is done without awaiting any reads.
+        """
+        self.debug("initializing cluster handler from cache")
+        self.initialize_cluster_handler_specific_from_cache()
+        self._status = ClusterHandlerStatus.INITIALIZED
+
+    def initialize_cluster_handler_specific_from_cache(self) -> None:
+        """Initialize cluster handler specific state from the attribute cache."""
+
     def cluster_command(self, tsn, command_id, args) -> None:
         """Handle commands received to this cluster."""
 
+    def general_command(self, hdr: ZCLHeader, args: Any) -> None:
+        """Handle general commands received from this cluster."""
+        # Read responses also update attributes, only reports are tracked
+        if hdr.command_id != GeneralCommand.Report_Attributes:
+            return
+        if not isinstance(self._last_reports, dict):
+            self._last_reports = {}
+        now = self._endpoint.device.gateway.loop.time()
+        for report in args.attribute_reports:
+            self._last_reports[report.attrid] = now
+
+    def attributes_to_poll(self, attributes: list[str]) -> list[str]:
+        """Return the attributes of a poll that were not reported recently."""
+        if not self._last_reports:
+            return attributes
+        reported_since = (
+            self._endpoint.device.gateway.loop.time() - self.POLL_REPORT_WINDOW
+        )
+        attributes_by_name = self.cluster.attributes_by_name
+        stale = [
+            attr
+            for attr in attributes
+            if (attr_def := attributes_by_name.get(attr)) is None
+            or self._last_reports.get(attr_def.id, -math.inf) < reported_since
+        ]
+        if skipped := len(attributes) - len(stale):
+            self.attribute_polls_avoided += skipped
+            if not stale:
+                self.polls_avoided += 1
+        return stale
+
     def attribute_updated(self, attrid: int, value: Any, _: Any) -> None:
         """Handle attribute updates on this cluster."""
+        self.attribute_updates += 1
         attr_name = self._get_attribute_name(attrid)
-        self.debug(
-            "cluster_handler[%s] attribute_updated - cluster[%s] attr[%s] value[%s]",
-            self.name,
-            self.cluster.name,
-            attr_name,
-            value,
-        )
+        if TRACER.enabled:
+            TRACER.record(
+                TraceKind.ATTRIBUTE_UPDATED,
+                self._endpoint.device.nwk,
+                self._cluster.cluster_id,
+                (attr_name, value),
+            )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            self.debug(
+                "cluster_handler[%s] attribute_updated - cluster[%s] attr[%s] value[%s]",
+                self.name,
+                self.cluster.name,
+                attr_name,
+                value,
+            )
         self.emit(
             CLUSTER_HANDLER_ATTRIBUTE_UPDATED,
             ClusterAttributeUpdatedEvent(
@@ -557,6 +807,14 @@ class ClusterHandler(LogMixin, EventBase):
         manufacturer_code = self._endpoint.device.manufacturer_code
         if self.cluster.cluster_id >= 0xFC00 and manufacturer_code:
             manufacturer = manufacturer_code
+        if not from_cache:
+            try:
+                result, _ = await self._coalesced_read(
+                    [attribute], allow_cache=False, manufacturer=manufacturer
+                )
+            except Exception:  # pylint: disable=broad-except
+                return None
+            return result.get(attribute)
         result = await safe_read(
             self._cluster,
             [attribute],
@@ -578,6 +836,17 @@ class ClusterHandler(LogMixin, EventBase):
         manufacturer_code = self._endpoint.device.manufacturer_code
         if self.cluster.cluster_id >= 0xFC00 and manufacturer_code:
             manufacturer = manufacturer_code
+        if not only_cache:
+            result, errors = await self._coalesced_read(
+                attributes,
+                allow_cache=from_cache,
+                manufacturer=manufacturer,
+                raise_exceptions=raise_exceptions,
+            )
+            if errors and raise_exceptions:
+                raise next(iter(errors.values()))
+            return result
+
         chunk = attributes[:CLUSTER_READS_PER_REQ]
         rest = attributes[CLUSTER_READS_PER_REQ:]
         result = {}
@@ -604,6 +873,117 @@ class ClusterHandler(LogMixin, EventBase):
             rest = rest[CLUSTER_READS_PER_REQ:]
         return result
 
+    async def _coalesced_read(
+        self,
+        attributes: list[int | str],
+        *,
+        allow_cache: bool,
+        manufacturer: int | None,
+        raise_exceptions: bool = False,
+    ) -> tuple[dict[int | str, Any], dict[int | str, Exception]]:
+        """Read attributes from the device, merged with concurrent reads.
+
+        Reads with the same options issued in the same loop iteration, or within
+        `CLUSTER_READ_COALESCE_WINDOW` while another read is being sent, are sent
+        together, chunked by `CLUSTER_READS_PER_REQ`. Returns the values and the
+        read errors for the requested attributes. Reads that raise errors are only
+        merged with each other: no chunks are sent after a failed one and their
+        attributes fail with it.
+        """
+        key = (allow_cache, manufacturer, raise_exceptions)
+        if (pending := self._pending_reads.get(key)) is None:
+            pending = _PendingRead(asyncio.get_running_loop().create_future())
+            if not isinstance(self._pending_reads, dict):
+                self._pending_reads = {}
+            self._pending_reads[key] = pending
+            self._endpoint.device.gateway.async_create_background_task(
+                self._send_coalesced_read(key, pending),
+                name=f"coalesced_read_{self.unique_id}",
+            )
+        pending.attributes.update(dict.fromkeys(attributes))
+        pending.priority = min(pending.priority, REQUEST_PRIORITY.get())
+
+        values, errors = await asyncio.shield(pending.future)
+        return (
+            {attr: values[attr] for attr in attributes if attr in values},
+            {attr: errors[attr] for attr in attributes if attr in errors},
+        )
+
+    async def _send_coalesced_read(
+        self, key: _PendingReadKey, pending: _PendingRead
+    ) -> None:
+        """Send a pending coalesced read once its window has passed."""
+        allow_cache, manufacturer, stop_on_error = key
+        try:
+            # Only wait for more reads while the device is busy with another one
+            await asyncio.sleep(
+                CLUSTER_READ_COALESCE_WINDOW if self._reads_in_flight else 0
+            )
+            self._discard_pending_read(key)
+            self._reads_in_flight += 1
+            try:
+                values, errors = await self._read_chunks(
+                    list(pending.attributes),
+                    allow_cache=allow_cache,
+                    manufacturer=manufacturer,
+                    priority=pending.priority,
+                    stop_on_error=stop_on_error,
+                )
+            finally:
+                self._reads_in_flight -= 1
+        except asyncio.CancelledError:
+            self._discard_pending_read(key)
+            pending.future.cancel()
+            raise
+        except Exception as ex:  # pylint: disable=broad-except
+            self._discard_pending_read(key)
+            pending.future.set_exception(ex)
+        else:
+            pending.future.set_result((values, errors))
+
+    def _discard_pending_read(self, key: _PendingReadKey) -> None:
+        """Stop merging new reads into a pending read."""
+        if isinstance(self._pending_reads, dict):
+            self._pending_reads.pop(key, None)
+
+    async def _read_chunks(
+        self,
+        attributes: list[int | str],
+        *,
+        allow_cache: bool,
+        manufacturer: int | None,
+        priority: RequestPriority,
+        stop_on_error: bool,
+    ) -> tuple[dict[int | str, Any], dict[int | str, Exception]]:
+        """Read the attributes of a coalesced read in chunks."""
+        read_attributes = self._scheduled_request(self.cluster.read_attributes)
+        values: dict[int | str, Any] = {}
+        errors: dict[int | str, Exception] = {}
+        with request_priority(priority):
+            for i in range(0, len(attributes), CLUSTER_READS_PER_REQ):
+                chunk = attributes[i : i + CLUSTER_READS_PER_REQ]
+                try:
+                    self.debug("Reading attributes in chunks: %s", chunk)
+                    read, _ = await read_attributes(
+                        chunk,
+                        allow_cache=allow_cache,
+                        only_cache=False,
+                        manufacturer=manufacturer,
+                    )
+                    values.update(read)
+                except (TimeoutError, zigpy.exceptions.ZigbeeException) as ex:
+                    self.debug(
+                        "failed to get attributes '%s' on '%s' cluster: %s",
+                        chunk,
+                        self.cluster.ep_attribute,
+                        str(ex),
+                    )
+                    if stop_on_error:
+                        errors.update(dict.fromkeys(attributes[i:], ex))
+                        break
+                    errors.update(dict.fromkeys(chunk, ex))
+        return values, errors
+
     get_attributes = functools.partialmethod(_get_attributes, False)
 
     async def write_attributes_safe(
@@ -625,23 +1005,54 @@ class ClusterHandler(LogMixin, EventBase):
                     f"Failed to write attribute {name}={value}: {record.status}",
                 )
 
+    def _scheduled_request(
+        self, func: Callable[_P, Awaitable[Any]]
+    ) -> _ReturnFuncType[_P]:
+        """Wrap a radio request to wait for a slot from the request scheduler."""
+
+        @functools.wraps(func)
+        async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> Any:
+            async with self._endpoint.device.gateway.request_scheduler.slot():
+                return await func(*args, **kwargs)
+
+        return wrapper
+
     def log(self, level, msg, *args, **kwargs) -> None:
         """Log a message."""
+        if TRACER.enabled:
+            TRACER.record(
+                TraceKind.LOG,
+                self._endpoint.device.nwk,
+                self._cluster.cluster_id,
+                (msg, args),
+            )
+        if not _LOGGER.isEnabledFor(level):
+            return
         msg = f"[%s:%s]: {msg}"
         args = (self._endpoint.device.nwk, self._id) + args
         _LOGGER.log(level, msg, *args, stacklevel=3, **kwargs)
 
     def __getattr__(self, name):
         """Get attribute or a decorated cluster command."""
+        # Decorated commands are reused until the cluster attribute is replaced
+        source = _cluster_command_source(self._cluster, name)
+        if (cached := self._proxied_commands.get(name)) is not None and (
+            cached[0] is source
+        ):
+            return cached[1]
+
         if (
             hasattr(self._cluster, name)
             and callable(getattr(self._cluster, name))
             and name not in UNPROXIED_CLUSTER_METHODS
         ):
             command = getattr(self._cluster, name)
-            wrapped_command = retry_request(command)
+            wrapped_command = retry_request(self._scheduled_request(command))
             wrapped_command.__name__ = name
 
+            if not isinstance(self._proxied_commands, dict):
+                self._proxied_commands = {}
+            self._proxied_commands[name] = (source, wrapped_command)
             return wrapped_command
         return self.__getattribute__(name)
 
@@ -683,6 +1094,10 @@ class ZDOClusterHandler(LogMixin):
         """Initialize cluster handler."""
         self._status = ClusterHandlerStatus.INITIALIZED
 
+    def initialize_from_cache(self) -> None:
+        """Initialize cluster handler from the zigpy attribute cache."""
+        self._status = ClusterHandlerStatus.INITIALIZED
+
     async def async_configure(self):
         """Configure cluster handler."""
         self._status = ClusterHandlerStatus.CONFIGURED
@@ -37,6 +37,8 @@ REPORT_CONFIG_OP: tuple[int, int, int] = (
     REPORT_CONFIG_RPT_CHANGE,
 )
 CLUSTER_READS_PER_REQ: Final[int] = 5
+# Seconds to collect concurrent attribute reads to the same cluster for
+CLUSTER_READ_COALESCE_WINDOW: Final[float] = 0.01
 
 CLUSTER_HANDLER_ACCELEROMETER: Final[str] = "accelerometer"
 CLUSTER_HANDLER_BINARY_INPUT: Final[str] = "binary_input"
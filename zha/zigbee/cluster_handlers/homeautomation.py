@@ -118,11 +118,15 @@ class ElectricalMeasurementClusterHandler(ClusterHandler):
         self.debug("async_update")
 
         # This is a polling cluster handler. Don't allow cache.
-        attrs = [
-            a["attr"]
-            for a in self.REPORT_CONFIG
-            if a["attr"] not in self.cluster.unsupported_attributes
-        ]
+        attrs = self.attributes_to_poll(
+            [
+                a["attr"]
+                for a in self.REPORT_CONFIG
+                if a["attr"] not in self.cluster.unsupported_attributes
+            ]
+        )
+        if not attrs:
+            return
         result = await self.get_attributes(attrs, from_cache=False, only_cache=False)
         if result:
             for attr, value in result.items():
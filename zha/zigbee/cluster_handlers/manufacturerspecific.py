@@ -204,6 +204,10 @@ class OppleRemoteClusterHandler(ClusterHandler):
 
     async def async_initialize_cluster_handler_specific(self, from_cache: bool) -> None:  # pylint: disable=unused-argument
         """Initialize cluster handler specific."""
+        self.initialize_cluster_handler_specific_from_cache()
+
+    def initialize_cluster_handler_specific_from_cache(self) -> None:
+        """Load the detection interval from the attribute cache."""
         if self.cluster.endpoint.model in ("lumi.motion.ac02", "lumi.motion.agl04"):
             interval = self.cluster.get("detection_interval", self.cluster.get(0x0102))
             if interval is not None:
@@ -300,7 +300,10 @@ class MeteringClusterHandler(ClusterHandler):
 
     async def async_initialize_cluster_handler_specific(self, from_cache: bool) -> None:  # pylint: disable=unused-argument
         """Fetch config from device and updates format specifier."""
+        self.initialize_cluster_handler_specific_from_cache()
 
+    def initialize_cluster_handler_specific_from_cache(self) -> None:
+        """Update format specifiers from the attribute cache."""
         fmting = self.cluster.get(
             Metering.AttributeDefs.demand_formatting.name, 0xF9
         )  # 1 digit to the right, 15 digits to the left
@@ -315,11 +318,15 @@ class MeteringClusterHandler(ClusterHandler):
         """Retrieve latest state."""
         self.debug("async_update")
 
-        attrs = [
-            a["attr"]
-            for a in self.REPORT_CONFIG
-            if a["attr"] not in self.cluster.unsupported_attributes
-        ]
+        attrs = self.attributes_to_poll(
+            [
+                a["attr"]
+                for a in self.REPORT_CONFIG
+                if a["attr"] not in self.cluster.unsupported_attributes
+            ]
+        )
+        if not attrs:
+            return
         result = await self.get_attributes(attrs, from_cache=False, only_cache=False)
         if result:
             for attr, value in result.items():
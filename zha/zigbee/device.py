@@ -5,12 +5,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from enum import Enum
 from functools import cached_property
 import logging
 import time
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Final, Self
 
 from zigpy.device import Device as ZigpyDevice
@@ -61,11 +62,22 @@ from zha.application.const import (
     ZHA_EVENT,
 )
 from zha.application.helpers import convert_to_zcl_values, convert_zcl_value
-from zha.application.platforms import BaseEntityInfo, PlatformEntity
+from zha.application.platforms import (
+    BaseEntity,
+    BaseEntityInfo,
+    DeferredEntity,
+    PlatformEntity,
+)
 from zha.event import EventBase
 from zha.exceptions import ZHAException
 from zha.mixins import LogMixin
-from zha.zigbee.cluster_handlers import ClusterHandler, ZDOClusterHandler
+from zha.request_scheduler import RequestPriority, request_priority
+from zha.trace import TRACER, TraceKind
+from zha.zigbee.cluster_handlers import (
+    ClusterHandler,
+    ConfigurationStep,
+    ZDOClusterHandler,
+)
 from zha.zigbee.endpoint import Endpoint
 
 if TYPE_CHECKING:
@@ -73,6 +85,14 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 _CHECKIN_GRACE_PERIODS = 2
+# Checkins a ping can be deferred for by the liveness ping budget before they
+# count as one missed checkin
+_MAX_PING_DEFERRALS = 3
+_NO_DEFERRED_ENTITIES: Final[Mapping[tuple[Platform, str], DeferredEntity]] = (
+    MappingProxyType({})
+)
+# Configuration steps of the quirk of a device are attributed to this cluster name
+QUIRK_CONFIGURATION: Final = "quirk"
 
 
 def get_device_automation_triggers(
@@ -195,6 +215,12 @@ class Device(LogMixin, EventBase):
 
     unique_id: str
 
+    # Allocated when the first entity creation is deferred
+    _deferred_entities: (
+        dict[tuple[Platform, str], DeferredEntity]
+        | Mapping[tuple[Platform, str], DeferredEntity]
+    ) = _NO_DEFERRED_ENTITIES
+
     def __init__(
         self,
         zigpy_device: zigpy.device.Device,
@@ -232,6 +258,7 @@ class Device(LogMixin, EventBase):
             and time.time() - self.last_seen < self.consider_unavailable_time
         )
         self._checkins_missed_count: int = 0
+        self._ping_deferrals: int = 0
         self._on_network: bool = True
 
         self._platform_entities: dict[tuple[Platform, str], PlatformEntity] = {}
@@ -533,13 +560,42 @@ class Device(LogMixin, EventBase):
         """Return the platform entities for this device."""
         return self._platform_entities
 
+    @property
+    def deferred_entities(self) -> Mapping[tuple[Platform, str], DeferredEntity]:
+        """Return the entities disabled by default that were not created yet."""
+        return self._deferred_entities
+
     def get_platform_entity(self, platform: Platform, unique_id: str) -> PlatformEntity:
-        """Get a platform entity by unique id."""
-        entity = self._platform_entities.get((platform, unique_id))
-        if entity is None:
+        """Get a platform entity by unique id, creating it if it was deferred."""
+        key = (platform, unique_id)
+        if key in self._deferred_entities:
+            self.create_deferred_entity(platform, unique_id)
+        # Deferred entities that turn out to be unsupported are not created
+        if (entity := self._platform_entities.get(key)) is None:
             raise KeyError(f"Entity {unique_id} not found")
         return entity
 
+    def defer_entity(self, deferred: DeferredEntity) -> None:
+        """Register an entity whose creation is deferred until it is used."""
+        key = (deferred.platform, deferred.unique_id)
+        if key in self._platform_entities or key in self._deferred_entities:
+            return
+        if not isinstance(self._deferred_entities, dict):
+            self._deferred_entities = {}
+        self._deferred_entities[key] = deferred
+
+    def create_deferred_entity(
+        self, platform: Platform, unique_id: str
+    ) -> BaseEntity | None:
+        """Create an entity whose creation was deferred, if it is supported."""
+        key = (platform, unique_id)
+        deferred = self._deferred_entities[key]
+        # Only the allocated dict holds descriptors
+        assert isinstance(self._deferred_entities, dict)
+        del self._deferred_entities[key]
+        self.debug("creating deferred entity: %s", unique_id)
+        return deferred.entity_class._create_deferred(deferred)  # pylint: disable=protected-access
+
     @classmethod
     def new(
         cls,
@@ -559,6 +615,13 @@ class Device(LogMixin, EventBase):
         # don't flip the availability state of the coordinator
         if self.is_active_coordinator:
             return
+        if TRACER.enabled:
+            TRACER.record(
+                TraceKind.AVAILABILITY_CHECK,
+                self.nwk,
+                None,
+                None if self.last_seen is None else time.time() - self.last_seen,
+            )
         if self.last_seen is None:
             self.debug("last_seen is None, marking the device unavailable")
             self.update_available(False)
@@ -571,6 +634,18 @@ class Device(LogMixin, EventBase):
             )
             self.update_available(True)
             self._checkins_missed_count = 0
+            self._ping_deferrals = 0
+            return
+
+        liveness = self._gateway.liveness
+        if liveness.enabled and liveness.infer_alive(self):
+            self.debug(
+                "Device inferred alive from the network - marking the device available"
+                " and resetting counter"
+            )
+            self.update_available(True)
+            self._checkins_missed_count = 0
+            self._ping_deferrals = 0
             return
 
         if self._gateway.config.allow_polling:
@@ -589,20 +664,38 @@ class Device(LogMixin, EventBase):
                 self.update_available(False)
                 return
 
-            self._checkins_missed_count += 1
-            self.debug(
-                "Attempting to checkin with device - missed checkins: %s",
-                self._checkins_missed_count,
-            )
             if not self.basic_ch:
                 self.debug("does not have a mandatory basic cluster")
                 self.update_available(False)
                 return
-            res = await self.basic_ch.get_attribute_value(
-                ATTR_MANUFACTURER, from_cache=False
+            if liveness.enabled and not liveness.acquire_ping():
+                self._ping_deferrals += 1
+                if self._ping_deferrals < _MAX_PING_DEFERRALS:
+                    self.debug("Ping budget exhausted, deferring the checkin")
+                    return
+                # A device that is really gone must not stay available for as
+                # long as the budget is exhausted
+                self._ping_deferrals = 0
+                self._checkins_missed_count += 1
+                self.debug(
+                    "Ping budget exhausted for %s checkins - missed checkins: %s",
+                    _MAX_PING_DEFERRALS,
+                    self._checkins_missed_count,
+                )
+                return
+
+            self._checkins_missed_count += 1
+            self.debug(
+                "Attempting to checkin with device - missed checkins: %s",
+                self._checkins_missed_count,
             )
+            with request_priority(RequestPriority.DIAGNOSTICS):
+                res = await self.basic_ch.get_attribute_value(
+                    ATTR_MANUFACTURER, from_cache=False
+                )
             if res is not None:
                 self._checkins_missed_count = 0
+                self._ping_deferrals = 0
 
     def update_available(self, available: bool) -> None:
         """Update device availability and signal entities."""
@@ -740,6 +833,11 @@ class Device(LogMixin, EventBase):
 
     async def async_configure(self) -> None:
         """Configure the device."""
+        with request_priority(RequestPriority.CONFIGURATION):
+            await self._async_configure()
+
+    async def _async_configure(self) -> None:
+        """Configure the device cluster handlers."""
         should_identify = (
             self.gateway.config.config.device_options.enable_identify_on_join
         )
@@ -775,6 +873,61 @@ class Device(LogMixin, EventBase):
                 effect_variant=Identify.EffectVariant.Default,
             )
 
+    def configuration_steps(self) -> list[tuple[str, ConfigurationStep]]:
+        """Return the steps of `async_configure` and the cluster they configure.
+
+        Steps are run one by one by bulk configuration, which calls
+        `configuration_finished` afterwards instead of identifying the device.
+        """
+        steps = [
+            (
+                self._zdo_handler.name,
+                ConfigurationStep(
+                    name="configure", run=self._zdo_handler.async_configure, requests=0
+                ),
+            )
+        ]
+        if isinstance(self._zigpy_device, zigpy.quirks.BaseCustomDevice):
+            steps.append(
+                (
+                    QUIRK_CONFIGURATION,
+                    ConfigurationStep(
+                        name="configure",
+                        run=self._zigpy_device.apply_custom_configuration,
+                    ),
+                )
+            )
+        steps.extend(
+            (cluster_handler.cluster.name, step)
+            for cluster_handler in self._configured_cluster_handlers()
+            for step in cluster_handler.configuration_steps()
+        )
+        return steps
+
+    def configuration_finished(self) -> None:
+        """Mark the device configured after running its configuration steps."""
+        for cluster_handler in self._configured_cluster_handlers():
+            cluster_handler.configuration_finished()
+        self.emit(
+            ZHA_CLUSTER_HANDLER_CFG_DONE,
+            ClusterHandlerConfigurationComplete(
+                device_ieee=self.ieee,
+                unique_id=self.ieee,
+            ),
+        )
+        self.debug("completed configuration")
+
+    def _configured_cluster_handlers(self) -> list[ClusterHandler]:
+        """Return the cluster handlers configured by `async_configure`."""
+        return [
+            cluster_handler
+            for endpoint in self._endpoints.values()
+            for cluster_handler in (
+                *endpoint.claimed_cluster_handlers.values(),
+                *endpoint.client_cluster_handlers.values(),
+            )
+        ]
+
     async def async_initialize(self, from_cache: bool = False) -> None:
         """Initialize cluster handlers."""
         self.debug("started initialization")
@@ -795,10 +948,24 @@ class Device(LogMixin, EventBase):
         self.status = DeviceStatus.INITIALIZED
         self.debug("completed initialization")
 
+    def initialize_from_cache(self) -> None:
+        """Initialize cluster handlers from the zigpy attribute cache.
+
+        Unlike `async_initialize(from_cache=True)`, this does not create any tasks
+        or wait for request slots, since nothing is sent to the device.
+        """
+        self._zdo_handler.initialize_from_cache()
+        for endpoint in self._endpoints.values():
+            endpoint.initialize_from_cache()
+
+        self.status = DeviceStatus.INITIALIZED
+        self.debug("completed initialization from cache")
+
     async def on_remove(self) -> None:
         """Cancel tasks this device owns."""
         for platform_entity in self._platform_entities.values():
             await platform_entity.on_remove()
+        self._deferred_entities = _NO_DEFERRED_ENTITIES
 
     def async_get_clusters(self) -> dict[int, dict[str, dict[int, Cluster]]]:
         """Get all clusters for this device."""
@@ -934,12 +1101,14 @@ class Device(LogMixin, EventBase):
                 args,
                 [field.name for field in commands[command].schema.fields],
             )
-            response = await getattr(cluster, commands[command].name)(*args)
+            async with self.gateway.request_scheduler.slot(RequestPriority.INTERACTIVE):
+                response = await getattr(cluster, commands[command].name)(*args)
         else:
             assert params is not None
-            response = await getattr(cluster, commands[command].name)(
-                **convert_to_zcl_values(params, commands[command].schema)
-            )
+            async with self.gateway.request_scheduler.slot(RequestPriority.INTERACTIVE):
+                response = await getattr(cluster, commands[command].name)(
+                    **convert_to_zcl_values(params, commands[command].schema)
+                )
         self.debug(
             "Issued cluster command: %s %s %s %s %s %s %s %s",
             f"{ATTR_CLUSTER_ID}: [{cluster_id}]",
@@ -1096,6 +1265,10 @@ class Device(LogMixin, EventBase):
 
     def log(self, level: int, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log a message."""
+        if TRACER.enabled:
+            TRACER.record(TraceKind.LOG, self.nwk, None, (msg, args))
+        if not _LOGGER.isEnabledFor(level):
+            return
         msg = f"[%s](%s): {msg}"
         args = (self.nwk, self.model) + args
         _LOGGER.log(level, msg, *args, **kwargs)
@@ -39,6 +39,16 @@ CALLABLE_T = TypeVar("CALLABLE_T", bound=Callable)
 class Endpoint:
     """Endpoint for a zha device."""
 
+    __slots__ = (
+        "_all_cluster_handlers",
+        "_claimed_cluster_handlers",
+        "_client_cluster_handlers",
+        "_device",
+        "_id",
+        "_unique_id",
+        "_zigpy_endpoint",
+    )
+
     def __init__(self, zigpy_endpoint: ZigpyEndpoint, device: Device) -> None:
         """Initialize instance."""
         assert zigpy_endpoint is not None
@@ -48,9 +58,10 @@ class Endpoint:
         self._all_cluster_handlers: dict[str, ClusterHandler] = {}
         self._claimed_cluster_handlers: dict[str, ClusterHandler] = {}
         self._client_cluster_handlers: dict[str, ClientClusterHandler] = {}
+        self._id: int = zigpy_endpoint.endpoint_id
         self._unique_id: str = f"{device.unique_id}-{zigpy_endpoint.endpoint_id}"
 
-    @functools.cached_property
+    @property
     def device(self) -> Device:
         """Return the device this endpoint belongs to."""
         return self._device
@@ -70,17 +81,17 @@ class Endpoint:
         """Return a dict of client cluster handlers."""
         return self._client_cluster_handlers
 
-    @functools.cached_property
+    @property
     def zigpy_endpoint(self) -> ZigpyEndpoint:
         """Return endpoint of zigpy device."""
         return self._zigpy_endpoint
 
-    @functools.cached_property
+    @property
     def id(self) -> int:
         """Return endpoint id."""
-        return self._zigpy_endpoint.endpoint_id
+        return self._id
 
-    @functools.cached_property
+    @property
     def unique_id(self) -> str:
         """Return the unique id for this endpoint."""
         return self._unique_id
@@ -180,6 +191,19 @@ class Endpoint:
             "async_initialize", from_cache, max_concurrency=1
         )
 
+    def initialize_from_cache(self) -> None:
+        """Initialize claimed cluster handlers from the zigpy attribute cache."""
+        for cluster_handler in (
+            *self.claimed_cluster_handlers.values(),
+            *self.client_cluster_handlers.values(),
+        ):
+            try:
+                cluster_handler.initialize_from_cache()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                cluster_handler.debug(
+                    "'initialize_from_cache' stage failed: %s", str(exc), exc_info=exc
+                )
+
     async def async_configure(self) -> None:
         """Configure claimed cluster handlers."""
         await self._execute_handler_tasks("async_configure")
@@ -211,6 +211,17 @@ class Group(LogMixin):
             },
         )
 
+    @cached_property
+    def member_entities(self) -> dict[str, list[PlatformEntity]]:
+        """Return the platform entities of the members of this group by platform."""
+        member_entities: dict[str, list[PlatformEntity]] = {}
+        for member in self.members:
+            if member.device.is_coordinator:
+                continue
+            for entity in member.associated_entities:
+                member_entities.setdefault(entity.PLATFORM, []).append(entity)
+        return member_entities
+
     @cached_property
     def all_member_entity_unique_ids(self) -> list[str]:
         """Return all platform entities unique ids for the members of this group."""
@@ -253,6 +264,8 @@ class Group(LogMixin):
             delattr(self, "info_object")
         if hasattr(self, "members"):
             delattr(self, "members")
+        if hasattr(self, "member_entities"):
+            delattr(self, "member_entities")
 
     def update_entity_subscriptions(self) -> None:
         """Update the entity event subscriptions.
@@ -328,16 +341,11 @@ class Group(LogMixin):
         self.update_entity_subscriptions()
 
     def get_platform_entities(self, platform: str) -> list[PlatformEntity]:
-        """Return entities belonging to the specified platform for this group."""
-        platform_entities: list[PlatformEntity] = []
-        for member in self.members:
-            if member.device.is_coordinator:
-                continue
-            for entity in member.associated_entities:
-                if platform == entity.PLATFORM:
-                    platform_entities.append(entity)
+        """Return entities belonging to the specified platform for this group.
 
-        return platform_entities
+        The returned list is shared and must not be modified.
+        """
+        return self.member_entities.get(platform, [])
 
     def log(self, level: int, msg: str, *args: Any, **kwargs) -> None:
         """Log a message."""